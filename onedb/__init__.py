@@ -4,6 +4,7 @@ __license__ = "MIT"
 
 # Core imports
 from .core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+from .core.row import Row
 from .core.query_builder import Query, QueryBuilder
 from .core.manager import Database, DatabaseManager
 
@@ -37,12 +38,15 @@ def __getattr__(name: str):
         'Redis': '.adapters.redis_db',
         'DB2': '.adapters.db2',
         'Elasticsearch': '.adapters.elasticsearch_db',
+        'AsyncElasticsearch': '.adapters.elasticsearch_db',
         'Cassandra': '.adapters.cassandra_db',
         'MariaDB': '.adapters.mariadb',
         'DynamoDB': '.adapters.dynamodb',
+        'AsyncDynamoDB': '.adapters.dynamodb',
         'Snowflake': '.adapters.snowflake_db',
         'BigQuery': '.adapters.bigquery',
         'Neo4j': '.adapters.neo4j_db',
+        'AsyncNeo4j': '.adapters.neo4j_db',
     }
     
     if name in adapters:
@@ -68,6 +72,7 @@ __all__ = [
     "BaseAdapter",
     "ConnectionConfig",
     "QueryResult",
+    "Row",
     "DatabaseType",
     "Query",
     "QueryBuilder",
@@ -90,10 +95,13 @@ __all__ = [
     "Redis",
     "DB2",
     "Elasticsearch",
+    "AsyncElasticsearch",
     "Cassandra",
     "MariaDB",
     "DynamoDB",
+    "AsyncDynamoDB",
     "Snowflake",
     "BigQuery",
     "Neo4j",
+    "AsyncNeo4j",
 ]
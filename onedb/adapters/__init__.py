@@ -13,38 +13,48 @@ __all__ = [
     "Redis",
     "DB2",
     "Elasticsearch",
+    "AsyncElasticsearch",
     "Cassandra",
     "MariaDB",
     "DynamoDB",
+    "AsyncDynamoDB",
     "Snowflake",
     "BigQuery",
     "Neo4j",
+    "AsyncNeo4j",
 ]
 
 
+_ADAPTER_MODULES = {
+    "Oracle": ".oracle",
+    "MySQL": ".mysql",
+    "MSSQL": ".mssql",
+    "PostgreSQL": ".postgresql",
+    "MongoDB": ".mongodb",
+    "SQLite": ".sqlite",
+    "Redis": ".redis_db",
+    "DB2": ".db2",
+    "Elasticsearch": ".elasticsearch_db",
+    "AsyncElasticsearch": ".elasticsearch_db",
+    "Cassandra": ".cassandra_db",
+    "MariaDB": ".mariadb",
+    "DynamoDB": ".dynamodb",
+    "AsyncDynamoDB": ".dynamodb",
+    "Snowflake": ".snowflake_db",
+    "BigQuery": ".bigquery",
+    "Neo4j": ".neo4j_db",
+    "AsyncNeo4j": ".neo4j_db",
+}
+
+
 def __getattr__(name: str):
     """Lazy load adapters on demand."""
-    adapters = {
-        "Oracle": ".oracle",
-        "MySQL": ".mysql",
-        "MSSQL": ".mssql",
-        "PostgreSQL": ".postgresql",
-        "MongoDB": ".mongodb",
-        "SQLite": ".sqlite",
-        "Redis": ".redis_db",
-        "DB2": ".db2",
-        "Elasticsearch": ".elasticsearch_db",
-        "Cassandra": ".cassandra_db",
-        "MariaDB": ".mariadb",
-        "DynamoDB": ".dynamodb",
-        "Snowflake": ".snowflake_db",
-        "BigQuery": ".bigquery",
-        "Neo4j": ".neo4j_db",
-    }
-    
-    if name in adapters:
+    if name in _ADAPTER_MODULES:
         import importlib
-        module = importlib.import_module(adapters[name], package="onedb.adapters")
-        return getattr(module, name)
+        module = importlib.import_module(_ADAPTER_MODULES[name], package="onedb.adapters")
+        adapter = getattr(module, name)
+        # Cache on the package so later lookups skip __getattr__ entirely
+        globals()[name] = adapter
+        return adapter
     
     raise AttributeError(f"module 'onedb.adapters' has no attribute '{name}'")
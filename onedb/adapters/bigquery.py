@@ -131,6 +131,7 @@ class BigQuery(BaseAdapter):
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Insert using streaming."""
+        self._invalidate_tables(table)
         start_time = time.time()
         
         full_table = self._get_full_table_name(table)
@@ -147,6 +148,7 @@ class BigQuery(BaseAdapter):
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
         """Batch insert using streaming."""
+        self._invalidate_tables(table)
         start_time = time.time()
         
         full_table = self._get_full_table_name(table)
@@ -162,6 +164,7 @@ class BigQuery(BaseAdapter):
         return result
     
     def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         full_table = self._get_full_table_name(table)
         
         set_parts = [f"{k} = @{k}" for k in data.keys()]
@@ -178,6 +181,7 @@ class BigQuery(BaseAdapter):
         return self.execute(query, params)
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         full_table = self._get_full_table_name(table)
         query = f"DELETE FROM `{full_table}`"
         
@@ -217,7 +221,7 @@ class BigQuery(BaseAdapter):
         if offset:
             query += f" OFFSET {offset}"
         
-        return self.execute(query, params if params else None)
+        return self._cached_execute(query, params if params else None)
     
     def begin_transaction(self) -> None:
         pass  # BigQuery transactions are per-query
@@ -3,12 +3,27 @@ Apache Cassandra Adapter.
 """
 
 from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+import re
 import time
 
 from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
 from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
 
 
+_FORMAT_PARAM_RE = re.compile(r"%%|%\((\w+)\)s|%s")
+
+
+@lru_cache(maxsize=512)
+def _prepared_cql(query: str) -> str:
+    """``query`` with ``%s``/``%(name)s`` markers rewritten to ``?``/``:name``."""
+    def marker(match: "re.Match") -> str:
+        if match.group(0) == "%%":
+            return "%"
+        return f":{match.group(1)}" if match.group(1) else "?"
+    return _FORMAT_PARAM_RE.sub(marker, query)
+
+
 class Cassandra(BaseAdapter):
     """
     Apache Cassandra adapter.
@@ -64,6 +79,7 @@ class Cassandra(BaseAdapter):
             )
     
     def disconnect(self) -> None:
+        self._stmt_cache.clear()
         if self._session:
             self._session.shutdown()
             self._session = None
@@ -90,7 +106,9 @@ class Cassandra(BaseAdapter):
         
         try:
             if params:
-                rows = self._session.execute(query, params)
+                # Prepared once per session: later calls skip the server parse
+                prepared = self._cached_prepare(_prepared_cql(query), self._session.prepare)
+                rows = self._session.execute(prepared, params)
             else:
                 rows = self._session.execute(query)
             
@@ -113,7 +131,7 @@ class Cassandra(BaseAdapter):
         from cassandra.query import BatchStatement
         batch = BatchStatement()
         
-        prepared = self._session.prepare(query)
+        prepared = self._cached_prepare(_prepared_cql(query), self._session.prepare)
         for params in params_list:
             batch.add(prepared, params)
         
@@ -124,6 +142,7 @@ class Cassandra(BaseAdapter):
         return result
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
+        self._invalidate_tables(table)
         columns = list(data.keys())
         placeholders = ", ".join(["%s" for _ in columns])
         columns_str = ", ".join(columns)
@@ -132,6 +151,7 @@ class Cassandra(BaseAdapter):
         return self.execute(query, tuple(data.values()))
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
+        self._invalidate_tables(table)
         if not data:
             return QueryResult()
         
@@ -144,6 +164,7 @@ class Cassandra(BaseAdapter):
         return self.execute_many(query, params_list)
     
     def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         set_parts = [f"{k} = %s" for k in data.keys()]
         values = list(data.values())
         
@@ -157,6 +178,7 @@ class Cassandra(BaseAdapter):
         return self.execute(query, tuple(values))
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         query = f"DELETE FROM {table}"
         values = []
         
@@ -191,7 +213,7 @@ class Cassandra(BaseAdapter):
         if limit:
             query += f" LIMIT {limit}"
         
-        return self.execute(query, tuple(values) if values else None)
+        return self._cached_execute(query, tuple(values) if values else None)
     
     def begin_transaction(self) -> None:
         pass  # Cassandra uses lightweight transactions
@@ -21,6 +21,9 @@ class DB2(BaseAdapter):
     driver_name = "ibm_db"
     install_command = "pip install onedb[db2]"
     
+    # Multi-row inserts via BaseAdapter.insert_many
+    placeholder = "?"
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         if self.config.port is None:
@@ -124,6 +127,7 @@ class DB2(BaseAdapter):
         return result
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
+        self._invalidate_tables(table)
         columns = list(data.keys())
         placeholders = ", ".join(["?" for _ in columns])
         columns_str = ", ".join(columns)
@@ -131,19 +135,8 @@ class DB2(BaseAdapter):
         query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
         return self.execute(query, tuple(data.values()))
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        if not data:
-            return QueryResult()
-        
-        columns = list(data[0].keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        columns_str = ", ".join(columns)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        params_list = [tuple(row.values()) for row in data]
-        return self.execute_many(query, params_list)
-    
     def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         set_parts = [f"{k} = ?" for k in data.keys()]
         values = list(data.values())
         
@@ -157,6 +150,7 @@ class DB2(BaseAdapter):
         return self.execute(query, tuple(values))
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
         query = f"DELETE FROM {table}"
         values = []
         
@@ -194,7 +188,7 @@ class DB2(BaseAdapter):
         if offset:
             query += f" OFFSET {offset} ROWS"
         
-        return self.execute(query, tuple(values) if values else None)
+        return self._cached_execute(query, tuple(values) if values else None)
     
     def begin_transaction(self) -> None:
         self._in_transaction = True
@@ -2,10 +2,17 @@
 Amazon DynamoDB Adapter.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from contextlib import AsyncExitStack, contextmanager
+import asyncio
 import time
 
-from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+from ..core.base import (
+    BaseAdapter, AsyncBaseAdapter, ConnectionConfig,
+    QueryResult, DatabaseType
+)
 from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
 
 
@@ -21,11 +28,36 @@ class DynamoDB(BaseAdapter):
     driver_name = "boto3"
     install_command = "pip install onedb[dynamodb]"
     
+    # BatchWriteItem and BatchExecuteStatement accept at most 25 requests per call
+    _BATCH_SIZE = 25
+    _WRITE_POOL_SIZE = 10
+    _MAX_BATCH_RETRIES = 8
+    _RETRYABLE_STATEMENT_ERRORS = frozenset({
+        "ProvisionedThroughputExceeded",
+        "RequestLimitExceeded",
+        "ThrottlingError",
+        "InternalServerError",
+    })
+    
+    # boto3 TypeSerializer/TypeDeserializer, created once on first connect
+    _serializer: Any = None
+    _deserializer: Any = None
+    
+    # _describe_cache marker for a table whose DescribeTable call was refused
+    _DESCRIBE_FAILED: Dict[str, Any] = {}
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         self._dynamodb = None
         self._client = None
         
+        # Optional DAX client for reads (extra={"dax_endpoint": "daxs://..."})
+        self._dax = None
+        self._dax_error: Any = None
+        
+        # DescribeTable responses (or _DESCRIBE_FAILED), keyed by table name
+        self._describe_cache: Dict[str, Dict[str, Any]] = {}
+        
         # AWS specific config
         self._region = self.config.extra.get("region", "us-east-1")
         self._aws_access_key = self.config.user
@@ -38,24 +70,74 @@ class DynamoDB(BaseAdapter):
         except ImportError:
             raise DriverNotInstalledError("boto3", self.install_command)
     
+    def _import_dax(self):
+        try:
+            from amazondax import AmazonDaxClient
+            from amazondax.DaxError import DaxClientError
+            return AmazonDaxClient, DaxClientError
+        except ImportError:
+            raise DriverNotInstalledError(
+                "amazon-dax-client", "pip install onedb[dynamodb-dax]"
+            )
+    
+    def _session_params(self) -> Dict[str, Any]:
+        """Build AWS session parameters from config."""
+        session_params = {"region_name": self._region}
+        
+        if self._aws_access_key and self._aws_secret_key:
+            session_params["aws_access_key_id"] = self._aws_access_key
+            session_params["aws_secret_access_key"] = self._aws_secret_key
+        
+        return session_params
+    
+    def _botocore_config(self):
+        """
+        Build the botocore client config.
+        
+        Defaults favour fast failure and parallel requests; each value can be
+        overridden through ``config.extra`` (e.g. ``extra={"read_timeout": 30}``).
+        """
+        from botocore.config import Config
+        
+        extra = self.config.extra
+        return Config(
+            max_pool_connections=int(extra.get("max_pool_connections", 50)),
+            connect_timeout=float(extra.get("connect_timeout", 5)),
+            read_timeout=float(extra.get("read_timeout", 10)),
+            retries={
+                "max_attempts": int(extra.get("max_attempts", 3)),
+                "mode": extra.get("retry_mode", "adaptive"),
+            },
+            tcp_keepalive=self._extra_flag("tcp_keepalive", True),
+        )
+    
     def connect(self) -> None:
         boto3 = self._import_driver()
+        self._init_codec()
         
         try:
-            session_params = {"region_name": self._region}
-            
-            if self._aws_access_key and self._aws_secret_key:
-                session_params["aws_access_key_id"] = self._aws_access_key
-                session_params["aws_secret_access_key"] = self._aws_secret_key
+            session = boto3.Session(**self._session_params())
+            botocore_config = self._botocore_config()
+            self._dynamodb = session.resource("dynamodb", config=botocore_config)
+            self._client = session.client("dynamodb", config=botocore_config)
             
-            session = boto3.Session(**session_params)
-            self._dynamodb = session.resource("dynamodb")
-            self._client = session.client("dynamodb")
+            dax_endpoint = self.config.extra.get("dax_endpoint")
+            if dax_endpoint:
+                AmazonDaxClient, self._dax_error = self._import_dax()
+                self._dax = AmazonDaxClient(
+                    session=session,
+                    region_name=self._region,
+                    endpoint_url=dax_endpoint
+                )
             
-            # Test connection
-            self._client.list_tables(Limit=1)
+            # Connectivity problems surface on the first real call unless
+            # an eager probe is requested (extra={"probe_on_connect": True})
+            if self._extra_flag("probe_on_connect", False):
+                self._client.list_tables(Limit=1)
             self._is_connected = True
             
+        except DriverNotInstalledError:
+            raise
         except Exception as e:
             raise ConnectionError(
                 f"Failed to connect to DynamoDB: {e}",
@@ -65,16 +147,90 @@ class DynamoDB(BaseAdapter):
     def disconnect(self) -> None:
         self._dynamodb = None
         self._client = None
+        self._dax = None
+        self._describe_cache.clear()
         self._is_connected = False
     
     def is_connected(self) -> bool:
+        """Return the cached connection state without a network round-trip."""
+        return self._is_connected and self._client is not None
+    
+    @classmethod
+    def _init_codec(cls) -> None:
+        """Create the shared attribute-value serializer and deserializer."""
+        if cls._serializer is None:
+            from boto3.dynamodb.types import TypeSerializer, TypeDeserializer
+            cls._serializer = TypeSerializer()
+            cls._deserializer = TypeDeserializer()
+    
+    def _serialize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert native Python values to DynamoDB attribute values."""
+        serialize = self._serializer.serialize
+        return {k: serialize(v) for k, v in item.items()}
+    
+    def _deserialize(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert DynamoDB attribute values to native Python values."""
+        deserialize = self._deserializer.deserialize
+        return {k: deserialize(v) for k, v in item.items()}
+    
+    def _serialize_params(self, params: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Convert positional PartiQL parameters to DynamoDB attribute values."""
+        return list(map(self._serializer.serialize, params))
+    
+    def _read(self, table: str, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one scan/query page, through DAX when configured, else DynamoDB."""
+        if self._dax is not None:
+            try:
+                return getattr(self._dax, operation)(TableName=table, **params)
+            except self._dax_error:
+                # Fall back to DynamoDB when the cluster can't serve the read
+                pass
+        
+        with self._track_connection():
+            return getattr(self._client, operation)(TableName=table, **params)
+    
+    def _key_attributes(self, table: str, where: Optional[Dict[str, Any]]) -> List[str]:
+        """Return the primary-key attributes of ``where`` if it pins the hash key."""
+        if not where or self._describe_cache.get(table) is self._DESCRIBE_FAILED:
+            return []
+        
+        from botocore.exceptions import ClientError
         try:
-            if self._client:
-                self._client.list_tables(Limit=1)
-                return True
+            key_schema = self._describe(table)["Table"]["KeySchema"]
+        except ClientError:
+            # E.g. no DescribeTable permission: don't ask again on every find()
+            self._describe_cache.setdefault(table, self._DESCRIBE_FAILED)
+            return []
         except Exception:
-            pass
-        return False
+            return []
+        
+        for key in key_schema:
+            if key["KeyType"] == "HASH" and key["AttributeName"] not in where:
+                return []
+        return [key["AttributeName"] for key in key_schema if key["AttributeName"] in where]
+    
+    def ping(self) -> bool:
+        """Check that the DynamoDB endpoint is reachable."""
+        try:
+            self._client.list_tables(Limit=1)
+            return True
+        except Exception:
+            return False
+    
+    @contextmanager
+    def _track_connection(self):
+        """Turn an unreachable endpoint into ConnectionError and clear the flag."""
+        try:
+            yield
+        except Exception as e:
+            from botocore.exceptions import EndpointConnectionError
+            if isinstance(e, EndpointConnectionError):
+                self._is_connected = False
+                raise ConnectionError(
+                    f"Failed to connect to DynamoDB: {e}",
+                    host=self._region
+                ) from e
+            raise
     
     def execute(
         self,
@@ -82,100 +238,163 @@ class DynamoDB(BaseAdapter):
         params: Optional[Union[tuple, dict]] = None
     ) -> QueryResult:
         """Execute PartiQL query."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            response = self._client.execute_statement(
-                Statement=query,
-                Parameters=list(params) if params else None
-            )
+            statement = {"Statement": query}
+            if params:
+                statement["Parameters"] = self._serialize_params(params)
+            with self._track_connection():
+                response = self._client.execute_statement(**statement)
             
             result = QueryResult()
-            result.data = response.get("Items", [])
+            result.data = list(map(self._deserialize, response.get("Items", [])))
             result.affected_rows = len(result.data)
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             
             return result
             
+        except ConnectionError:
+            raise
         except Exception as e:
             raise QueryError(str(e), query=query, params=params)
     
     def execute_many(self, query: str, params_list: List) -> QueryResult:
-        start_time = time.time()
+        """Execute a PartiQL statement per parameter set via BatchExecuteStatement."""
+        start_time = time.perf_counter_ns()
         
-        for params in params_list:
-            self._client.execute_statement(Statement=query, Parameters=list(params))
+        size = self._BATCH_SIZE
+        chunks = [params_list[i:i + size] for i in range(0, len(params_list), size)]
         
-        result = QueryResult(affected_rows=len(params_list))
-        result.execution_time = (time.time() - start_time) * 1000
+        with self._track_connection():
+            affected = self._run_batches(partial(self._execute_chunk, query), chunks)
+        
+        result = QueryResult(affected_rows=affected)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
+    def _execute_chunk(self, query: str, chunk: List) -> int:
+        """Run one BatchExecuteStatement chunk, retrying throttled statements."""
+        pending = list(chunk)
+        statements = [
+            {"Statement": query, "Parameters": self._serialize_params(p)}
+            for p in pending
+        ]
+        
+        for attempt in range(self._MAX_BATCH_RETRIES):
+            response = self._client.batch_execute_statement(Statements=statements)
+            
+            retry, retry_params = [], []
+            outcomes = zip(statements, pending, response.get("Responses", []))
+            for statement, params, outcome in outcomes:
+                error = outcome.get("Error")
+                if not error:
+                    continue
+                if error.get("Code") in self._RETRYABLE_STATEMENT_ERRORS:
+                    retry.append(statement)
+                    retry_params.append(params)
+                else:
+                    raise QueryError(
+                        error.get("Message") or error.get("Code", "Unknown error"),
+                        query=query,
+                        params=params
+                    )
+            
+            if not retry:
+                return len(chunk)
+            statements, pending = retry, retry_params
+            time.sleep(2 ** attempt * 0.05)
+        
+        raise QueryError(
+            f"DynamoDB left {len(statements)} statements unprocessed",
+            query=query
+        )
+    
+    def _run_batches(self, func: Callable[[List], int], chunks: List[List]) -> int:
+        """Run ``func`` over chunks, up to _WRITE_POOL_SIZE at a time."""
+        if len(chunks) <= 1:
+            return sum(func(chunk) for chunk in chunks)
+        
+        workers = min(self._WRITE_POOL_SIZE, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, chunk) for chunk in chunks]
+            return sum(future.result() for future in futures)
+    
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Put item into table."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        table_resource = self._dynamodb.Table(table)
-        table_resource.put_item(Item=data)
+        with self._track_connection():
+            self._client.put_item(TableName=table, Item=self._serialize(data))
         
         result = QueryResult(affected_rows=1)
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        """Batch write items."""
-        start_time = time.time()
+        """Batch write items, sending up to _WRITE_POOL_SIZE batches in parallel."""
+        start_time = time.perf_counter_ns()
         
-        table_resource = self._dynamodb.Table(table)
+        size = self._BATCH_SIZE
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
         
-        with table_resource.batch_writer() as batch:
-            for item in data:
-                batch.put_item(Item=item)
+        with self._track_connection():
+            affected = self._run_batches(partial(self._write_chunk, table), chunks)
         
-        result = QueryResult(affected_rows=len(data))
-        result.execution_time = (time.time() - start_time) * 1000
+        result = QueryResult(affected_rows=affected)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
+    def _write_chunk(self, table: str, chunk: List[Dict[str, Any]]) -> int:
+        """Write one BatchWriteItem chunk, retrying unprocessed items."""
+        # The resource's client serializes native Python values for us
+        client = self._dynamodb.meta.client
+        request_items = {table: [{"PutRequest": {"Item": item}} for item in chunk]}
+        
+        for attempt in range(self._MAX_BATCH_RETRIES):
+            response = client.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return len(chunk)
+            time.sleep(2 ** attempt * 0.05)
+        
+        raise QueryError(
+            f"DynamoDB left {len(request_items.get(table, []))} items "
+            f"unprocessed in '{table}'"
+        )
+    
     def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
         """Update item."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         if not where:
             raise QueryError("DynamoDB update requires primary key in 'where'")
         
-        table_resource = self._dynamodb.Table(table)
-        
-        update_expr_parts = []
-        expr_values = {}
-        expr_names = {}
-        
-        for i, (key, value) in enumerate(data.items()):
-            update_expr_parts.append(f"#{key} = :val{i}")
-            expr_values[f":val{i}"] = value
-            expr_names[f"#{key}"] = key
-        
-        table_resource.update_item(
-            Key=where,
-            UpdateExpression="SET " + ", ".join(update_expr_parts),
-            ExpressionAttributeValues=expr_values,
-            ExpressionAttributeNames=expr_names
+        params = self._update_params(data, where)
+        params["Key"] = self._serialize(params["Key"])
+        params["ExpressionAttributeValues"] = self._serialize(
+            params["ExpressionAttributeValues"]
         )
         
+        with self._track_connection():
+            self._client.update_item(TableName=table, **params)
+        
         result = QueryResult(affected_rows=1)
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
         """Delete item."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         if not where:
             raise QueryError("DynamoDB delete requires primary key in 'where'")
         
-        table_resource = self._dynamodb.Table(table)
-        table_resource.delete_item(Key=where)
+        with self._track_connection():
+            self._client.delete_item(TableName=table, Key=self._serialize(where))
         
         result = QueryResult(affected_rows=1)
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def find(
@@ -187,37 +406,101 @@ class DynamoDB(BaseAdapter):
         limit: Optional[int] = None,
         offset: Optional[int] = None
     ) -> QueryResult:
-        """Scan or query table."""
-        start_time = time.time()
+        """
+        Query or scan table.
+        
+        When ``where`` includes the table's partition key, a Query on the key
+        is issued and the remaining conditions become a filter; otherwise the
+        whole table is scanned.
+        """
+        start_time = time.perf_counter_ns()
+        
+        key_attributes = self._key_attributes(table, where)
+        operation = "query" if key_attributes else "scan"
+        scan_params = self._read_params(where, columns, limit, key_attributes)
+        if "ExpressionAttributeValues" in scan_params:
+            scan_params["ExpressionAttributeValues"] = self._serialize(
+                scan_params["ExpressionAttributeValues"]
+            )
+        
+        # A single request stops at the 1 MB page boundary, so follow
+        # LastEvaluatedKey until the table (or the limit) is exhausted.
+        items: List[Dict[str, Any]] = []
+        while True:
+            response = self._read(table, operation, scan_params)
+            items.extend(map(self._deserialize, response.get("Items", [])))
+            
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key or (limit and len(items) >= limit):
+                break
+            scan_params["ExclusiveStartKey"] = last_key
+        
+        if limit:
+            del items[limit:]
+        
+        result = QueryResult()
+        result.data = items
+        result.affected_rows = len(result.data)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         
-        table_resource = self._dynamodb.Table(table)
+        return result
+    
+    @staticmethod
+    def _update_params(data: Dict[str, Any], where: Dict[str, Any]) -> Dict[str, Any]:
+        """Build update_item parameters for a SET of ``data`` on key ``where``."""
+        # Positional placeholders also keep names with dots or dashes valid
+        items = list(data.items())
         
+        return {
+            "Key": where,
+            "UpdateExpression": "SET " + ", ".join(
+                [f"#k{i} = :v{i}" for i in range(len(items))]
+            ),
+            "ExpressionAttributeValues": {
+                f":v{i}": value for i, (_, value) in enumerate(items)
+            },
+            "ExpressionAttributeNames": {
+                f"#k{i}": key for i, (key, _) in enumerate(items)
+            },
+        }
+    
+    @staticmethod
+    def _read_params(
+        where: Optional[Dict[str, Any]],
+        columns: Optional[List[str]],
+        limit: Optional[int],
+        key_attributes: Sequence[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        Build scan/query parameters for equality conditions.
+        
+        Conditions on ``key_attributes`` go into the KeyConditionExpression,
+        everything else into the FilterExpression.
+        """
         scan_params = {}
         
         if columns:
             scan_params["ProjectionExpression"] = ", ".join(columns)
         
         if where:
+            key_parts = []
             filter_parts = []
             expr_values = {}
             for i, (key, value) in enumerate(where.items()):
-                filter_parts.append(f"{key} = :val{i}")
+                parts = key_parts if key in key_attributes else filter_parts
+                parts.append(f"{key} = :val{i}")
                 expr_values[f":val{i}"] = value
             
-            scan_params["FilterExpression"] = " AND ".join(filter_parts)
+            if key_parts:
+                scan_params["KeyConditionExpression"] = " AND ".join(key_parts)
+            if filter_parts:
+                scan_params["FilterExpression"] = " AND ".join(filter_parts)
             scan_params["ExpressionAttributeValues"] = expr_values
         
         if limit:
             scan_params["Limit"] = limit
         
-        response = table_resource.scan(**scan_params)
-        
-        result = QueryResult()
-        result.data = response.get("Items", [])
-        result.affected_rows = len(result.data)
-        result.execution_time = (time.time() - start_time) * 1000
-        
-        return result
+        return scan_params
     
     def begin_transaction(self) -> None:
         pass
@@ -232,8 +515,26 @@ class DynamoDB(BaseAdapter):
         response = self._client.list_tables()
         return response.get("TableNames", [])
     
+    def _describe(self, table: str) -> Dict[str, Any]:
+        """Return the DescribeTable response for a table, cached per connection."""
+        cached = self._describe_cache.get(table)
+        if cached is not None and cached is not self._DESCRIBE_FAILED:
+            return cached
+        
+        try:
+            response = self._client.describe_table(TableName=table)
+        except self._client.exceptions.ResourceNotFoundException:
+            self._describe_cache.pop(table, None)
+            raise
+        
+        if cached is self._DESCRIBE_FAILED:
+            self._describe_cache.pop(table, None)
+        
+        # setdefault is atomic, so concurrent callers agree on one entry
+        return self._describe_cache.setdefault(table, response)
+    
     def get_columns(self, table: str) -> List[Dict[str, Any]]:
-        response = self._client.describe_table(TableName=table)
+        response = self._describe(table)
         
         columns = []
         for attr in response["Table"]["AttributeDefinitions"]:
@@ -245,7 +546,266 @@ class DynamoDB(BaseAdapter):
     
     def table_exists(self, table: str) -> bool:
         try:
-            self._client.describe_table(TableName=table)
+            self._describe(table)
+            return True
+        except Exception:
+            return False
+
+
+class AsyncDynamoDB(DynamoDB, AsyncBaseAdapter):
+    """
+    Amazon DynamoDB adapter with async support via aioboto3.
+    
+    The ``*_async`` methods share one long-lived aioboto3 resource and
+    client, so concurrent coroutines reuse the same connection pool.
+    The sync methods inherited from DynamoDB keep working through boto3.
+    
+    Usage:
+        db = AsyncDynamoDB(extra={"region": "eu-west-1"})
+        await db.connect_async()
+        users = await db.find_async("users", where={"active": True})
+        await db.disconnect_async()
+    
+    Install:
+        pip install onedb[dynamodb-async]
+    """
+    
+    driver_name = "aioboto3"
+    install_command = "pip install onedb[dynamodb-async]"
+    
+    def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
+        super().__init__(config, **kwargs)
+        self._async_dynamodb = None
+        self._async_client = None
+        self._async_tables: Dict[str, Any] = {}
+        self._exit_stack: Optional[AsyncExitStack] = None
+    
+    def _import_async_driver(self):
+        try:
+            import aioboto3
+            return aioboto3
+        except ImportError:
+            raise DriverNotInstalledError("aioboto3", self.install_command)
+    
+    async def connect_async(self) -> None:
+        aioboto3 = self._import_async_driver()
+        self._init_codec()
+        
+        stack = AsyncExitStack()
+        try:
+            session = aioboto3.Session(**self._session_params())
+            botocore_config = self._botocore_config()
+            
+            # Keep resource and client open for the adapter's lifetime
+            self._async_dynamodb = await stack.enter_async_context(
+                session.resource("dynamodb", config=botocore_config)
+            )
+            self._async_client = await stack.enter_async_context(
+                session.client("dynamodb", config=botocore_config)
+            )
+            
+            # Same as connect(): probe only with extra={"probe_on_connect": True}
+            if self._extra_flag("probe_on_connect", False):
+                await self._async_client.list_tables(Limit=1)
+            self._exit_stack = stack
+            self._is_connected = True
+            
+        except Exception as e:
+            await stack.aclose()
+            self._async_dynamodb = None
+            self._async_client = None
+            raise ConnectionError(
+                f"Failed to connect to DynamoDB: {e}",
+                host=self._region
+            )
+    
+    async def disconnect_async(self) -> None:
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+        self._async_dynamodb = None
+        self._async_client = None
+        self._async_tables.clear()
+        self._is_connected = False
+    
+    def is_connected(self) -> bool:
+        if self._async_client is not None:
+            return self._is_connected
+        return super().is_connected()
+    
+    async def _async_table(self, name: str) -> Any:
+        """Return the aioboto3 Table resource for a table, built once per connection."""
+        table = self._async_tables.get(name)
+        if table is None:
+            table = self._async_tables.setdefault(
+                name, await self._async_dynamodb.Table(name)
+            )
+        return table
+    
+    async def ping_async(self) -> bool:
+        """Check that the DynamoDB endpoint is reachable."""
+        try:
+            await self._async_client.list_tables(Limit=1)
             return True
         except Exception:
             return False
+    
+    async def execute_async(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None
+    ) -> QueryResult:
+        """Execute PartiQL query."""
+        start_time = time.perf_counter_ns()
+        
+        try:
+            statement = {"Statement": query}
+            if params:
+                statement["Parameters"] = self._serialize_params(params)
+            response = await self._async_client.execute_statement(**statement)
+            
+            result = QueryResult()
+            result.data = list(map(self._deserialize, response.get("Items", [])))
+            result.affected_rows = len(result.data)
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            
+            return result
+            
+        except Exception as e:
+            raise QueryError(str(e), query=query, params=params)
+    
+    async def insert_async(self, table: str, data: Dict[str, Any]) -> QueryResult:
+        """Put item into table."""
+        start_time = time.perf_counter_ns()
+        
+        table_resource = await self._async_table(table)
+        await table_resource.put_item(Item=data)
+        
+        result = QueryResult(affected_rows=1)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    async def insert_many_async(
+        self,
+        table: str,
+        data: List[Dict[str, Any]]
+    ) -> QueryResult:
+        """Batch write items, keeping up to _WRITE_POOL_SIZE batches in flight."""
+        start_time = time.perf_counter_ns()
+        
+        size = self._BATCH_SIZE
+        semaphore = asyncio.Semaphore(self._WRITE_POOL_SIZE)
+        
+        async def write(chunk: List[Dict[str, Any]]) -> int:
+            async with semaphore:
+                return await self._write_chunk_async(table, chunk)
+        
+        counts = await asyncio.gather(*(
+            write(data[i:i + size]) for i in range(0, len(data), size)
+        ))
+        
+        result = QueryResult(affected_rows=sum(counts))
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    async def _write_chunk_async(
+        self,
+        table: str,
+        chunk: List[Dict[str, Any]]
+    ) -> int:
+        """Write one BatchWriteItem chunk, retrying unprocessed items."""
+        client = self._async_dynamodb.meta.client
+        request_items = {table: [{"PutRequest": {"Item": item}} for item in chunk]}
+        
+        for attempt in range(self._MAX_BATCH_RETRIES):
+            response = await client.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                return len(chunk)
+            await asyncio.sleep(2 ** attempt * 0.05)
+        
+        raise QueryError(
+            f"DynamoDB left {len(request_items.get(table, []))} items "
+            f"unprocessed in '{table}'"
+        )
+    
+    async def update_async(
+        self,
+        table: str,
+        data: Dict[str, Any],
+        where: Optional[Dict[str, Any]] = None
+    ) -> QueryResult:
+        """Update item."""
+        start_time = time.perf_counter_ns()
+        
+        if not where:
+            raise QueryError("DynamoDB update requires primary key in 'where'")
+        
+        table_resource = await self._async_table(table)
+        await table_resource.update_item(**self._update_params(data, where))
+        
+        result = QueryResult(affected_rows=1)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    async def delete_async(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None
+    ) -> QueryResult:
+        """Delete item."""
+        start_time = time.perf_counter_ns()
+        
+        if not where:
+            raise QueryError("DynamoDB delete requires primary key in 'where'")
+        
+        table_resource = await self._async_table(table)
+        await table_resource.delete_item(Key=where)
+        
+        result = QueryResult(affected_rows=1)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    async def find_async(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> QueryResult:
+        """Scan table."""
+        start_time = time.perf_counter_ns()
+        
+        table_resource = await self._async_table(table)
+        scan_params = self._read_params(where, columns, limit)
+        
+        items: List[Dict[str, Any]] = []
+        while True:
+            response = await table_resource.scan(**scan_params)
+            items.extend(response.get("Items", []))
+            
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key or (limit and len(items) >= limit):
+                break
+            scan_params["ExclusiveStartKey"] = last_key
+        
+        if limit:
+            del items[limit:]
+        
+        result = QueryResult()
+        result.data = items
+        result.affected_rows = len(result.data)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        
+        return result
+    
+    async def begin_transaction_async(self) -> None:
+        pass
+    
+    async def commit_async(self) -> None:
+        pass
+    
+    async def rollback_async(self) -> None:
+        pass
@@ -2,15 +2,35 @@
 Elasticsearch Adapter.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+from itertools import islice
+import os
 import time
-import json
 
-from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from ..core.base import (
+    BaseAdapter, AsyncBaseAdapter, ConnectionConfig,
+    QueryResult, DatabaseType
+)
 from ..exceptions import ConnectionError as OneDBConnectionError
 from ..exceptions import QueryError, DriverNotInstalledError
 
 
+# Shared, never mutated: the client only serializes request bodies
+_MATCH_ALL = {"match_all": {}}
+
+
+def _term_query(where: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a query matching all ``where`` equalities (or everything)."""
+    if not where:
+        return _MATCH_ALL
+    return {"bool": {"must": [{"term": {k: v}} for k, v in where.items()]}}
+
+
 class Elasticsearch(BaseAdapter):
     """
     Elasticsearch adapter.
@@ -23,11 +43,24 @@ class Elasticsearch(BaseAdapter):
     driver_name = "elasticsearch"
     install_command = "pip install onedb[elasticsearch]"
     
+    # parallel_bulk tuning: serialize chunks on several threads at once
+    _BULK_THREAD_COUNT = min(os.cpu_count() or 4, 8)
+    _BULK_CHUNK_SIZE = 1000
+    _BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+    _BULK_QUEUE_SIZE = 4
+    
+    # Default index.max_result_window; deeper pages must use scroll
+    _MAX_RESULT_WINDOW = 10000
+    _SCROLL_SIZE = 1000
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         if self.config.port is None:
             self.config.port = 9200
         self._client = None
+        
+        # Indices written since the last commit(), refreshed on commit
+        self._dirty_indices: Set[str] = set()
     
     def _import_driver(self):
         try:
@@ -36,21 +69,23 @@ class Elasticsearch(BaseAdapter):
         except ImportError:
             raise DriverNotInstalledError("elasticsearch", self.install_command)
     
+    def _client_params(self) -> Dict[str, Any]:
+        """Build client constructor parameters from config."""
+        auth = None
+        if self.config.user and self.config.password:
+            auth = (self.config.user, self.config.password)
+        
+        return {
+            "hosts": [f"http://{self.config.host}:{self.config.port}"],
+            "basic_auth": auth,
+            "request_timeout": self.config.timeout,
+        }
+    
     def connect(self) -> None:
         ES = self._import_driver()
         
         try:
-            hosts = [f"http://{self.config.host}:{self.config.port}"]
-            
-            auth = None
-            if self.config.user and self.config.password:
-                auth = (self.config.user, self.config.password)
-            
-            self._client = ES(
-                hosts=hosts,
-                basic_auth=auth,
-                request_timeout=self.config.timeout
-            )
+            self._client = ES(**self._client_params())
             
             # Test connection
             self._client.info()
@@ -67,6 +102,7 @@ class Elasticsearch(BaseAdapter):
         if self._client:
             self._client.close()
             self._client = None
+        self._dirty_indices.clear()
         self._is_connected = False
     
     def is_connected(self) -> bool:
@@ -84,13 +120,14 @@ class Elasticsearch(BaseAdapter):
         params: Optional[Union[tuple, dict]] = None
     ) -> QueryResult:
         """Execute Elasticsearch query (expects JSON query)."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            if isinstance(query, str):
-                query_dict = json.loads(query)
+            if isinstance(query, (str, bytes)):
+                query_dict = _json_loads(query)
             else:
-                query_dict = query
+                # Shallow copy: popping _index must not change the caller's dict
+                query_dict = dict(query)
             
             index = query_dict.pop("_index", self.config.database or "*")
             
@@ -99,7 +136,7 @@ class Elasticsearch(BaseAdapter):
             result = QueryResult()
             result.data = [hit["_source"] for hit in response["hits"]["hits"]]
             result.affected_rows = len(result.data)
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             
             return result
             
@@ -108,29 +145,41 @@ class Elasticsearch(BaseAdapter):
     
     def execute_many(self, query: str, params_list: List) -> QueryResult:
         """Bulk operations."""
-        from elasticsearch.helpers import bulk
+        start_time = time.perf_counter_ns()
         
-        start_time = time.time()
-        
-        actions = []
-        for params in params_list:
-            action = {
-                "_index": self.config.database,
-                "_source": params
-            }
-            actions.append(action)
-        
-        success, _ = bulk(self._client, actions)
+        index = self.config.database
+        if index:
+            self._dirty_indices.add(index)
+        success = self._bulk(
+            {"_index": index, "_source": params} for params in params_list
+        )
         
         result = QueryResult(affected_rows=success)
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
+    def _bulk(self, actions: Iterable[Dict[str, Any]]) -> int:
+        """Run bulk actions with parallel_bulk and return the success count."""
+        from elasticsearch.helpers import parallel_bulk
+        
+        success = 0
+        for ok, _ in parallel_bulk(
+            self._client,
+            actions,
+            thread_count=self._BULK_THREAD_COUNT,
+            chunk_size=self._BULK_CHUNK_SIZE,
+            max_chunk_bytes=self._BULK_MAX_CHUNK_BYTES,
+            queue_size=self._BULK_QUEUE_SIZE
+        ):
+            success += ok
+        return success
+    
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Index a document."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         doc_id = data.pop("_id", None)
+        self._dirty_indices.add(table)
         
         response = self._client.index(
             index=table,
@@ -141,21 +190,19 @@ class Elasticsearch(BaseAdapter):
         result = QueryResult()
         result.last_id = response["_id"]
         result.affected_rows = 1
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         
         return result
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
         """Bulk index documents."""
-        from elasticsearch.helpers import bulk
-        
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        actions = [{"_index": table, "_source": doc} for doc in data]
-        success, _ = bulk(self._client, actions)
+        self._dirty_indices.add(table)
+        success = self._bulk({"_index": table, "_source": doc} for doc in data)
         
         result = QueryResult(affected_rows=success)
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def update(
@@ -165,11 +212,10 @@ class Elasticsearch(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Update by query."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        query = {"match_all": {}}
-        if where:
-            query = {"bool": {"must": [{"term": {k: v}} for k, v in where.items()]}}
+        query = _term_query(where)
+        self._dirty_indices.add(table)
         
         script_parts = [f"ctx._source.{k} = params.{k}" for k in data.keys()]
         
@@ -185,7 +231,7 @@ class Elasticsearch(BaseAdapter):
         )
         
         result = QueryResult(affected_rows=response.get("updated", 0))
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def delete(
@@ -194,11 +240,10 @@ class Elasticsearch(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Delete by query."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        query = {"match_all": {}}
-        if where:
-            query = {"bool": {"must": [{"term": {k: v}} for k, v in where.items()]}}
+        query = _term_query(where)
+        self._dirty_indices.add(table)
         
         response = self._client.delete_by_query(
             index=table, 
@@ -206,7 +251,7 @@ class Elasticsearch(BaseAdapter):
         )
         
         result = QueryResult(affected_rows=response.get("deleted", 0))
-        result.execution_time = (time.time() - start_time) * 1000
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def find(
@@ -218,19 +263,78 @@ class Elasticsearch(BaseAdapter):
         limit: Optional[int] = None,
         offset: Optional[int] = None
     ) -> QueryResult:
-        """Search documents."""
-        start_time = time.time()
+        """
+        Search documents.
         
-        body: Dict[str, Any] = {}
+        Results that fit in the index's result window (``offset + limit``
+        up to 10000) use a single search; unbounded or deeper requests
+        are streamed with the scroll API so no hits are truncated.
+        """
+        start_time = time.perf_counter_ns()
         
-        if where:
-            body["query"] = {
-                "bool": {
-                    "must": [{"term": {k: v}} for k, v in where.items()]
-                }
-            }
+        body = self._find_body(where, columns, order_by)
+        
+        if limit and (offset or 0) + limit <= self._MAX_RESULT_WINDOW:
+            body["size"] = limit
+            if offset:
+                body["from"] = offset
+            response = self._client.search(index=table, body=body)
+            data = [hit["_source"] for hit in response["hits"]["hits"]]
         else:
-            body["query"] = {"match_all": {}}
+            docs = self._scan(table, body, preserve_order=bool(order_by))
+            stop = (offset or 0) + limit if limit else None
+            data = list(islice(docs, offset or 0, stop))
+        
+        result = QueryResult()
+        result.data = data
+        result.affected_rows = len(result.data)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        
+        return result
+    
+    def find_iter(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream matching documents without loading them all into memory.
+        
+        Example:
+            for doc in db.find_iter("logs", where={"level": "error"}):
+                process(doc)
+        """
+        body = self._find_body(where, columns, order_by)
+        return self._scan(table, body, preserve_order=bool(order_by))
+    
+    def _scan(
+        self,
+        index: str,
+        body: Dict[str, Any],
+        preserve_order: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield ``_source`` of every hit using the scroll helper."""
+        from elasticsearch.helpers import scan
+        
+        for hit in scan(
+            self._client,
+            index=index,
+            query=body,
+            size=self._SCROLL_SIZE,
+            preserve_order=preserve_order
+        ):
+            yield hit["_source"]
+    
+    @staticmethod
+    def _find_body(
+        where: Optional[Dict[str, Any]],
+        columns: Optional[List[str]],
+        order_by: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a search body for equality filters, projection and sort."""
+        body: Dict[str, Any] = {"query": _term_query(where)}
         
         if columns:
             body["_source"] = columns
@@ -241,24 +345,11 @@ class Elasticsearch(BaseAdapter):
             direction = parts[1].lower() if len(parts) > 1 else "asc"
             body["sort"] = [{field: {"order": direction}}]
         
-        if limit:
-            body["size"] = limit
-        
-        if offset:
-            body["from"] = offset
-        
-        response = self._client.search(index=table, body=body)
-        
-        result = QueryResult()
-        result.data = [hit["_source"] for hit in response["hits"]["hits"]]
-        result.affected_rows = len(result.data)
-        result.execution_time = (time.time() - start_time) * 1000
-        
-        return result
+        return body
     
     def search(self, index: str, query: Dict[str, Any]) -> QueryResult:
         """Native Elasticsearch search."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         response = self._client.search(index=index, body=query)
         
@@ -271,11 +362,8 @@ class Elasticsearch(BaseAdapter):
         else:
             result.affected_rows = total
         
-        result.execution_time = (time.time() - start_time) * 1000
-        
-        # Include aggregations if present
-        if "aggregations" in response:
-            result.data.append({"_aggregations": response["aggregations"]})
+        result.aggregations = response.get("aggregations")
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         
         return result
     
@@ -284,9 +372,10 @@ class Elasticsearch(BaseAdapter):
         pass
     
     def commit(self) -> None:
-        """Refresh indices."""
-        if self._client:
-            self._client.indices.refresh()
+        """Refresh the indices written since the last commit."""
+        if self._client and self._dirty_indices:
+            self._client.indices.refresh(index=",".join(sorted(self._dirty_indices)))
+            self._dirty_indices.clear()
     
     def rollback(self) -> None:
         """Not supported."""
@@ -313,4 +402,188 @@ class Elasticsearch(BaseAdapter):
     
     def table_exists(self, table: str) -> bool:
         """Check if index exists."""
-        return self._client.indices.exists(index=table)
\ No newline at end of file
+        return self._client.indices.exists(index=table)
+
+
+class AsyncElasticsearch(Elasticsearch, AsyncBaseAdapter):
+    """
+    Elasticsearch adapter with async support.
+    
+    The ``*_async`` methods share one ``AsyncElasticsearch`` client, so
+    concurrent coroutines fan out over a single connection pool. The sync
+    methods inherited from Elasticsearch keep working as before.
+    
+    Usage:
+        db = AsyncElasticsearch(host="localhost")
+        await db.connect_async()
+        docs = await db.find_async("products", where={"category": "books"})
+        await db.disconnect_async()
+    
+    Install:
+        pip install onedb[elasticsearch-async]
+    """
+    
+    install_command = "pip install onedb[elasticsearch-async]"
+    
+    def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
+        super().__init__(config, **kwargs)
+        self._async_client = None
+    
+    def _import_async_driver(self):
+        try:
+            from elasticsearch import AsyncElasticsearch as AsyncES
+            return AsyncES
+        except ImportError:
+            raise DriverNotInstalledError("elasticsearch[async]", self.install_command)
+    
+    async def connect_async(self) -> None:
+        AsyncES = self._import_async_driver()
+        
+        try:
+            self._async_client = AsyncES(
+                **self._client_params(),
+                http_compress=True,
+                connections_per_node=int(
+                    self.config.extra.get("connections_per_node", 50)
+                )
+            )
+            
+            # Test connection
+            await self._async_client.info()
+            self._is_connected = True
+            
+        except Exception as e:
+            if self._async_client:
+                await self._async_client.close()
+                self._async_client = None
+            raise OneDBConnectionError(
+                f"Failed to connect to Elasticsearch: {e}",
+                host=self.config.host,
+                port=self.config.port
+            )
+    
+    async def disconnect_async(self) -> None:
+        if self._async_client:
+            await self._async_client.close()
+            self._async_client = None
+        self._dirty_indices.clear()
+        self._is_connected = False
+    
+    def is_connected(self) -> bool:
+        if self._async_client is not None:
+            return self._is_connected
+        return super().is_connected()
+    
+    async def execute_async(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None
+    ) -> QueryResult:
+        """Execute Elasticsearch query (expects JSON query)."""
+        start_time = time.perf_counter_ns()
+        
+        try:
+            if isinstance(query, (str, bytes)):
+                query_dict = _json_loads(query)
+            else:
+                # Shallow copy: popping _index must not change the caller's dict
+                query_dict = dict(query)
+            
+            index = query_dict.pop("_index", self.config.database or "*")
+            
+            response = await self._async_client.search(index=index, body=query_dict)
+            
+            result = QueryResult()
+            result.data = [hit["_source"] for hit in response["hits"]["hits"]]
+            result.affected_rows = len(result.data)
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+            
+            return result
+            
+        except Exception as e:
+            raise QueryError(str(e), query=str(query))
+    
+    async def insert_many_async(
+        self,
+        table: str,
+        data: List[Dict[str, Any]]
+    ) -> QueryResult:
+        """Bulk index documents."""
+        from elasticsearch.helpers import async_bulk
+        
+        start_time = time.perf_counter_ns()
+        
+        self._dirty_indices.add(table)
+        success, _ = await async_bulk(
+            self._async_client,
+            ({"_index": table, "_source": doc} for doc in data),
+            chunk_size=self._BULK_CHUNK_SIZE,
+            max_chunk_bytes=self._BULK_MAX_CHUNK_BYTES
+        )
+        
+        result = QueryResult(affected_rows=success)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    async def find_async(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> QueryResult:
+        """Search documents, scrolling past the result window like find()."""
+        from elasticsearch.helpers import async_scan
+        
+        start_time = time.perf_counter_ns()
+        
+        body = self._find_body(where, columns, order_by)
+        
+        if limit and (offset or 0) + limit <= self._MAX_RESULT_WINDOW:
+            body["size"] = limit
+            if offset:
+                body["from"] = offset
+            response = await self._async_client.search(index=table, body=body)
+            data = [hit["_source"] for hit in response["hits"]["hits"]]
+        else:
+            start = offset or 0
+            stop = start + limit if limit else None
+            data = []
+            position = 0
+            async for hit in async_scan(
+                self._async_client,
+                index=table,
+                query=body,
+                size=self._SCROLL_SIZE,
+                preserve_order=bool(order_by)
+            ):
+                if stop is not None and position >= stop:
+                    break
+                if position >= start:
+                    data.append(hit["_source"])
+                position += 1
+        
+        result = QueryResult()
+        result.data = data
+        result.affected_rows = len(result.data)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        
+        return result
+    
+    async def begin_transaction_async(self) -> None:
+        """Elasticsearch doesn't support transactions."""
+        pass
+    
+    async def commit_async(self) -> None:
+        """Refresh the indices written since the last commit."""
+        if self._async_client and self._dirty_indices:
+            await self._async_client.indices.refresh(
+                index=",".join(sorted(self._dirty_indices))
+            )
+            self._dirty_indices.clear()
+    
+    async def rollback_async(self) -> None:
+        """Not supported."""
+        pass
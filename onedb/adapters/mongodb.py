@@ -3,11 +3,198 @@ MongoDB Adapter.
 NoSQL document database support.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+from collections import OrderedDict, deque
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import islice
+import hashlib
+import struct
+from threading import Lock
 import time
 
 from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
-from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
+from ..exceptions import (
+    ConnectionError, QueryError, DriverNotInstalledError, ValidationError
+)
+
+
+def _timed_query(op: str):
+    """
+    Time a QueryResult-returning method and wrap driver errors as
+    ``QueryError("<op> failed: ...")``.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                result = func(self, *args, **kwargs)
+            except QueryError:
+                raise
+            except Exception as e:
+                raise QueryError(f"{op} failed: {e}")
+            result.execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
+            return result
+        return wrapper
+    return decorator
+
+
+# Python type names pymongo decodes each BSON $type alias to
+_BSON_TYPE_NAMES = {
+    "double": "float",
+    "string": "str",
+    "object": "dict",
+    "array": "list",
+    "binData": "bytes",
+    "objectId": "ObjectId",
+    "bool": "bool",
+    "date": "datetime",
+    "null": "NoneType",
+    "regex": "Regex",
+    "javascript": "Code",
+    "int": "int",
+    "timestamp": "Timestamp",
+    "long": "int",
+    "decimal": "Decimal128",
+    "minKey": "MinKey",
+    "maxKey": "MaxKey",
+}
+
+
+_INT32 = struct.Struct("<i")
+
+
+class _FilterTemplate:
+    """
+    Filter whose static parts are BSON-encoded once.
+    
+    Calling it encodes only the parameter values and returns a
+    ``RawBSONDocument`` that pymongo sends without re-encoding.
+    """
+    
+    def __init__(self, template: Dict[str, Any], param_names: tuple):
+        import bson
+        from bson.raw_bson import RawBSONDocument
+        
+        self._encode = bson.encode
+        self._raw = RawBSONDocument
+        self.param_names = param_names
+        self._parts = self._compile(template, frozenset(param_names))
+    
+    def _compile(self, template: Dict[str, Any], params: frozenset) -> list:
+        # bytes: pre-encoded element; (key, name): placeholder;
+        # (prefix, parts): embedded document holding placeholders
+        parts = []
+        for key, value in template.items():
+            if isinstance(value, str) and value in params:
+                parts.append((key, value))
+            elif isinstance(value, dict):
+                prefix = b"\x03" + key.encode() + b"\x00"
+                parts.append((prefix, self._compile(value, params)))
+            else:
+                parts.append(self._encode({key: value})[4:-1])
+        return parts
+    
+    def _render(self, parts: list, values: Dict[str, Any]) -> bytes:
+        out = []
+        for part in parts:
+            if type(part) is bytes:
+                out.append(part)
+            elif type(part[1]) is str:
+                key, name = part
+                out.append(self._encode({key: values[name]})[4:-1])
+            else:
+                out.append(part[0])
+                out.append(self._render(part[1], values))
+        body = b"".join(out)
+        return _INT32.pack(len(body) + 5) + body + b"\x00"
+    
+    def __call__(self, *args, **kwargs):
+        values = dict(zip(self.param_names, args), **kwargs)
+        missing = [name for name in self.param_names if name not in values]
+        if missing:
+            raise ValidationError(
+                f"Missing filter parameters: {', '.join(missing)}",
+                field=missing[0]
+            )
+        return self._raw(self._render(self._parts, values))
+
+
+class _LazyDoc(dict):
+    """
+    Document whose ObjectId ``_id`` is converted to a hex string on first
+    access instead of eagerly for every row.
+    
+    Every way of reading the value (indexing, iteration and with it
+    ``dict(doc)``/``{**doc}``, ``pop``/``popitem``/``setdefault``, ``copy``,
+    comparison) resolves it first.
+    """
+    
+    __slots__ = ()
+    
+    def _resolve_id(self) -> None:
+        raw_id = dict.get(self, "_id")
+        if type(raw_id) is MongoDB._ObjectId:
+            dict.__setitem__(self, "_id", raw_id.binary.hex())
+    
+    def __getitem__(self, key):
+        if key == "_id":
+            self._resolve_id()
+        return dict.__getitem__(self, key)
+    
+    def get(self, key, default=None):
+        if key == "_id":
+            self._resolve_id()
+        return dict.get(self, key, default)
+    
+    def pop(self, key, *default):
+        if key == "_id":
+            self._resolve_id()
+        return dict.pop(self, key, *default)
+    
+    def setdefault(self, key, default=None):
+        if key == "_id":
+            self._resolve_id()
+        return dict.setdefault(self, key, default)
+    
+    def popitem(self):
+        self._resolve_id()
+        return dict.popitem(self)
+    
+    def items(self):
+        self._resolve_id()
+        return dict.items(self)
+    
+    def values(self):
+        self._resolve_id()
+        return dict.values(self)
+    
+    def __iter__(self):
+        # Also takes dict(doc) and {**doc} off dict's raw-copy fast path
+        self._resolve_id()
+        return dict.__iter__(self)
+    
+    def copy(self) -> "_LazyDoc":
+        self._resolve_id()
+        return _LazyDoc(dict.items(self))
+    
+    def __eq__(self, other) -> bool:
+        self._resolve_id()
+        if isinstance(other, _LazyDoc):
+            other._resolve_id()
+        return dict.__eq__(self, other)
+    
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        self._resolve_id()
+        return dict.__repr__(self)
 
 
 class MongoDB(BaseAdapter):
@@ -37,6 +224,12 @@ class MongoDB(BaseAdapter):
             {"$group": {"_id": "$city", "count": {"$sum": 1}}}
         ])
     
+        # Unacknowledged (w=0) bulk inserts for ingestion workloads
+        db = MongoDB(host="localhost", database="logs", fast_insert=True)
+        
+        # Keep the 256 most recent find/aggregate results in memory
+        db = MongoDB(host="localhost", database="mydb", result_cache_size=256)
+    
     Install:
         pip install onedb[mongodb]
     """
@@ -45,22 +238,184 @@ class MongoDB(BaseAdapter):
     driver_name = "pymongo"
     install_command = "pip install onedb[mongodb]"
     
-    def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
+    # Documents fetched per getMore round-trip when draining cursors
+    DEFAULT_BATCH_SIZE = 1000
+    
+    # Driver module and ObjectId class, resolved once on first import
+    _pymongo = None
+    _ObjectId = None
+    
+    # Offsets above this make find() suggest find_after()
+    DEEP_OFFSET_WARNING = 10000
+    
+    # Seconds a list_collection_names() result is reused
+    COLLECTION_NAMES_TTL = 5.0
+    
+    # Documents sampled by get_columns, and how long its answer is reused
+    SCHEMA_SAMPLE_SIZE = 100
+    COLUMNS_CACHE_TTL = 5.0
+    
+    # Idle ClientSessions kept for reuse by later transactions
+    SESSION_POOL_SIZE = 16
+    
+    # MongoClients shared across instances: key -> [client, refcount]
+    _client_cache: Dict[tuple, list] = {}
+    _client_cache_lock = Lock()
+    
+    def __init__(
+        self,
+        config: Optional[ConnectionConfig] = None,
+        fast_insert: bool = False,
+        result_cache_size: int = 0,
+        **kwargs
+    ):
         super().__init__(config, **kwargs)
         self._client = None
+        self._client_key = None
         self._db = None
+        self._coll_names_cache = None  # (fetched_at, frozenset of names)
+        self._columns_cache: Dict[str, tuple] = {}  # table -> (fetched_at, columns)
+        self._index_cache: Dict[str, Dict[str, Any]] = {}  # table -> index_information()
+        self._session = None
+        self._session_pool: deque = deque()
+        
+        # Write concern for insert_many; 0 skips waiting for acknowledgement
+        self._fast_insert_w = 0 if fast_insert else 1
+        
+        # LRU of find/aggregate results; writes through this adapter bump
+        # the collection's version so stale entries are never hit
+        self._result_cache_size = result_cache_size
+        self._result_cache: "OrderedDict[tuple, QueryResult]" = OrderedDict()
+        self._collection_versions: Dict[str, int] = {}
+        self._result_cache_lock = Lock()
+        
+        # Background fetcher for _drain_prefetched, created on first use
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = Lock()
         
         if self.config.port is None:
             self.config.port = 27017
     
+    def _clone(self) -> "MongoDB":
+        return type(self)(
+            config=self.config,
+            fast_insert=self._fast_insert_w == 0,
+            result_cache_size=self._result_cache_size
+        )
+    
     def _import_driver(self):
         """Import pymongo driver."""
+        if MongoDB._pymongo is None:
+            try:
+                import pymongo
+                from bson import ObjectId
+            except ImportError:
+                raise DriverNotInstalledError("pymongo", self.install_command)
+            MongoDB._pymongo, MongoDB._ObjectId = pymongo, ObjectId
+        return MongoDB._pymongo, MongoDB._ObjectId
+    
+    def _stringify_ids(self, docs: List[Dict[str, Any]]) -> None:
+        """Replace ObjectId ``_id`` values with their hex string in place."""
+        ObjectId = self._ObjectId
+        for doc in docs:
+            raw_id = doc.get("_id")
+            if type(raw_id) is ObjectId:
+                doc["_id"] = raw_id.binary.hex()
+    
+    def _cache_key(self, table: str, query: Dict[str, Any]) -> Optional[tuple]:
+        """Result-cache key for a read, or None if caching is off or impossible."""
+        if not self._result_cache_size or self._session:
+            return None
+        import bson
+        
         try:
-            import pymongo
-            from bson import ObjectId
-            return pymongo, ObjectId
-        except ImportError:
-            raise DriverNotInstalledError("pymongo", self.install_command)
+            digest = hashlib.blake2b(bson.encode(query), digest_size=16).digest()
+        except Exception:
+            return None
+        return (self._db.name, table, self._collection_versions.get(table, 0), digest)
+    
+    @staticmethod
+    def _copy_docs(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Deep, so nested subdocuments are not shared with the cache either
+        return deepcopy(docs)
+    
+    def _cache_get(self, key: Optional[tuple]) -> Optional[QueryResult]:
+        """Return a copy of a cached result, marking it recently used."""
+        if key is None:
+            return None
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+        return QueryResult(data=self._copy_docs(cached.data))
+    
+    def _cache_put(self, key: Optional[tuple], result: QueryResult) -> None:
+        """Store a copy of a result, evicting the least recently used entry when full."""
+        if key is None:
+            return
+        entry = QueryResult(data=self._copy_docs(result.data))
+        with self._result_cache_lock:
+            self._result_cache[key] = entry
+            if len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def _invalidate(self, table: Optional[str] = None) -> None:
+        """Invalidate cached reads of one collection, or all of them."""
+        if not self._result_cache:
+            return
+        with self._result_cache_lock:
+            if table is None:
+                self._result_cache.clear()
+            else:
+                self._collection_versions[table] = self._collection_versions.get(table, 0) + 1
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_order_by(order_by: str) -> tuple:
+        """Parse "field DESC, other ASC" into ((field, -1), (other, 1))."""
+        spec = []
+        for part in order_by.split(","):
+            tokens = part.split()
+            if not tokens:
+                continue
+            direction = -1 if len(tokens) > 1 and tokens[1].upper() == "DESC" else 1
+            spec.append((tokens[0], direction))
+        return tuple(spec)
+    
+    def _drain_prefetched(self, cursor, batch_size: int) -> List[Dict[str, Any]]:
+        """
+        Drain a cursor, fetching the next batch in a background thread
+        while the current one is post-processed.
+        """
+        def fetch() -> List[Dict[str, Any]]:
+            return list(islice(cursor, batch_size))
+        
+        # Most results fit in one batch; only longer ones use the fetcher
+        data = fetch()
+        self._stringify_ids(data)
+        if len(data) < batch_size:
+            return data
+        
+        with self._prefetch_lock:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="onedb-mongo-prefetch"
+                )
+            executor = self._prefetch_executor
+        
+        pending = executor.submit(fetch)
+        while True:
+            batch = pending.result()
+            if not batch:
+                break
+            if len(batch) == batch_size:
+                pending = executor.submit(fetch)
+            self._stringify_ids(batch)
+            data.extend(batch)
+            if len(batch) < batch_size:
+                break
+        return data
     
     def connect(self) -> None:
         """Connect to MongoDB."""
@@ -69,15 +424,39 @@ class MongoDB(BaseAdapter):
         try:
             # Build connection URI
             uri = self.config.to_uri("mongodb")
+            key = self._client_cache_key(uri)
             
-            self._client = pymongo.MongoClient(
-                uri,
-                serverSelectionTimeoutMS=self.config.timeout * 1000,
-                **self.config.extra
-            )
+            client = self._acquire_client(key)
+            if client is None:
+                # Built and pinged outside the lock, so an unreachable server
+                # does not stall connect()/disconnect() of other instances
+                client = pymongo.MongoClient(
+                    uri,
+                    serverSelectionTimeoutMS=self.config.timeout * 1000,
+                    **self._driver_extra()
+                )
+                
+                # Test connection
+                try:
+                    client.admin.command("ping")
+                except Exception:
+                    client.close()
+                    raise
+                
+                if key:
+                    with MongoDB._client_cache_lock:
+                        entry = MongoDB._client_cache.get(key)
+                        if entry:
+                            entry[1] += 1
+                        else:
+                            MongoDB._client_cache[key] = [client, 1]
+                    if entry:
+                        # Another thread cached a client first; use that one
+                        client.close()
+                        client = entry[0]
             
-            # Test connection
-            self._client.admin.command("ping")
+            self._client = client
+            self._client_key = key
             
             # Select database
             if self.config.database:
@@ -96,15 +475,63 @@ class MongoDB(BaseAdapter):
     def disconnect(self) -> None:
         """Close connection."""
         if self._client:
-            self._client.close()
+            while self._session_pool:
+                self._session_pool.pop().end_session()
+            self._release_client()
             self._client = None
+            self._client_key = None
             self._db = None
+        with self._prefetch_lock:
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown()
+                self._prefetch_executor = None
         self._is_connected = False
     
+    def _client_cache_key(self, uri: str) -> Optional[tuple]:
+        """Key for sharing a MongoClient, or None if options are unhashable."""
+        key = (uri, self.config.timeout, tuple(sorted(self._driver_extra().items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    @staticmethod
+    def _acquire_client(key: Optional[tuple]):
+        """Take a reference to the cached client for ``key``, if any."""
+        if not key:
+            return None
+        with MongoDB._client_cache_lock:
+            entry = MongoDB._client_cache.get(key)
+            if entry:
+                entry[1] += 1
+                return entry[0]
+        return None
+    
+    def _release_client(self) -> None:
+        """Drop this instance's reference, closing the client when unused."""
+        with MongoDB._client_cache_lock:
+            entry = MongoDB._client_cache.get(self._client_key)
+            if entry and entry[0] is self._client:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del MongoDB._client_cache[self._client_key]
+        self._client.close()
+    
+    def _shares_connections(self) -> bool:
+        return self._client_key is not None
+    
     def is_connected(self) -> bool:
         """Check connection."""
         if not self._client:
             return False
+        
+        # Answer from the driver's monitored topology when it has one
+        topology = self._client.topology_description
+        if topology.has_known_servers:
+            return topology.has_readable_server()
+        
         try:
             self._client.admin.command("ping")
             return True
@@ -116,7 +543,11 @@ class MongoDB(BaseAdapter):
         """Switch to different database."""
         self._db = self._client[database]
         self.config.database = database
+        self._coll_names_cache = None
+        self._columns_cache.clear()
+        self._index_cache.clear()
     
+    @_timed_query("Execute")
     def execute(
         self,
         query: str,
@@ -126,15 +557,13 @@ class MongoDB(BaseAdapter):
         Execute raw command.
         For MongoDB, use specific methods like insert, find, etc.
         """
-        start_time = time.time()
-        
         try:
             # Parse as MongoDB command
-            result = self._db.command(query)
+            result = self._db.command(query, session=self._session)
+            self._invalidate()
             
             return QueryResult(
-                data=[result] if isinstance(result, dict) else result,
-                execution_time=(time.time() - start_time) * 1000
+                data=[result] if isinstance(result, dict) else result
             )
         except Exception as e:
             raise QueryError(str(e), query=query)
@@ -147,39 +576,94 @@ class MongoDB(BaseAdapter):
         """Execute is not typical for MongoDB - use insert_many."""
         raise NotImplementedError("Use insert_many for batch operations")
     
+    @_timed_query("Insert")
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Insert document into collection."""
-        start_time = time.time()
+        collection = self._db[table]
+        result = collection.insert_one(data, session=self._session)
+        self._note_collection(table)
+        self._invalidate(table)
         
-        try:
-            collection = self._db[table]
-            result = collection.insert_one(data)
-            
-            return QueryResult(
-                data=[{"_id": result.inserted_id}],
-                last_id=str(result.inserted_id),
-                affected_rows=1,
-                execution_time=(time.time() - start_time) * 1000
+        return QueryResult(
+            data=[{"_id": result.inserted_id}],
+            last_id=str(result.inserted_id),
+            affected_rows=1
+        )
+    
+    @_timed_query("Insert many")
+    def insert_many(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        ordered: bool = False
+    ) -> QueryResult:
+        """
+        Insert multiple documents.
+        
+        Inserts are unordered by default so the server can apply them in
+        parallel and keep going past individual failures. With
+        ``fast_insert=True`` writes are not acknowledged, so errors are not
+        reported and ``affected_rows`` is the number of documents sent.
+        """
+        from pymongo import WriteConcern
+        
+        collection = self._db[table]
+        if self._fast_insert_w != 1:
+            collection = collection.with_options(
+                write_concern=WriteConcern(w=self._fast_insert_w)
             )
-        except Exception as e:
-            raise QueryError(f"Insert failed: {e}")
+        result = collection.insert_many(
+            data, ordered=ordered, session=self._session
+        )
+        self._note_collection(table)
+        self._invalidate(table)
+        
+        return QueryResult(
+            data=[{"_id": id} for id in result.inserted_ids],
+            affected_rows=len(result.inserted_ids)
+        )
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        """Insert multiple documents."""
-        start_time = time.time()
+    def insert_many_raw(
+        self,
+        table: str,
+        bson_buffers: List[bytes],
+        ordered: bool = False
+    ) -> QueryResult:
+        """
+        Insert documents that are already BSON-encoded.
         
-        try:
-            collection = self._db[table]
-            result = collection.insert_many(data)
-            
-            return QueryResult(
-                data=[{"_id": id} for id in result.inserted_ids],
-                affected_rows=len(result.inserted_ids),
-                execution_time=(time.time() - start_time) * 1000
+        Each buffer is wrapped in a ``RawBSONDocument`` and sent as-is, so
+        pymongo skips encoding. Documents without an ``_id`` get one from
+        the server and are reported with ``_id`` None.
+        """
+        from bson.raw_bson import RawBSONDocument
+        
+        return self.insert_many(
+            table,
+            [RawBSONDocument(buf) for buf in bson_buffers],
+            ordered=ordered
+        )
+    
+    def prepare_filter(self, template: Dict[str, Any], *param_names: str):
+        """
+        Pre-encode a filter that is reused with different values.
+        
+        Values in ``template`` equal to one of ``param_names`` are
+        placeholders; everything else is encoded once. The returned
+        callable takes the values positionally or by name and produces a
+        filter accepted by find, update, delete and count.
+        
+        Example:
+            by_user = db.prepare_filter(
+                {"user_id": "uid", "age": {"$gt": "min_age"}},
+                "uid", "min_age"
             )
-        except Exception as e:
-            raise QueryError(f"Insert many failed: {e}")
+            db.find("events", by_user(42, min_age=18))
+        """
+        self._import_driver()
+        return _FilterTemplate(template, param_names)
     
+    @_timed_query("Update")
     def update(
         self,
         table: str,
@@ -187,99 +671,205 @@ class MongoDB(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Update documents."""
-        start_time = time.time()
+        collection = self._db[table]
+        filter_query = where if where is not None else {}
+        update_query = {"$set": data}
         
-        try:
-            collection = self._db[table]
-            filter_query = where or {}
-            update_query = {"$set": data}
-            
-            result = collection.update_many(filter_query, update_query)
-            
-            return QueryResult(
-                affected_rows=result.modified_count,
-                execution_time=(time.time() - start_time) * 1000
-            )
-        except Exception as e:
-            raise QueryError(f"Update failed: {e}")
+        result = collection.update_many(
+            filter_query, update_query, session=self._session
+        )
+        self._invalidate(table)
+        
+        return QueryResult(
+            affected_rows=result.modified_count
+        )
     
+    @_timed_query("Delete")
     def delete(
         self,
         table: str,
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Delete documents."""
-        start_time = time.time()
+        collection = self._db[table]
+        filter_query = where if where is not None else {}
         
-        try:
-            collection = self._db[table]
-            filter_query = where or {}
-            
-            result = collection.delete_many(filter_query)
-            
-            return QueryResult(
-                affected_rows=result.deleted_count,
-                execution_time=(time.time() - start_time) * 1000
-            )
-        except Exception as e:
-            raise QueryError(f"Delete failed: {e}")
+        result = collection.delete_many(filter_query, session=self._session)
+        self._invalidate(table)
+        
+        return QueryResult(
+            affected_rows=result.deleted_count
+        )
     
+    @_timed_query("Find")
     def find(
         self,
         table: str,
         where: Optional[Dict[str, Any]] = None,
         columns: Optional[List[str]] = None,
-        order_by: Optional[str] = None,
+        order_by: Optional[Union[str, List[tuple]]] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        batch_size: Optional[int] = None
     ) -> QueryResult:
-        """Find documents."""
-        start_time = time.time()
+        """
+        Find documents.
+        
+        Args:
+            order_by: "field DESC, other ASC" or a list of
+                (field, direction) pairs passed to pymongo as-is
+            batch_size: Documents per server round-trip
+                (defaults to DEFAULT_BATCH_SIZE, capped at ``limit``)
+        
+        With ``result_cache_size`` set, identical reads are answered from
+        memory until this adapter writes to the collection. Writes made by
+        other clients are not seen until then. Use ``find_iter`` to stream
+        large results instead of building a list.
+        """
+        filter_query = where if where is not None else {}
+        projection = self._projection(columns)
+        
+        cache_key = self._cache_key(table, {
+            "f": filter_query, "p": projection, "s": order_by,
+            "l": limit, "o": offset,
+        })
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        cursor = self._find_cursor(
+            table, filter_query, projection, order_by, limit, offset, batch_size
+        )
+        result = QueryResult(data=list(cursor))
+        self._cache_put(cache_key, result)
+        return result
+    
+    def find_iter(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[Union[str, List[tuple]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream documents, holding one cursor batch in memory at a time.
         
+        Takes the same arguments as ``find``; results are not cached.
+        """
         try:
-            collection = self._db[table]
-            filter_query = where or {}
-            
-            # Projection
-            projection = None
-            if columns:
-                projection = {col: 1 for col in columns}
-            
-            cursor = collection.find(filter_query, projection)
-            
-            # Sort
-            if order_by:
-                # Parse "field DESC" or "field ASC"
-                parts = order_by.split()
-                field = parts[0]
-                direction = -1 if len(parts) > 1 and parts[1].upper() == "DESC" else 1
-                cursor = cursor.sort(field, direction)
-            
-            # Pagination
-            if offset:
-                cursor = cursor.skip(offset)
-            if limit:
-                cursor = cursor.limit(limit)
-            
-            # Convert to list
-            data = []
-            for doc in cursor:
-                # Convert ObjectId to string
-                if "_id" in doc:
-                    doc["_id"] = str(doc["_id"])
-                data.append(doc)
-            
-            return QueryResult(
-                data=data,
-                execution_time=(time.time() - start_time) * 1000
+            cursor = self._find_cursor(
+                table, where if where is not None else {}, self._projection(columns),
+                order_by, limit, offset, batch_size
             )
+            yield from cursor
+        except GeneratorExit:
+            raise
         except Exception as e:
             raise QueryError(f"Find failed: {e}")
     
+    @staticmethod
+    def _projection(columns: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        # "*" means all fields, same as no projection
+        if columns and columns != ["*"]:
+            return dict.fromkeys(columns, 1)
+        return None
+    
+    def _find_cursor(
+        self,
+        table: str,
+        filter_query: Dict[str, Any],
+        projection: Optional[Dict[str, int]],
+        order_by: Optional[Union[str, List[tuple]]],
+        limit: Optional[int],
+        offset: Optional[int],
+        batch_size: Optional[int]
+    ):
+        """pymongo cursor for a find() call."""
+        collection = self._db[table]
+        
+        # Decode straight into _LazyDoc so _id is only converted if read
+        collection = collection.with_options(
+            codec_options=collection.codec_options.with_options(
+                document_class=_LazyDoc
+            )
+        )
+        cursor = collection.find(
+            filter_query, projection, session=self._session
+        )
+        
+        batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        if limit:
+            batch_size = min(batch_size, limit)
+        cursor = cursor.batch_size(batch_size)
+        
+        # Sort
+        if order_by:
+            if isinstance(order_by, str):
+                order_by = self._parse_order_by(order_by)
+            cursor = cursor.sort(list(order_by))
+        
+        # Pagination
+        if offset:
+            if offset > self.DEEP_OFFSET_WARNING:
+                import logging
+                logging.getLogger("onedb").warning(
+                    f"find() on '{table}' skips {offset} documents server-side; "
+                    f"use find_after() for deep pagination"
+                )
+            cursor = cursor.skip(offset)
+        if limit:
+            cursor = cursor.limit(limit)
+        return cursor
+    
+    def find_after(
+        self,
+        table: str,
+        order_by_field: str,
+        last_value: Any,
+        limit: int,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        descending: bool = False
+    ) -> QueryResult:
+        """
+        Seek-based pagination on ``order_by_field``.
+        
+        Returns up to ``limit`` documents ordered by the field, starting
+        after ``last_value`` (pass None for the first page). With an index
+        on the field the server seeks straight to the boundary instead of
+        skipping over earlier pages.
+        
+        Example:
+            page = db.find_after("events", "_id", None, 100)
+            while page.data:
+                last = page.data[-1]["_id"]
+                page = db.find_after("events", "_id", ObjectId(last), 100)
+        """
+        filter_query = dict(where) if where else {}
+        if last_value is not None:
+            seek = {"$lt" if descending else "$gt": last_value}
+            if order_by_field in filter_query:
+                filter_query = {"$and": [filter_query, {order_by_field: seek}]}
+            else:
+                filter_query[order_by_field] = seek
+        
+        return self.find(
+            table,
+            filter_query,
+            columns=columns,
+            order_by=[(order_by_field, -1 if descending else 1)],
+            limit=limit
+        )
+    
+    @_timed_query("Aggregation")
     def aggregate(
         self, 
         table: str, 
-        pipeline: List[Dict[str, Any]]
+        pipeline: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
     ) -> QueryResult:
         """
         Run aggregation pipeline.
@@ -295,33 +885,38 @@ class MongoDB(BaseAdapter):
                 {"$limit": 10}
             ])
         """
-        start_time = time.time()
+        cache_key = self._cache_key(table, {"a": pipeline})
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
-        try:
-            collection = self._db[table]
-            cursor = collection.aggregate(pipeline)
-            
-            data = []
-            for doc in cursor:
-                if "_id" in doc and hasattr(doc["_id"], "__str__"):
-                    doc["_id"] = str(doc["_id"])
-                data.append(doc)
-            
-            return QueryResult(
-                data=data,
-                execution_time=(time.time() - start_time) * 1000
-            )
-        except Exception as e:
-            raise QueryError(f"Aggregation failed: {e}")
+        collection = self._db[table]
+        batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        cursor = collection.aggregate(
+            pipeline, batchSize=batch_size, session=self._session
+        )
+        
+        result = QueryResult(data=self._drain_prefetched(cursor, batch_size))
+        self._cache_put(cache_key, result)
+        return result
     
     def count(
         self, 
         table: str, 
         where: Optional[Dict[str, Any]] = None
     ) -> int:
-        """Count documents."""
+        """
+        Count documents.
+        
+        Without a filter the count is read from collection metadata via
+        ``estimated_document_count``, which avoids scanning the collection
+        but may be slightly off under concurrent writes or after an
+        unclean shutdown.
+        """
         collection = self._db[table]
-        return collection.count_documents(where or {})
+        if not where and not self._session:
+            return collection.estimated_document_count()
+        return collection.count_documents(where or {}, session=self._session)
     
     def create_index(
         self, 
@@ -329,13 +924,35 @@ class MongoDB(BaseAdapter):
         keys: Union[str, List[tuple]],
         unique: bool = False
     ) -> str:
-        """Create index on collection."""
+        """
+        Create index on collection.
+        
+        Existing indexes are read once per collection; declaring an index
+        that already exists with the same options returns its name without
+        a round-trip.
+        """
         collection = self._db[table]
-        return collection.create_index(keys, unique=unique)
+        key_list = [(keys, 1)] if isinstance(keys, str) else list(keys)
+        expected_name = "_".join(f"{field}_{direction}" for field, direction in key_list)
+        
+        indexes = self._index_cache.get(table)
+        if indexes is None:
+            indexes = self._index_cache[table] = collection.index_information()
+        existing = indexes.get(expected_name)
+        if existing is not None and bool(existing.get("unique")) == unique:
+            return expected_name
+        
+        name = collection.create_index(keys, unique=unique)
+        indexes[name] = {"key": key_list, "unique": unique}
+        self._note_collection(table)
+        return name
     
     def begin_transaction(self) -> None:
         """Start session/transaction."""
-        self._session = self._client.start_session()
+        if self._session_pool:
+            self._session = self._session_pool.pop()
+        else:
+            self._session = self._client.start_session()
         self._session.start_transaction()
         self._in_transaction = True
     
@@ -343,35 +960,82 @@ class MongoDB(BaseAdapter):
         """Commit transaction."""
         if self._session:
             self._session.commit_transaction()
-            self._session.end_session()
-            self._session = None
+            self._release_session()
         self._in_transaction = False
     
     def rollback(self) -> None:
         """Abort transaction."""
         if self._session:
             self._session.abort_transaction()
-            self._session.end_session()
-            self._session = None
+            self._invalidate()
+            self._release_session()
         self._in_transaction = False
     
+    def _release_session(self) -> None:
+        """Return the finished transaction's session to the pool."""
+        if len(self._session_pool) < self.SESSION_POOL_SIZE:
+            self._session_pool.append(self._session)
+        else:
+            self._session.end_session()
+        self._session = None
+    
+    def _get_collection_names(self) -> frozenset:
+        """Collection names, refreshed at most every COLLECTION_NAMES_TTL seconds."""
+        cached = self._coll_names_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < self.COLLECTION_NAMES_TTL:
+            return cached[1]
+        names = frozenset(self._db.list_collection_names())
+        self._coll_names_cache = (now, names)
+        return names
+    
+    def _note_collection(self, table: str) -> None:
+        """Invalidate the names cache if a write created a new collection."""
+        cached = self._coll_names_cache
+        if cached and table not in cached[1]:
+            self._coll_names_cache = None
+    
     def get_tables(self) -> List[str]:
         """Get collection names."""
-        return self._db.list_collection_names()
+        return list(self._get_collection_names())
     
     def get_columns(self, table: str) -> List[Dict[str, Any]]:
-        """Get sample document fields (schema-less)."""
+        """
+        Get document fields (schema-less).
+        
+        Fields are the union over a ``$sample`` of SCHEMA_SAMPLE_SIZE
+        documents, computed server-side in one aggregation.
+        """
+        cached = self._columns_cache.get(table)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.COLUMNS_CACHE_TTL:
+            return list(cached[1])
+        
         collection = self._db[table]
-        sample = collection.find_one()
+        fields = collection.aggregate([
+            {"$sample": {"size": self.SCHEMA_SAMPLE_SIZE}},
+            {"$project": {"kv": {"$objectToArray": "$$ROOT"}}},
+            {"$unwind": "$kv"},
+            {"$group": {"_id": "$kv.k", "t": {"$first": {"$type": "$kv.v"}}}},
+            {"$sort": {"_id": 1}},
+        ], session=self._session)
         
-        if not sample:
-            return []
+        type_name = _BSON_TYPE_NAMES.get
+        columns = []
+        for field in fields:
+            column = {
+                "column_name": field["_id"],
+                "data_type": type_name(field["t"], field["t"]),
+            }
+            # Keep _id first, where it sits in every document
+            if field["_id"] == "_id":
+                columns.insert(0, column)
+            else:
+                columns.append(column)
         
-        return [
-            {"column_name": key, "data_type": type(value).__name__}
-            for key, value in sample.items()
-        ]
+        self._columns_cache[table] = (now, columns)
+        return list(columns)
     
     def table_exists(self, table: str) -> bool:
         """Check if collection exists."""
-        return table in self._db.list_collection_names()
+        return table in self._get_collection_names()
@@ -87,7 +87,7 @@ class MySQL(BaseAdapter):
                 conn_params["ssl"] = {"ssl": True}
             
             # Add extra parameters
-            conn_params.update(self.config.extra)
+            conn_params.update(self._driver_extra())
             
             # Remove None values
             conn_params = {k: v for k, v in conn_params.items() if v is not None}
@@ -223,6 +223,7 @@ class MySQL(BaseAdapter):
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Insert single record."""
+        self._invalidate_tables(table)
         columns = list(data.keys())
         placeholders = ", ".join(["%s"] * len(columns))
         columns_str = ", ".join(f"`{col}`" for col in columns)
@@ -233,6 +234,7 @@ class MySQL(BaseAdapter):
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
         """Insert multiple records."""
+        self._invalidate_tables(table)
         if not data:
             return QueryResult()
         
@@ -252,6 +254,7 @@ class MySQL(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Update records."""
+        self._invalidate_tables(table)
         set_parts = []
         values = []
         
@@ -279,6 +282,7 @@ class MySQL(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Delete records."""
+        self._invalidate_tables(table)
         query = f"DELETE FROM `{table}`"
         values = []
         
@@ -336,7 +340,7 @@ class MySQL(BaseAdapter):
         if offset is not None:
             query += f" OFFSET {int(offset)}"
         
-        return self.execute(query, values if values else None)
+        return self._cached_execute(query, values if values else None)
     
     def find_one(
         self,
@@ -3,10 +3,199 @@ Neo4j Graph Database Adapter.
 """
 
 from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from threading import Lock
+import asyncio
+import re
 import time
 
-from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
-from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
+from ..core.base import (
+    BaseAdapter, AsyncBaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+)
+from ..exceptions import (
+    ConnectionError, QueryError, DriverNotInstalledError, ValidationError
+)
+
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_WRITE_CLAUSE_RE = re.compile(
+    r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP|FOREACH|LOAD\s+CSV)\b", re.IGNORECASE
+)
+# Any CALL except these read-only procedures may write (subqueries included)
+_WRITE_CALL_RE = re.compile(
+    r"\bCALL\b(?!\s*(?:db\.(?:labels|relationshipTypes|propertyKeys|indexes|constraints"
+    r"|schema\.\w+)|apoc\.meta\.stats)\s*\()",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=256)
+def _is_read_query(query: str) -> bool:
+    """True if the statement has no write clauses and only calls read-only procedures."""
+    return not (_WRITE_CLAUSE_RE.search(query) or _WRITE_CALL_RE.search(query))
+
+
+def _check_identifier(name: str, kind: str = "label") -> str:
+    """Reject labels/types that cannot be safely spliced into Cypher."""
+    if not isinstance(name, str) or not _IDENTIFIER_RE.fullmatch(name):
+        raise ValidationError(f"Invalid Neo4j {kind}: {name!r}", field=kind)
+    return name
+
+
+def _label(name: str, kind: str = "label") -> str:
+    """Validated, backtick-quoted label or relationship type."""
+    return f"`{_check_identifier(name, kind)}`"
+
+
+def _prop_map(keys, param_prefix: str = "") -> str:
+    """``{k: $<prefix>k, ...}`` body for validated property names."""
+    return ", ".join([
+        f"{_check_identifier(k, 'property')}: ${param_prefix}{k}" for k in keys
+    ])
+
+
+# Cypher templates depend only on the label and property-name shape of a
+# call, so they are built (and their identifiers validated) once per shape.
+
+@lru_cache(maxsize=1024)
+def _insert_template(table: str, keys: tuple) -> str:
+    return f"CREATE (n:{_label(table)} {{{_prop_map(keys)}}}) RETURN n, id(n) as node_id"
+
+
+@lru_cache(maxsize=1024)
+def _update_template(table: str, set_keys: tuple, where_keys: tuple) -> str:
+    if where_keys:
+        match_clause = f"MATCH (n:{_label(table)} {{{_prop_map(where_keys, 'where_')}}})"
+    else:
+        match_clause = f"MATCH (n:{_label(table)})"
+    set_clause = "SET " + ", ".join([
+        f"n.{_check_identifier(k, 'property')} = $set_{k}" for k in set_keys
+    ])
+    return f"{match_clause} {set_clause} RETURN n"
+
+
+@lru_cache(maxsize=1024)
+def _delete_template(table: str, where_keys: tuple) -> str:
+    if where_keys:
+        return f"MATCH (n:{_label(table)} {{{_prop_map(where_keys)}}}) DETACH DELETE n"
+    return f"MATCH (n:{_label(table)}) DETACH DELETE n"
+
+
+_FIND_QUERY = "MATCH (n:{label}{props}) RETURN {ret}{order}"
+
+
+@lru_cache(maxsize=256)
+def _parse_order_by(order_by: str) -> tuple:
+    """Split ``"prop [ASC|DESC]"`` into a validated ``(prop, direction)``."""
+    parts = order_by.split()
+    prop = _check_identifier(parts[0], "property")
+    direction = parts[1].upper() if len(parts) > 1 else "ASC"
+    if direction not in ("ASC", "DESC"):
+        raise ValidationError(f"Invalid sort direction: {parts[1]!r}", field="order_by")
+    return prop, direction
+
+
+@lru_cache(maxsize=1024)
+def _find_template(
+    table: str,
+    where_keys: tuple,
+    columns: Optional[tuple],
+    order_by: Optional[str]
+) -> str:
+    """MATCH/RETURN/ORDER BY part of a find() query; SKIP/LIMIT are appended per call."""
+    if columns:
+        ret = ", ".join([
+            f"n.{col} as {col}" for col in (_check_identifier(c, "property") for c in columns)
+        ])
+    else:
+        ret = "n"
+    
+    return _FIND_QUERY.format_map({
+        "label": _label(table),
+        "props": f" {{{_prop_map(where_keys)}}}" if where_keys else "",
+        "ret": ret,
+        "order": " ORDER BY n.{} {}".format(*_parse_order_by(order_by)) if order_by else "",
+    })
+
+
+@lru_cache(maxsize=1024)
+def _prefixed_keys(prefix: str, keys: tuple) -> tuple:
+    return tuple([prefix + k for k in keys])
+
+
+def _prefixed(prefix: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy ``values`` with every key prefixed, e.g. ``{"from_name": ...}``."""
+    return dict(zip(_prefixed_keys(prefix, tuple(values)), values.values()))
+
+
+def _normalize_params(params: Optional[Union[tuple, dict]]) -> Dict[str, Any]:
+    """Turn positional params into ``$p0, $p1, ...`` parameters."""
+    if isinstance(params, tuple):
+        return {f"p{i}": v for i, v in enumerate(params)}
+    return params or {}
+
+
+def _affected(counters) -> int:
+    return (
+        counters.nodes_created +
+        counters.nodes_deleted +
+        counters.relationships_created +
+        counters.relationships_deleted +
+        counters.properties_set
+    )
+
+
+def _convert_value(value: Any) -> Any:
+    """Convert a Neo4j value into plain Python data."""
+    # Handle Neo4j Node objects
+    if hasattr(value, 'items'):
+        return dict(value.items())
+    if hasattr(value, '_properties'):
+        return dict(value._properties)
+    return value
+
+
+def _value_converter(value: Any):
+    """
+    Pick the converter for a column from its first value; None means the
+    column is returned as-is.
+    """
+    if value is None or hasattr(value, 'items') or hasattr(value, '_properties'):
+        return _convert_value
+    return None
+
+
+def _quote(name: str) -> str:
+    """Backtick-quote a label or relationship type read from the database."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _count_store_queries(labels: List[str], rel_types: List[str]) -> tuple:
+    """
+    One statement each for per-label and per-type counts. Every branch is a
+    single-label (or single-type) count, which Neo4j answers from its count
+    store instead of scanning.
+    """
+    label_query = " UNION ALL ".join(
+        f"MATCH (n:{_quote(label)}) RETURN {i} AS i, count(n) AS count"
+        for i, label in enumerate(labels)
+    )
+    rel_query = " UNION ALL ".join(
+        f"MATCH ()-[r:{_quote(rel_type)}]->() RETURN {i} AS i, count(r) AS count"
+        for i, rel_type in enumerate(rel_types)
+    )
+    return label_query, rel_query
+
+
+def _indexed_counts(names: List[str], rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    return {names[row["i"]]: row["count"] for row in rows}
+
+
+_APOC_STATS_QUERY = (
+    "CALL apoc.meta.stats() YIELD nodeCount, relCount, labels, relTypesCount "
+    "RETURN nodeCount, relCount, labels, relTypesCount"
+)
 
 
 class Neo4j(BaseAdapter):
@@ -43,14 +232,35 @@ class Neo4j(BaseAdapter):
             RETURN friend.name as friend_name
         ''', {"name": "John"})
     
+    Pool tuning (via ``extra``):
+        max_connection_pool_size: Bolt connections per driver (default 100)
+        connection_acquisition_timeout: Seconds to wait for a free
+            connection before failing (default 60)
+        
+        Concurrent queries in flight are bounded by
+        processes x max_connection_pool_size; size the pool to the number
+        of workers issuing queries from each process.
+    
     Install:
         pip install onedb[neo4j]
+        pip install onedb[neo4j-fast]  # adds the Rust PackStream codec
     """
     
     db_type = DatabaseType.NEO4J
     driver_name = "neo4j"
     install_command = "pip install onedb[neo4j]"
     
+    # Rows per write transaction in insert_many / create_relationships_many
+    INSERT_MANY_BATCH_SIZE = 10000
+    RELATIONSHIP_BATCH_SIZE = 10000
+    
+    # Parameter sets per pipelined transaction in execute_many
+    EXECUTE_MANY_BATCH_SIZE = 10000
+    
+    # Drivers shared across instances: key -> [driver, refcount]
+    _driver_cache: Dict[tuple, list] = {}
+    _driver_cache_lock = Lock()
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         if self.config.port is None:
@@ -58,63 +268,168 @@ class Neo4j(BaseAdapter):
         if self.config.database is None:
             self.config.database = "neo4j"
         self._driver = None
+        self._driver_key = None
         self._session = None
+        self._transaction = None
+        self._execute_query = None
+        self._has_apoc = None
+    
+    # Whether neo4j-rust-ext is installed; checked on first driver import
+    _rust_ext = None
     
     def _import_driver(self):
         try:
             from neo4j import GraphDatabase
-            return GraphDatabase
         except ImportError:
             raise DriverNotInstalledError("neo4j", self.install_command)
+        
+        if Neo4j._rust_ext is None:
+            from importlib.metadata import PackageNotFoundError, version
+            try:
+                version("neo4j-rust-ext")
+                Neo4j._rust_ext = True
+            except PackageNotFoundError:
+                Neo4j._rust_ext = False
+            import logging
+            logging.getLogger("onedb").debug(
+                "Neo4j PackStream codec: "
+                + ("Rust (neo4j-rust-ext)" if Neo4j._rust_ext else "pure Python")
+            )
+        return GraphDatabase
+    
+    def _driver_params(self) -> Dict[str, Any]:
+        """Arguments shared by the sync and async driver constructors."""
+        auth = None
+        if self.config.user and self.config.password:
+            auth = (self.config.user, self.config.password)
+        
+        extra = self.config.extra
+        return {
+            "uri": f"bolt://{self.config.host}:{self.config.port}",
+            "auth": auth,
+            "connection_timeout": self.config.timeout,
+            "max_connection_pool_size": int(extra.get("max_connection_pool_size", 100)),
+            "connection_acquisition_timeout": float(
+                extra.get("connection_acquisition_timeout", 60.0)
+            ),
+            "keep_alive": True,
+            "liveness_check_timeout": float(extra.get("liveness_check_timeout", 30.0)),
+        }
+    
+    def _connection_error(self, e: Exception) -> ConnectionError:
+        """Translate a driver error raised while connecting."""
+        from neo4j.exceptions import AuthError, ServiceUnavailable
+        
+        if isinstance(e, AuthError):
+            message = f"Neo4j rejected the credentials for user {self.config.user!r}: {e}"
+        elif isinstance(e, ServiceUnavailable):
+            message = f"Neo4j server is unreachable: {e}"
+        else:
+            message = f"Failed to connect to Neo4j: {e}"
+        return ConnectionError(
+            message,
+            host=self.config.host,
+            port=self.config.port,
+            database=self.config.database
+        )
     
     def connect(self) -> None:
         GraphDatabase = self._import_driver()
         
-        try:
-            uri = f"bolt://{self.config.host}:{self.config.port}"
-            
-            auth = None
-            if self.config.user and self.config.password:
-                auth = (self.config.user, self.config.password)
-            
-            self._driver = GraphDatabase.driver(
-                uri, 
-                auth=auth,
-                connection_timeout=self.config.timeout
-            )
-            
-            # Test connection
-            with self._driver.session(database=self.config.database) as session:
-                session.run("RETURN 1")
-            
-            self._is_connected = True
+        params = self._driver_params()
+        key = tuple(sorted(params.items()))
+        
+        with Neo4j._driver_cache_lock:
+            entry = Neo4j._driver_cache.get(key)
+            if entry:
+                entry[1] += 1
+        
+        if entry:
+            driver = entry[0]
+        else:
+            # Created and verified outside the lock, so an unreachable server
+            # does not stall connect()/disconnect() of other instances
+            try:
+                driver = GraphDatabase.driver(**params)
+                
+                # Test connection
+                try:
+                    driver.verify_connectivity()
+                except Exception:
+                    driver.close()
+                    raise
+            except Exception as e:
+                raise self._connection_error(e)
             
-        except Exception as e:
-            raise ConnectionError(
-                f"Failed to connect to Neo4j: {e}",
-                host=self.config.host,
-                port=self.config.port,
-                database=self.config.database
-            )
+            with Neo4j._driver_cache_lock:
+                entry = Neo4j._driver_cache.get(key)
+                if entry:
+                    entry[1] += 1
+                else:
+                    Neo4j._driver_cache[key] = [driver, 1]
+            if entry:
+                # Another thread cached a driver first; use that one
+                driver.close()
+                driver = entry[0]
+        
+        self._driver = driver
+        self._driver_key = key
+        self._execute_query = partial(
+            self._driver.execute_query, database_=self.config.database
+        )
+        self._is_connected = True
     
     def disconnect(self) -> None:
         if self._session:
             self._session.close()
             self._session = None
         if self._driver:
-            self._driver.close()
+            self._release_driver()
             self._driver = None
+            self._driver_key = None
+            self._execute_query = None
         self._is_connected = False
     
+    def _release_driver(self) -> None:
+        """Drop this instance's reference, closing the driver when unused."""
+        with Neo4j._driver_cache_lock:
+            entry = Neo4j._driver_cache.get(self._driver_key)
+            if entry and entry[0] is self._driver:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del Neo4j._driver_cache[self._driver_key]
+        self._driver.close()
+    
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every shared driver, e.g. at application shutdown."""
+        with Neo4j._driver_cache_lock:
+            entries = list(Neo4j._driver_cache.values())
+            Neo4j._driver_cache.clear()
+        for driver, _ in entries:
+            driver.close()
+    
+    def _shares_connections(self) -> bool:
+        return self._driver_key is not None
+    
     def is_connected(self) -> bool:
+        """
+        Return the cached connection state without a round-trip.
+        
+        Pooled connections idle for longer than ``liveness_check_timeout``
+        are revalidated by the driver on checkout; use ``ping()`` for an
+        explicit check.
+        """
+        return self._is_connected and self._driver is not None
+    
+    def ping(self) -> bool:
+        """Check that the server is reachable."""
         try:
-            if self._driver:
-                with self._driver.session(database=self.config.database) as session:
-                    session.run("RETURN 1")
-                return True
+            self._driver.verify_connectivity()
+            return True
         except Exception:
-            pass
-        return False
+            return False
     
     def execute(
         self,
@@ -124,6 +439,10 @@ class Neo4j(BaseAdapter):
         """
         Execute Cypher query.
         
+        Outside a transaction the statement goes through the driver's
+        ``execute_query``, routed to readers when it contains no write
+        clauses. Inside one it runs on the open transaction.
+        
         Args:
             query: Cypher query string
             params: Query parameters (dict recommended)
@@ -131,82 +450,125 @@ class Neo4j(BaseAdapter):
         Returns:
             QueryResult with data
         """
+        return self._execute(query, params)
+    
+    def _execute(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None,
+        raw: bool = False
+    ) -> QueryResult:
+        """Run a statement; ``raw`` skips value conversion for scalar-only results."""
         start_time = time.time()
         
         try:
-            with self._driver.session(database=self.config.database) as session:
-                # Convert tuple params to dict if needed
-                if params and isinstance(params, tuple):
-                    params = {f"p{i}": v for i, v in enumerate(params)}
-                
-                result = session.run(query, params or {})
-                
-                # Collect all records
-                records = []
-                for record in result:
-                    # Convert Neo4j record to dict
-                    record_dict = {}
-                    for key in record.keys():
-                        value = record[key]
-                        # Handle Neo4j Node objects
-                        if hasattr(value, 'items'):
-                            record_dict[key] = dict(value.items())
-                        elif hasattr(value, '_properties'):
-                            record_dict[key] = dict(value._properties)
-                        else:
-                            record_dict[key] = value
-                    records.append(record_dict)
-                
-                # Get summary
-                summary = result.consume()
-                
-                query_result = QueryResult()
-                query_result.data = records
-                
-                if records:
-                    query_result.columns = list(records[0].keys())
-                
-                # Calculate affected rows from counters
-                counters = summary.counters
-                query_result.affected_rows = (
-                    counters.nodes_created +
-                    counters.nodes_deleted +
-                    counters.relationships_created +
-                    counters.relationships_deleted +
-                    counters.properties_set
-                ) or len(records)
-                
-                query_result.execution_time = (time.time() - start_time) * 1000
-                return query_result
+            params = _normalize_params(params)
+            is_read = _is_read_query(query)
+            
+            if self._transaction:
+                result = self._transaction.run(query, params)
+                raw_records = list(result)
+                # Reads have no counters worth fetching a summary for
+                summary = None if is_read else result.consume()
+            else:
+                raw_records, summary, _ = self._execute_query(
+                    query,
+                    params,
+                    routing_="r" if is_read else "w"
+                )
+                if is_read:
+                    summary = None
+            
+            query_result = self._build_result(raw_records, summary, raw)
+            query_result.execution_time = (time.time() - start_time) * 1000
+            return query_result
                 
         except Exception as e:
             raise QueryError(str(e), query=query, params=params)
     
+    @staticmethod
+    def _build_result(raw_records, summary, raw: bool = False) -> QueryResult:
+        """
+        Convert driver records and summary into a QueryResult.
+        
+        ``summary`` is None for read-only statements, whose affected_rows
+        is simply the number of records returned.
+        
+        Converters are chosen per column from the first record, so later
+        rows skip the per-value type checks; columns holding only scalars
+        are copied with ``dict(record)``. With ``raw`` every record is
+        copied that way without inspection.
+        """
+        records = []
+        if raw:
+            records = [dict(record) for record in raw_records]
+        elif raw_records:
+            first = raw_records[0]
+            keys = first.keys()
+            converters = [_value_converter(first[key]) for key in keys]
+            
+            if not any(converters):
+                records = [dict(record) for record in raw_records]
+            else:
+                columns = [
+                    (index, key, conv) for index, (key, conv) in enumerate(zip(keys, converters))
+                ]
+                for record in raw_records:
+                    records.append({
+                        key: conv(record[index]) if conv else record[index]
+                        for index, key, conv in columns
+                    })
+        
+        query_result = QueryResult()
+        query_result.data = records
+        
+        if records:
+            query_result.columns = list(records[0].keys())
+        
+        # Calculate affected rows from counters
+        if summary is None:
+            query_result.affected_rows = len(records)
+        else:
+            query_result.affected_rows = _affected(summary.counters) or len(records)
+        
+        return query_result
+    
     def execute_many(
         self,
         query: str,
         params_list: List[Union[tuple, dict]]
     ) -> QueryResult:
-        """Execute query with multiple parameter sets."""
+        """
+        Execute query with multiple parameter sets.
+        
+        Statements are issued back to back inside one transaction per
+        EXECUTE_MANY_BATCH_SIZE parameter sets, and their summaries are
+        collected afterwards, so the driver does not wait for each result
+        before sending the next statement.
+        """
         start_time = time.time()
+        
+        def run_batch(tx, batch):
+            results = [tx.run(query, _normalize_params(params)) for params in batch]
+            return sum(_affected(result.consume().counters) or 1 for result in results)
+        
+        batch_size = self.EXECUTE_MANY_BATCH_SIZE
         total_affected = 0
         
-        with self._driver.session(database=self.config.database) as session:
-            for params in params_list:
-                if isinstance(params, tuple):
-                    params = {f"p{i}": v for i, v in enumerate(params)}
-                
-                result = session.run(query, params)
-                summary = result.consume()
-                
-                counters = summary.counters
-                total_affected += (
-                    counters.nodes_created +
-                    counters.nodes_deleted +
-                    counters.relationships_created +
-                    counters.relationships_deleted +
-                    counters.properties_set
-                ) or 1
+        try:
+            if self._transaction:
+                total_affected = run_batch(self._transaction, params_list)
+            else:
+                with self._driver.session(database=self.config.database) as session:
+                    # Managed transactions retry transient errors; reads may
+                    # be routed to followers in a cluster.
+                    work = session.execute_read if _is_read_query(query) else session.execute_write
+                    for start in range(0, len(params_list), batch_size):
+                        total_affected += work(
+                            run_batch, params_list[start:start + batch_size]
+                        )
+        except Exception as e:
+            raise QueryError(str(e), query=query)
         
         query_result = QueryResult(affected_rows=total_affected)
         query_result.execution_time = (time.time() - start_time) * 1000
@@ -223,10 +585,7 @@ class Neo4j(BaseAdapter):
         Returns:
             QueryResult with created node
         """
-        # Build property string
-        props = ", ".join([f"{k}: ${k}" for k in data.keys()])
-        
-        query = f"CREATE (n:{table} {{{props}}}) RETURN n, id(n) as node_id"
+        query = _insert_template(table, tuple(data))
         
         result = self.execute(query, data)
         
@@ -236,22 +595,42 @@ class Neo4j(BaseAdapter):
         return result
     
     def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        """Create multiple nodes."""
+        """
+        Create multiple nodes.
+        
+        Rows are sent as one list parameter per INSERT_MANY_BATCH_SIZE and
+        created by a single ``UNWIND`` statement in one write transaction
+        per batch, all on one session. Inside begin_transaction() they are
+        written on the open transaction instead.
+        """
         start_time = time.time()
+        query = self._insert_many_query(table)
+        batch_size = self.INSERT_MANY_BATCH_SIZE
         total_created = 0
         
-        with self._driver.session(database=self.config.database) as session:
-            for item in data:
-                props = ", ".join([f"{k}: ${k}" for k in item.keys()])
-                query = f"CREATE (n:{table} {{{props}}})"
-                result = session.run(query, item)
-                summary = result.consume()
-                total_created += summary.counters.nodes_created
+        try:
+            if self._transaction:
+                summary = self._transaction.run(query, rows=data).consume()
+                total_created = summary.counters.nodes_created
+            else:
+                with self._driver.session(database=self.config.database) as session:
+                    for start in range(0, len(data), batch_size):
+                        chunk = data[start:start + batch_size]
+                        summary = session.execute_write(
+                            lambda tx: tx.run(query, rows=chunk).consume()
+                        )
+                        total_created += summary.counters.nodes_created
+        except Exception as e:
+            raise QueryError(str(e), query=query)
         
         query_result = QueryResult(affected_rows=total_created)
         query_result.execution_time = (time.time() - start_time) * 1000
         return query_result
     
+    @staticmethod
+    def _insert_many_query(table: str) -> str:
+        return f"UNWIND $rows AS row CREATE (n:{_label(table)}) SET n = row"
+    
     def update(
         self,
         table: str,
@@ -266,26 +645,11 @@ class Neo4j(BaseAdapter):
             data: Properties to update
             where: Match conditions
         """
-        # Build MATCH clause
-        if where:
-            match_props = ", ".join([f"{k}: $where_{k}" for k in where.keys()])
-            match_clause = f"MATCH (n:{table} {{{match_props}}})"
-        else:
-            match_clause = f"MATCH (n:{table})"
-        
-        # Build SET clause
-        set_parts = [f"n.{k} = $set_{k}" for k in data.keys()]
-        set_clause = "SET " + ", ".join(set_parts)
-        
-        query = f"{match_clause} {set_clause} RETURN n"
+        query = _update_template(table, tuple(data), tuple(where) if where else ())
         
         # Prepare params with prefixes
-        params = {}
-        if where:
-            for k, v in where.items():
-                params[f"where_{k}"] = v
-        for k, v in data.items():
-            params[f"set_{k}"] = v
+        params = _prefixed("where_", where) if where else {}
+        params.update(_prefixed("set_", data))
         
         return self.execute(query, params)
     
@@ -301,15 +665,8 @@ class Neo4j(BaseAdapter):
             table: Node label
             where: Match conditions (if None, deletes ALL nodes with label!)
         """
-        if where:
-            match_props = ", ".join([f"{k}: ${k}" for k in where.keys()])
-            query = f"MATCH (n:{table} {{{match_props}}}) DETACH DELETE n"
-            params = where
-        else:
-            query = f"MATCH (n:{table}) DETACH DELETE n"
-            params = None
-        
-        return self.execute(query, params)
+        query = _delete_template(table, tuple(where) if where else ())
+        return self.execute(query, where or None)
     
     def find(
         self,
@@ -331,37 +688,66 @@ class Neo4j(BaseAdapter):
             limit: Maximum results
             offset: Skip results
         """
-        # Build MATCH clause
-        if where:
-            match_props = ", ".join([f"{k}: ${k}" for k in where.keys()])
-            query = f"MATCH (n:{table} {{{match_props}}})"
-            params = where
-        else:
-            query = f"MATCH (n:{table})"
-            params = {}
-        
-        # Build RETURN clause
-        if columns:
-            return_parts = [f"n.{col} as {col}" for col in columns]
-            query += f" RETURN {', '.join(return_parts)}"
-        else:
-            query += " RETURN n"
+        query, params = self._find_query(table, where, columns, order_by, limit, offset)
+        # Projected columns are always property values, never nodes
+        return self._execute(query, params if params else None, raw=bool(columns))
+    
+    def find_df(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ):
+        """
+        Like find(), but return a pandas DataFrame built by the driver.
         
-        # ORDER BY
-        if order_by:
-            parts = order_by.split()
-            prop = parts[0]
-            direction = parts[1].upper() if len(parts) > 1 else "ASC"
-            query += f" ORDER BY n.{prop} {direction}"
+        Requires pandas. Without ``columns`` each row holds a node, which
+        the driver expands into one column per property.
+        """
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            raise DriverNotInstalledError("pandas", "pip install pandas")
+        from neo4j import Result
         
-        # SKIP and LIMIT
+        query, params = self._find_query(table, where, columns, order_by, limit, offset)
+        try:
+            if self._transaction:
+                return self._transaction.run(query, params).to_df(expand=True)
+            return self._execute_query(
+                query,
+                params,
+                routing_="r",
+                result_transformer_=lambda result: Result.to_df(result, expand=True)
+            )
+        except Exception as e:
+            raise QueryError(str(e), query=query, params=params)
+    
+    @staticmethod
+    def _find_query(
+        table: str,
+        where: Optional[Dict[str, Any]],
+        columns: Optional[List[str]],
+        order_by: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int]
+    ) -> tuple:
+        """Build the Cypher statement and parameters for find()."""
+        query = _find_template(
+            table,
+            tuple(where) if where else (),
+            tuple(columns) if columns else None,
+            order_by
+        )
+        # Kept out of the cached template so paging doesn't fill the cache
         if offset:
-            query += f" SKIP {offset}"
-        
+            query = f"{query} SKIP {int(offset)}"
         if limit:
-            query += f" LIMIT {limit}"
-        
-        return self.execute(query, params if params else None)
+            query = f"{query} LIMIT {int(limit)}"
+        return query, where or {}
     
     def find_one(
         self,
@@ -404,35 +790,88 @@ class Neo4j(BaseAdapter):
             )
         """
         # Build MATCH clauses
-        from_props = ", ".join([f"{k}: $from_{k}" for k in from_where.keys()])
-        to_props = ", ".join([f"{k}: $to_{k}" for k in to_where.keys()])
+        from_props = _prop_map(from_where, "from_")
+        to_props = _prop_map(to_where, "to_")
         
         # Build relationship
+        rel_label = _label(rel_type, "relationship type")
         if rel_properties:
-            rel_props = ", ".join([f"{k}: $rel_{k}" for k in rel_properties.keys()])
-            rel_clause = f"[r:{rel_type} {{{rel_props}}}]"
+            rel_props = _prop_map(rel_properties, "rel_")
+            rel_clause = f"[r:{rel_label} {{{rel_props}}}]"
         else:
-            rel_clause = f"[r:{rel_type}]"
+            rel_clause = f"[r:{rel_label}]"
         
         query = f"""
-            MATCH (a:{from_label} {{{from_props}}})
-            MATCH (b:{to_label} {{{to_props}}})
+            MATCH (a:{_label(from_label)} {{{from_props}}})
+            MATCH (b:{_label(to_label)} {{{to_props}}})
             CREATE (a)-{rel_clause}->(b)
             RETURN a, r, b
         """
         
         # Prepare params
-        params = {}
-        for k, v in from_where.items():
-            params[f"from_{k}"] = v
-        for k, v in to_where.items():
-            params[f"to_{k}"] = v
+        params = _prefixed("from_", from_where)
+        params.update(_prefixed("to_", to_where))
         if rel_properties:
-            for k, v in rel_properties.items():
-                params[f"rel_{k}"] = v
+            params.update(_prefixed("rel_", rel_properties))
         
         return self.execute(query, params)
     
+    def create_relationships_many(
+        self,
+        from_label: str,
+        to_label: str,
+        rel_type: str,
+        key_from: str,
+        key_to: str,
+        rows: List[Dict[str, Any]]
+    ) -> QueryResult:
+        """
+        Create many relationships with one UNWIND statement per batch.
+        
+        Each row holds ``from`` and ``to`` (values of ``key_from`` on the
+        source node and ``key_to`` on the target node) and optional
+        ``props`` for the relationship. Rows are written in transactions
+        of RELATIONSHIP_BATCH_SIZE, or on the open transaction inside
+        begin_transaction().
+        
+        Example:
+            db.create_relationships_many(
+                "Person", "Person", "KNOWS", "name", "name",
+                [{"from": "John", "to": "Jane", "props": {"since": 2020}}]
+            )
+        """
+        start_time = time.time()
+        query = (
+            f"UNWIND $rows AS row "
+            f"MATCH (a:{_label(from_label)} {{{_label(key_from, 'property')}: row.from}}) "
+            f"MATCH (b:{_label(to_label)} {{{_label(key_to, 'property')}: row.to}}) "
+            f"CREATE (a)-[r:{_label(rel_type, 'relationship type')}]->(b) "
+            f"SET r += coalesce(row.props, {{}})"
+        )
+        batch_size = self.RELATIONSHIP_BATCH_SIZE
+        total_created = 0
+        
+        try:
+            if self._transaction:
+                for start in range(0, len(rows), batch_size):
+                    chunk = rows[start:start + batch_size]
+                    summary = self._transaction.run(query, rows=chunk).consume()
+                    total_created += summary.counters.relationships_created
+            else:
+                with self._driver.session(database=self.config.database) as session:
+                    for start in range(0, len(rows), batch_size):
+                        chunk = rows[start:start + batch_size]
+                        summary = session.execute_write(
+                            lambda tx: tx.run(query, rows=chunk).consume()
+                        )
+                        total_created += summary.counters.relationships_created
+        except Exception as e:
+            raise QueryError(str(e), query=query)
+        
+        query_result = QueryResult(affected_rows=total_created)
+        query_result.execution_time = (time.time() - start_time) * 1000
+        return query_result
+    
     def find_relationships(
         self,
         from_label: Optional[str] = None,
@@ -452,22 +891,22 @@ class Neo4j(BaseAdapter):
             limit: Maximum results
         """
         # Build pattern
-        from_pattern = f"(a:{from_label})" if from_label else "(a)"
-        to_pattern = f"(b:{to_label})" if to_label else "(b)"
-        rel_pattern = f"[r:{rel_type}]" if rel_type else "[r]"
+        from_pattern = f"(a:{_label(from_label)})" if from_label else "(a)"
+        to_pattern = f"(b:{_label(to_label)})" if to_label else "(b)"
+        rel_pattern = f"[r:{_label(rel_type, 'relationship type')}]" if rel_type else "[r]"
         
         query = f"MATCH {from_pattern}-{rel_pattern}->{to_pattern}"
         
         params = {}
         if where:
-            where_parts = [f"a.{k} = ${k}" for k in where.keys()]
+            where_parts = [f"a.{_check_identifier(k, 'property')} = ${k}" for k in where]
             query += f" WHERE {' AND '.join(where_parts)}"
             params = where
         
         query += " RETURN a, r, b, type(r) as rel_type"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += f" LIMIT {int(limit)}"
         
         return self.execute(query, params if params else None)
     
@@ -489,20 +928,17 @@ class Neo4j(BaseAdapter):
             to_where: Target node properties
             max_depth: Maximum path length
         """
-        from_props = ", ".join([f"{k}: $from_{k}" for k in from_where.keys()])
-        to_props = ", ".join([f"{k}: $to_{k}" for k in to_where.keys()])
+        from_props = _prop_map(from_where, "from_")
+        to_props = _prop_map(to_where, "to_")
         
         query = f"""
-            MATCH (a:{from_label} {{{from_props}}}), (b:{to_label} {{{to_props}}})
-            MATCH path = shortestPath((a)-[*..{max_depth}]-(b))
+            MATCH (a:{_label(from_label)} {{{from_props}}}), (b:{_label(to_label)} {{{to_props}}})
+            MATCH path = shortestPath((a)-[*..{int(max_depth)}]-(b))
             RETURN path, length(path) as path_length
         """
         
-        params = {}
-        for k, v in from_where.items():
-            params[f"from_{k}"] = v
-        for k, v in to_where.items():
-            params[f"to_{k}"] = v
+        params = _prefixed("from_", from_where)
+        params.update(_prefixed("to_", to_where))
         
         return self.execute(query, params)
     
@@ -524,9 +960,10 @@ class Neo4j(BaseAdapter):
             direction: "in", "out", or "both"
             depth: How many hops
         """
-        props = ", ".join([f"{k}: ${k}" for k in where.keys()])
+        props = _prop_map(where)
         
-        rel_pattern = f":{rel_type}" if rel_type else ""
+        rel_pattern = f":{_label(rel_type, 'relationship type')}" if rel_type else ""
+        depth = int(depth)
         
         if direction == "out":
             pattern = f"-[r{rel_pattern}*1..{depth}]->"
@@ -536,7 +973,7 @@ class Neo4j(BaseAdapter):
             pattern = f"-[r{rel_pattern}*1..{depth}]-"
         
         query = f"""
-            MATCH (n:{label} {{{props}}}){pattern}(neighbor)
+            MATCH (n:{_label(label)} {{{props}}}){pattern}(neighbor)
             RETURN DISTINCT neighbor, labels(neighbor) as labels
         """
         
@@ -579,18 +1016,18 @@ class Neo4j(BaseAdapter):
     
     def get_columns(self, table: str) -> List[Dict[str, Any]]:
         """Get properties used by nodes with given label."""
-        result = self.execute(f"""
-            MATCH (n:{table})
-            UNWIND keys(n) as key
-            RETURN DISTINCT key as column_name, 'unknown' as data_type
-            LIMIT 100
-        """)
+        result = self.execute("""
+            CALL db.schema.nodeTypeProperties()
+            YIELD nodeLabels, propertyName, propertyTypes
+            WHERE $label IN nodeLabels AND propertyName IS NOT NULL
+            RETURN DISTINCT propertyName AS column_name, propertyTypes[0] AS data_type
+        """, {"label": table})
         return result.data
     
     def table_exists(self, table: str) -> bool:
         """Check if label exists (has any nodes)."""
-        result = self.execute(f"MATCH (n:{table}) RETURN count(n) as count LIMIT 1")
-        return result.first.get("count", 0) > 0 if result.first else False
+        result = self.execute(f"MATCH (n:{_label(table)}) RETURN 1 AS found LIMIT 1")
+        return result.first is not None
     
     def get_relationship_types(self) -> List[str]:
         """Get all relationship types."""
@@ -598,27 +1035,67 @@ class Neo4j(BaseAdapter):
         return [row.get("relationshipType", "") for row in result.data]
     
     def get_schema(self) -> Dict[str, Any]:
-        """Get database schema overview."""
-        labels = self.get_tables()
-        rel_types = self.get_relationship_types()
-        
-        # Get node counts
-        node_counts = {}
-        for label in labels:
-            result = self.execute(f"MATCH (n:{label}) RETURN count(n) as count")
-            node_counts[label] = result.first.get("count", 0) if result.first else 0
-        
-        # Get relationship counts
-        rel_counts = {}
-        for rel_type in rel_types:
-            result = self.execute(f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count")
-            rel_counts[rel_type] = result.first.get("count", 0) if result.first else 0
+        """
+        Get database schema overview.
         
+        Counts come from ``apoc.meta.stats()`` when APOC is installed, and
+        otherwise from one UNION ALL statement per kind whose branches are
+        answered from the count store. Outside a transaction the queries run
+        concurrently; inside one they run in turn, since a transaction must
+        not be used from several threads.
+        """
+        if self._transaction:
+            labels = self.get_tables()
+            rel_types = self.get_relationship_types()
+            label_query, rel_query = _count_store_queries(labels, rel_types)
+            return self._schema(
+                labels,
+                rel_types,
+                _indexed_counts(labels, self.execute(label_query).data) if labels else {},
+                _indexed_counts(rel_types, self.execute(rel_query).data) if rel_types else {}
+            )
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            labels = executor.submit(self.get_tables)
+            rel_types = executor.submit(self.get_relationship_types)
+            stats = executor.submit(self._apoc_stats)
+            labels, rel_types, stats = labels.result(), rel_types.result(), stats.result()
+            
+            if stats:
+                return self._schema(labels, rel_types, stats["labels"], stats["relTypesCount"])
+            
+            label_query, rel_query = _count_store_queries(labels, rel_types)
+            label_rows = executor.submit(self.execute, label_query) if labels else None
+            rel_rows = executor.submit(self.execute, rel_query) if rel_types else None
+            return self._schema(
+                labels,
+                rel_types,
+                _indexed_counts(labels, label_rows.result().data) if label_rows else {},
+                _indexed_counts(rel_types, rel_rows.result().data) if rel_rows else {}
+            )
+    
+    def _apoc_stats(self) -> Optional[Dict[str, Any]]:
+        """Store statistics from apoc.meta.stats(), or None without APOC."""
+        # A failed CALL would abort an open transaction, so don't probe there
+        if self._has_apoc is False or self._transaction:
+            return None
+        try:
+            stats = self.execute(_APOC_STATS_QUERY).first
+        except QueryError:
+            self._has_apoc = False
+            return None
+        self._has_apoc = True
+        return stats
+    
+    @staticmethod
+    def _schema(labels, rel_types, label_counts, rel_type_counts) -> Dict[str, Any]:
         return {
             "labels": labels,
             "relationship_types": rel_types,
-            "node_counts": node_counts,
-            "relationship_counts": rel_counts
+            "node_counts": {label: label_counts.get(label, 0) for label in labels},
+            "relationship_counts": {
+                rel_type: rel_type_counts.get(rel_type, 0) for rel_type in rel_types
+            }
         }
     
     # ==================== Utility Methods ====================
@@ -629,16 +1106,35 @@ class Neo4j(BaseAdapter):
     
     def create_index(self, label: str, property_name: str) -> QueryResult:
         """Create index on property."""
-        return self.execute(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.{property_name})")
+        return self.execute(
+            f"CREATE INDEX IF NOT EXISTS FOR (n:{_label(label)}) "
+            f"ON (n.{_check_identifier(property_name, 'property')})"
+        )
     
     def create_constraint_unique(self, label: str, property_name: str) -> QueryResult:
         """Create uniqueness constraint."""
         return self.execute(
-            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{label}) REQUIRE n.{property_name} IS UNIQUE"
+            f"CREATE CONSTRAINT IF NOT EXISTS FOR (n:{_label(label)}) "
+            f"REQUIRE n.{_check_identifier(property_name, 'property')} IS UNIQUE"
         )
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get database statistics."""
+        """
+        Get database statistics.
+        
+        Totals come from ``apoc.meta.stats()`` when available; otherwise the
+        unlabelled count queries below, which Neo4j also answers from its
+        count store.
+        """
+        stats = self._apoc_stats()
+        if stats:
+            return {
+                "total_nodes": stats["nodeCount"],
+                "total_relationships": stats["relCount"],
+                "labels": self.get_tables(),
+                "relationship_types": self.get_relationship_types()
+            }
+        
         # Node count
         node_result = self.execute("MATCH (n) RETURN count(n) as count")
         node_count = node_result.first.get("count", 0) if node_result.first else 0
@@ -653,3 +1149,254 @@ class Neo4j(BaseAdapter):
             "labels": self.get_tables(),
             "relationship_types": self.get_relationship_types()
         }
+
+
+class AsyncNeo4j(Neo4j, AsyncBaseAdapter):
+    """
+    Neo4j adapter with async support.
+    
+    The ``*_async`` methods share one ``AsyncDriver``, so concurrent
+    coroutines overlap their Bolt round-trips on the event loop. The sync
+    methods inherited from Neo4j keep working as before.
+    
+    Usage:
+        db = AsyncNeo4j(host="localhost", user="neo4j", password="password")
+        await db.connect_async()
+        people = await db.find_async("Person", {"city": "Berlin"})
+        await db.disconnect_async()
+    
+    Install:
+        pip install onedb[neo4j]
+    """
+    
+    def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
+        super().__init__(config, **kwargs)
+        self._async_driver = None
+        self._async_execute_query = None
+        self._async_session = None
+        self._async_transaction = None
+    
+    def _import_async_driver(self):
+        self._import_driver()
+        from neo4j import AsyncGraphDatabase
+        return AsyncGraphDatabase
+    
+    async def connect_async(self) -> None:
+        AsyncGraphDatabase = self._import_async_driver()
+        
+        try:
+            self._async_driver = AsyncGraphDatabase.driver(**self._driver_params())
+            
+            # Test connection
+            await self._async_driver.verify_connectivity()
+            
+            self._async_execute_query = partial(
+                self._async_driver.execute_query, database_=self.config.database
+            )
+            self._is_connected = True
+            
+        except Exception as e:
+            if self._async_driver:
+                await self._async_driver.close()
+                self._async_driver = None
+            raise self._connection_error(e)
+    
+    async def disconnect_async(self) -> None:
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_transaction = None
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+            self._async_execute_query = None
+        self._is_connected = False
+    
+    def is_connected(self) -> bool:
+        if self._async_driver is not None:
+            return self._is_connected
+        return super().is_connected()
+    
+    async def execute_async(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None
+    ) -> QueryResult:
+        """Execute Cypher query."""
+        start_time = time.time()
+        
+        try:
+            params = _normalize_params(params)
+            is_read = _is_read_query(query)
+            
+            if self._async_transaction:
+                result = await self._async_transaction.run(query, params)
+                raw_records = [record async for record in result]
+                summary = None if is_read else await result.consume()
+            else:
+                raw_records, summary, _ = await self._async_execute_query(
+                    query,
+                    params,
+                    routing_="r" if is_read else "w"
+                )
+                if is_read:
+                    summary = None
+            
+            query_result = self._build_result(raw_records, summary)
+            query_result.execution_time = (time.time() - start_time) * 1000
+            return query_result
+            
+        except Exception as e:
+            raise QueryError(str(e), query=query, params=params)
+    
+    async def execute_many_async(
+        self,
+        query: str,
+        params_list: List[Union[tuple, dict]]
+    ) -> QueryResult:
+        """
+        Execute query with multiple parameter sets in one managed transaction,
+        or on the open transaction inside begin_transaction_async().
+        """
+        start_time = time.time()
+        
+        async def work(tx):
+            total = 0
+            for params in params_list:
+                result = await tx.run(query, _normalize_params(params))
+                summary = await result.consume()
+                total += _affected(summary.counters) or 1
+            return total
+        
+        try:
+            if self._async_transaction:
+                total_affected = await work(self._async_transaction)
+            else:
+                async with self._async_driver.session(database=self.config.database) as session:
+                    if _is_read_query(query):
+                        total_affected = await session.execute_read(work)
+                    else:
+                        total_affected = await session.execute_write(work)
+        except Exception as e:
+            raise QueryError(str(e), query=query)
+        
+        query_result = QueryResult(affected_rows=total_affected)
+        query_result.execution_time = (time.time() - start_time) * 1000
+        return query_result
+    
+    async def insert_many_async(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
+        """
+        Create multiple nodes with one UNWIND statement per
+        INSERT_MANY_BATCH_SIZE rows, on the open transaction inside
+        begin_transaction_async().
+        """
+        start_time = time.time()
+        query = self._insert_many_query(table)
+        batch_size = self.INSERT_MANY_BATCH_SIZE
+        total_created = 0
+        
+        try:
+            for start in range(0, len(data), batch_size):
+                chunk = data[start:start + batch_size]
+                if self._async_transaction:
+                    result = await self._async_transaction.run(query, rows=chunk)
+                    summary = await result.consume()
+                else:
+                    _, summary, _ = await self._async_execute_query(
+                        query, {"rows": chunk}, routing_="w"
+                    )
+                total_created += summary.counters.nodes_created
+        except Exception as e:
+            raise QueryError(str(e), query=query)
+        
+        query_result = QueryResult(affected_rows=total_created)
+        query_result.execution_time = (time.time() - start_time) * 1000
+        return query_result
+    
+    async def find_async(
+        self,
+        table: str,
+        where: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> QueryResult:
+        """Find nodes by label and properties."""
+        query, params = self._find_query(table, where, columns, order_by, limit, offset)
+        return await self.execute_async(query, params if params else None)
+    
+    async def get_schema_async(self) -> Dict[str, Any]:
+        """
+        Get database schema overview, running its queries concurrently.
+        
+        Inside a transaction the queries run in turn, since statements on
+        one transaction must not overlap.
+        """
+        async def counts(names, query):
+            if not names:
+                return {}
+            return _indexed_counts(names, (await self.execute_async(query)).data)
+        
+        if self._async_transaction:
+            labels = await self.execute_async("CALL db.labels()")
+            rel_types = await self.execute_async("CALL db.relationshipTypes()")
+            stats = None
+        else:
+            labels, rel_types, stats = await asyncio.gather(
+                self.execute_async("CALL db.labels()"),
+                self.execute_async("CALL db.relationshipTypes()"),
+                self._apoc_stats_async(),
+            )
+        labels = [row.get("label", "") for row in labels.data]
+        rel_types = [row.get("relationshipType", "") for row in rel_types.data]
+        
+        if stats:
+            return self._schema(labels, rel_types, stats["labels"], stats["relTypesCount"])
+        
+        label_query, rel_query = _count_store_queries(labels, rel_types)
+        if self._async_transaction:
+            label_counts = await counts(labels, label_query)
+            rel_counts = await counts(rel_types, rel_query)
+        else:
+            label_counts, rel_counts = await asyncio.gather(
+                counts(labels, label_query), counts(rel_types, rel_query)
+            )
+        return self._schema(labels, rel_types, label_counts, rel_counts)
+    
+    async def _apoc_stats_async(self) -> Optional[Dict[str, Any]]:
+        if self._has_apoc is False or self._async_transaction:
+            return None
+        try:
+            stats = (await self.execute_async(_APOC_STATS_QUERY)).first
+        except QueryError:
+            self._has_apoc = False
+            return None
+        self._has_apoc = True
+        return stats
+    
+    async def begin_transaction_async(self) -> None:
+        """Start a transaction session."""
+        self._async_session = self._async_driver.session(database=self.config.database)
+        self._async_transaction = await self._async_session.begin_transaction()
+        self._in_transaction = True
+    
+    async def commit_async(self) -> None:
+        """Commit transaction."""
+        if self._async_transaction:
+            await self._async_transaction.commit()
+            self._async_transaction = None
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+        self._in_transaction = False
+    
+    async def rollback_async(self) -> None:
+        """Rollback transaction."""
+        if self._async_transaction:
+            await self._async_transaction.rollback()
+            self._async_transaction = None
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+        self._in_transaction = False
@@ -2,17 +2,75 @@
 Oracle Database Adapter.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+from functools import lru_cache
+from threading import Lock
 import time
 
 from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+from ..core.row import row_class, rows_to_tuples
 from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
 
 
+# SQL for the CRUD helpers depends only on the table and column names of a
+# call, so each shape is rendered once. Binds are numbered :1, :2, ...
+
+def _binds(keys: tuple, start: int = 1) -> List[str]:
+    return [f"{k} = :{i}" for i, k in enumerate(keys, start)]
+
+
+@lru_cache(maxsize=512)
+def _insert_sql(table: str, columns: tuple) -> str:
+    placeholders = ", ".join([f":{i}" for i in range(1, len(columns) + 1)])
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table: str, set_keys: tuple, where_keys: tuple) -> str:
+    query = f"UPDATE {table} SET {', '.join(_binds(set_keys))}"
+    if where_keys:
+        query += f" WHERE {' AND '.join(_binds(where_keys, len(set_keys) + 1))}"
+    return query
+
+
+@lru_cache(maxsize=512)
+def _delete_sql(table: str, where_keys: tuple) -> str:
+    if where_keys:
+        return f"DELETE FROM {table} WHERE {' AND '.join(_binds(where_keys))}"
+    return f"DELETE FROM {table}"
+
+
+@lru_cache(maxsize=512)
+def _find_sql(table: str, columns: Optional[tuple], where_keys: tuple, order_by: Optional[str]) -> str:
+    """SELECT without the OFFSET/FETCH clauses."""
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table}"
+    if where_keys:
+        query += f" WHERE {' AND '.join(_binds(where_keys))}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query
+
+
 class Oracle(BaseAdapter):
     """
     Oracle database adapter.
     
+    Sessions come from a process-wide pool shared by adapters with the
+    same user and DSN (python-oracledb only). Pool options (via ``extra``):
+        use_pool: Set to False to open a dedicated connection (default True)
+        pool_min: Sessions opened up front (default 2)
+        pool_increment: Sessions added when the pool grows (default 1)
+        session_callback: Called once per new physical session, e.g. to
+            set NLS parameters with ALTER SESSION
+    
+    ``pool_size`` from the config is the pool maximum.
+    
+    python-oracledb runs in thin mode (pure Python, no Oracle Client
+    libraries). Pass ``extra={"thick_mode": True}`` (optionally with
+    ``lib_dir``) only for features that need Oracle Client, such as
+    Advanced Queuing or sharding; the mode is process-wide and must be
+    chosen before the first connection. cx_Oracle is used as a fallback.
+    
     Install:
         pip install onedb[oracle]
     """
@@ -21,21 +79,53 @@ class Oracle(BaseAdapter):
     driver_name = "oracledb"
     install_command = "pip install onedb[oracle]"
     
+    # Rows fetched per round trip for SELECTs
+    FETCH_ARRAYSIZE = 1000
+    
+    # Rows bound per executemany() call
+    optimal_batch_size = 5000
+    
+    # Statements kept prepared per session
+    STMT_CACHE_SIZE = 50
+    
+    # Seconds a successful ping is trusted by is_connected()
+    PING_INTERVAL = 30
+    
+    # Session pools shared across instances: (user, password, dsn) -> pool
+    _pool_cache: Dict[tuple, Any] = {}
+    _pool_cache_lock = Lock()
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
+        self._pool = None
+        self._cursor = None
+        self._last_ping = 0.0
         if self.config.port is None:
             self.config.port = 1521
     
     def _import_driver(self):
         try:
             import oracledb
+        except ImportError:
+            pass
+        else:
+            if self.config.extra.get("thick_mode") and oracledb.is_thin_mode():
+                try:
+                    oracledb.init_oracle_client(lib_dir=self.config.extra.get("lib_dir"))
+                except Exception as e:
+                    raise ConnectionError(
+                        f"Failed to enable Oracle thick mode: {e}",
+                        host=self.config.host,
+                        port=self.config.port,
+                        database=self.config.database
+                    )
             return oracledb
+        
+        try:
+            import cx_Oracle
+            return cx_Oracle
         except ImportError:
-            try:
-                import cx_Oracle
-                return cx_Oracle
-            except ImportError:
-                raise DriverNotInstalledError("oracledb", self.install_command)
+            raise DriverNotInstalledError("oracledb", self.install_command)
     
     def connect(self) -> None:
         driver = self._import_driver()
@@ -47,11 +137,16 @@ class Oracle(BaseAdapter):
                 service_name=self.config.database
             )
             
-            self._connection = driver.connect(
-                user=self.config.user,
-                password=self.config.password,
-                dsn=dsn
-            )
+            if self._extra_flag("use_pool", True) and hasattr(driver, "create_pool"):
+                self._pool = self._get_pool(driver, dsn)
+                self._connection = self._pool.acquire()
+            else:
+                self._connection = driver.connect(
+                    user=self.config.user,
+                    password=self.config.password,
+                    dsn=dsn
+                )
+                self._connection.stmtcachesize = self.STMT_CACHE_SIZE
             self._is_connected = True
             
         except Exception as e:
@@ -62,30 +157,98 @@ class Oracle(BaseAdapter):
                 database=self.config.database
             )
     
+    def _get_pool(self, driver, dsn: str):
+        """Return the shared session pool for this user and DSN, creating it once."""
+        key = (self.config.user, self.config.password, dsn)
+        with Oracle._pool_cache_lock:
+            pool = Oracle._pool_cache.get(key)
+            if pool is None:
+                extra = self.config.extra
+                pool = driver.create_pool(
+                    user=self.config.user,
+                    password=self.config.password,
+                    dsn=dsn,
+                    min=int(extra.get("pool_min", 2)),
+                    max=max(self.config.pool_size, int(extra.get("pool_min", 2))),
+                    increment=int(extra.get("pool_increment", 1)),
+                    session_callback=extra.get("session_callback"),
+                    stmtcachesize=self.STMT_CACHE_SIZE,
+                    ping_interval=60
+                )
+                Oracle._pool_cache[key] = pool
+            return pool
+    
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every shared session pool, e.g. at application shutdown."""
+        with Oracle._pool_cache_lock:
+            pools = list(Oracle._pool_cache.values())
+            Oracle._pool_cache.clear()
+        for pool in pools:
+            pool.close(force=True)
+    
+    def _get_cursor(self):
+        """Cursor reused by execute/execute_many, created on first use."""
+        if self._cursor is None:
+            cursor = self._connection.cursor()
+            cursor.arraysize = self.FETCH_ARRAYSIZE
+            if hasattr(cursor, "prefetchrows"):
+                # Return the first full batch with the execute round trip
+                cursor.prefetchrows = self.FETCH_ARRAYSIZE + 1
+            self._cursor = cursor
+        return self._cursor
+    
+    def _discard_cursor(self) -> None:
+        """Drop the shared cursor, e.g. after it raised."""
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+    
     def disconnect(self) -> None:
+        self._discard_cursor()
         if self._connection:
-            self._connection.close()
+            if self._pool is not None:
+                # Uncommitted work is rolled back when the session is released
+                self._pool.release(self._connection)
+            else:
+                self._connection.close()
             self._connection = None
+        self._pool = None
         self._is_connected = False
     
+    def _shares_connections(self) -> bool:
+        return self._pool is not None
+    
     def is_connected(self) -> bool:
+        """Check the connection, pinging at most once per PING_INTERVAL."""
+        if not self._connection:
+            return False
+        if time.monotonic() - self._last_ping < self.PING_INTERVAL:
+            return True
+        return self.ping()
+    
+    def ping(self) -> bool:
+        """Round-trip check of the session."""
         try:
-            if self._connection:
-                self._connection.ping()
-                return True
+            self._connection.ping()
         except Exception:
-            pass
-        return False
+            self._last_ping = 0.0
+            return False
+        self._last_ping = time.monotonic()
+        return True
     
     def execute(
         self,
         query: str,
         params: Optional[Union[tuple, dict]] = None
     ) -> QueryResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            cursor = self._connection.cursor()
+            cursor = self._get_cursor()
             
             if params:
                 cursor.execute(query, params)
@@ -96,77 +259,120 @@ class Oracle(BaseAdapter):
             
             if cursor.description:
                 result.columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                result.data = [dict(zip(result.columns, row)) for row in rows]
+                result.data = list(map(row_class(tuple(result.columns)), cursor.fetchall()))
             
             result.affected_rows = cursor.rowcount
             
             if not self._in_transaction:
                 self._connection.commit()
             
-            cursor.close()
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             return result
             
+        except Exception as e:
+            self._discard_cursor()
+            raise QueryError(str(e), query=query, params=params)
+    
+    def execute_iter(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None,
+        chunk: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream rows of a SELECT, fetching ``chunk`` rows per round trip."""
+        try:
+            cursor = self._connection.cursor()
+            cursor.arraysize = chunk
+            if hasattr(cursor, "prefetchrows"):
+                cursor.prefetchrows = chunk + 1
+            try:
+                cursor.execute(query, params or [])
+                yield from map(row_class(tuple(desc[0] for desc in cursor.description)), cursor)
+            finally:
+                cursor.close()
+        except GeneratorExit:
+            raise
         except Exception as e:
             raise QueryError(str(e), query=query, params=params)
     
-    def execute_many(self, query: str, params_list: List) -> QueryResult:
-        start_time = time.time()
-        cursor = self._connection.cursor()
-        cursor.executemany(query, params_list)
+    def execute_many(
+        self,
+        query: str,
+        params_list: List,
+        batch_size: Optional[int] = None
+    ) -> QueryResult:
+        """
+        Execute query with multiple parameter sets using array DML.
         
-        if not self._in_transaction:
-            self._connection.commit()
+        Parameter sets are bound ``batch_size`` at a time
+        (optimal_batch_size by default), without batch errors or per-row
+        DML counts, and committed once at the end. Outside a transaction a
+        failing batch rolls back the batches bound before it, so a partial
+        load is never committed by a later statement.
+        """
+        start_time = time.perf_counter_ns()
+        batch_size = min(len(params_list), batch_size or self.optimal_batch_size) or 1
+        affected = 0
+        
+        try:
+            cursor = self._get_cursor()
+            for start in range(0, len(params_list), batch_size):
+                cursor.executemany(
+                    query,
+                    params_list[start:start + batch_size],
+                    batcherrors=False,
+                    arraydmlrowcounts=False
+                )
+                affected += cursor.rowcount
+            
+            if not self._in_transaction:
+                self._connection.commit()
+        except Exception as e:
+            self._discard_cursor()
+            if not self._in_transaction:
+                try:
+                    self._connection.rollback()
+                except Exception:
+                    pass
+            raise QueryError(str(e), query=query)
         
-        result = QueryResult(affected_rows=cursor.rowcount)
-        result.execution_time = (time.time() - start_time) * 1000
-        cursor.close()
+        result = QueryResult(affected_rows=affected)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
-        columns = list(data.keys())
-        placeholders = ", ".join([f":{i+1}" for i in range(len(columns))])
-        columns_str = ", ".join(columns)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        return self.execute(query, tuple(data.values()))
+        self._invalidate_tables(table)
+        return self.execute(_insert_sql(table, tuple(data)), tuple(data.values()))
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
+    def insert_many(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> QueryResult:
+        self._invalidate_tables(table)
         if not data:
             return QueryResult()
         
-        columns = list(data[0].keys())
-        placeholders = ", ".join([f":{i+1}" for i in range(len(columns))])
-        columns_str = ", ".join(columns)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        params_list = [tuple(row.values()) for row in data]
-        return self.execute_many(query, params_list)
+        columns = tuple(data[0])
+        query = _insert_sql(table, columns)
+        params_list = rows_to_tuples(data, columns)
+        return self.execute_many(query, params_list, batch_size=batch_size)
     
     def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
-        set_parts = [f"{k} = :{i+1}" for i, k in enumerate(data.keys())]
-        values = list(data.values())
-        
-        query = f"UPDATE {table} SET {', '.join(set_parts)}"
-        
+        self._invalidate_tables(table)
+        query = _update_sql(table, tuple(data), tuple(where) if where else ())
+        values = tuple(data.values())
         if where:
-            where_parts = [f"{k} = :{len(values)+i+1}" for i, k in enumerate(where.keys())]
-            values.extend(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
+            values += tuple(where.values())
         
-        return self.execute(query, tuple(values))
+        return self.execute(query, values)
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
-        query = f"DELETE FROM {table}"
-        values = []
-        
+        self._invalidate_tables(table)
         if where:
-            where_parts = [f"{k} = :{i+1}" for i, k in enumerate(where.keys())]
-            values = list(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        return self.execute(query, tuple(values) if values else None)
+            return self.execute(_delete_sql(table, tuple(where)), tuple(where.values()))
+        return self.execute(_delete_sql(table, ()))
     
     def find(
         self,
@@ -177,25 +383,21 @@ class Oracle(BaseAdapter):
         limit: Optional[int] = None,
         offset: Optional[int] = None
     ) -> QueryResult:
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
-        values = []
-        
-        if where:
-            where_parts = [f"{k} = :{i+1}" for i, k in enumerate(where.keys())]
-            values = list(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
-        
-        if limit:
-            query += f" FETCH FIRST {limit} ROWS ONLY"
+        query = _find_sql(
+            table,
+            tuple(columns) if columns else None,
+            tuple(where) if where else (),
+            order_by
+        )
         
+        # OFFSET has to precede FETCH in Oracle's row-limiting clause
         if offset:
             query += f" OFFSET {offset} ROWS"
         
-        return self.execute(query, tuple(values) if values else None)
+        if limit:
+            query += f" FETCH NEXT {limit} ROWS ONLY"
+        
+        return self._cached_execute(query, tuple(where.values()) if where else None)
     
     def begin_transaction(self) -> None:
         self._in_transaction = True
@@ -3,15 +3,183 @@ PostgreSQL Adapter.
 Supports both sync (psycopg2) and async (asyncpg) connections.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from collections import OrderedDict, deque
+from functools import lru_cache
+from itertools import count
+from threading import Lock
+import io
+import re
 import time
 
 from ..core.base import (
     BaseAdapter, AsyncBaseAdapter, ConnectionConfig, 
     QueryResult, DatabaseType
 )
+from ..core.row import rows_to_tuples
 from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
 
+# Suffixes for server-side cursor names
+_cursor_ids = count()
+
+_INSERT_RETURNING_RE = re.compile(r"\s*INSERT\b.*\bRETURNING\b", re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def _is_insert_returning(query: str) -> bool:
+    return _INSERT_RETURNING_RE.match(query) is not None
+
+
+_PREPARABLE_RE = re.compile(r"\s*(SELECT|INSERT|UPDATE|DELETE|WITH|VALUES)\b", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"%%|%s|%")
+
+
+@lru_cache(maxsize=256)
+def _numbered_placeholders(query: str) -> Optional[tuple]:
+    """
+    ``(sql, n)`` with ``%s`` rewritten to ``$1..$n`` for PREPARE.
+    
+    None for statements PREPARE does not accept or that use other
+    ``%`` codes (e.g. named ``%(key)s`` parameters).
+    """
+    if not _PREPARABLE_RE.match(query):
+        return None
+    
+    count = 0
+    
+    def number(match):
+        nonlocal count
+        token = match.group()
+        if token == "%%":
+            return "%"
+        if token == "%s":
+            count += 1
+            return f"${count}"
+        raise ValueError(token)
+    
+    try:
+        sql = _PLACEHOLDER_RE.sub(number, query)
+    except ValueError:
+        return None
+    return sql, count
+
+
+# Values COPY's text format cannot take as-is
+_NON_SCALAR = (dict, list, tuple, set, bytes, bytearray, memoryview)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(value: Any) -> str:
+    """Render one value for COPY ... FROM STDIN (FORMAT text)."""
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+# SQL for the CRUD helpers depends only on the table and column names of a
+# call, so each shape is rendered once.
+
+@lru_cache(maxsize=512)
+def _insert_sql(table: str, columns: tuple) -> str:
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) RETURNING id"
+
+
+@lru_cache(maxsize=512)
+def _insert_values_sql(table: str, columns: tuple) -> str:
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table: str, set_keys: tuple, where_keys: tuple) -> str:
+    query = f"UPDATE {table} SET {', '.join([f'{k} = %s' for k in set_keys])}"
+    if where_keys:
+        query += f" WHERE {' AND '.join([f'{k} = %s' for k in where_keys])}"
+    return query
+
+
+@lru_cache(maxsize=512)
+def _delete_sql(table: str, where_keys: tuple) -> str:
+    if where_keys:
+        return f"DELETE FROM {table} WHERE {' AND '.join([f'{k} = %s' for k in where_keys])}"
+    return f"DELETE FROM {table}"
+
+
+@lru_cache(maxsize=512)
+def _find_sql(
+    table: str,
+    columns: Optional[tuple],
+    where_keys: tuple,
+    null_keys: tuple,
+    order_by: Optional[str]
+) -> str:
+    """SELECT without LIMIT/OFFSET; ``null_keys`` flags keys matched with IS NULL."""
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table}"
+    if where_keys:
+        where_parts = [
+            f"{key} IS NULL" if is_null else f"{key} = %s"
+            for key, is_null in zip(where_keys, null_keys)
+        ]
+        query += f" WHERE {' AND '.join(where_parts)}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query
+
+
+class PostgreSQLPool:
+    """
+    Idle psycopg2 connections shared by every thread.
+    
+    ``acquire`` takes the most recently released open connection, or opens
+    a new one; ``release`` keeps at most ``max_idle`` idle connections and
+    closes the rest, so connections released by threads that have since
+    exited are reused or closed like any other.
+    """
+    
+    def __init__(self, connect: Callable[[], Any], max_idle: int = 5):
+        self._connect = connect
+        self._max_idle = max_idle
+        self._idle: deque = deque()
+        self._lock = Lock()
+    
+    def acquire(self) -> Any:
+        """Return an idle open connection, or a new one."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not conn.closed:
+                return conn
+        return self._connect()
+    
+    def release(self, conn: Any) -> None:
+        """Reset a connection to autocommit and keep it for reuse."""
+        if conn.closed:
+            return
+        try:
+            if not conn.autocommit:
+                conn.rollback()
+                conn.autocommit = True
+        except Exception:
+            conn.close()
+            return
+        
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+    
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
 
 class PostgreSQL(BaseAdapter):
     """
@@ -40,6 +208,10 @@ class PostgreSQL(BaseAdapter):
         )
         db = PostgreSQL(config=config)
     
+    Connections are returned to a shared PostgreSQLPool on disconnect and
+    reused by the next connect() with the same parameters; pass
+    ``extra={"use_pool": False}`` to open and close a dedicated connection.
+    
     Install:
         pip install onedb[postgresql]
     """
@@ -48,9 +220,34 @@ class PostgreSQL(BaseAdapter):
     driver_name = "psycopg2"
     install_command = "pip install onedb[postgresql]"
     
+    # Rows per multi-VALUES statement in insert_many; larger batches regress
+    optimal_batch_size = 1000
+    
+    # insert_many switches to COPY FROM STDIN at this many rows
+    COPY_THRESHOLD = 10000
+    
+    # execute() prepares a positional-parameter statement server-side once
+    # it has been seen more than PREPARE_THRESHOLD times; None disables this
+    PREPARE_THRESHOLD = 2
+    PREPARED_CACHE_SIZE = 256
+    
+    # Driver module and psycopg2.extras, resolved once on first import
+    _psycopg2 = None
+    _extras = None
+    
+    # Connection pools shared across instances with the same parameters
+    _pools: Dict[tuple, PostgreSQLPool] = {}
+    _pools_lock = Lock()
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
+        # Reused cursors: dict rows for execute(), tuples for bulk writes
         self._cursor = None
+        self._tuple_cursor = None
+        # query -> prepared statement name, most recently used last
+        self._prepared: "OrderedDict[str, str]" = OrderedDict()
+        self._query_counts: Dict[str, int] = {}
+        self._pool: Optional[PostgreSQLPool] = None
         
         # Set default port
         if self.config.port is None:
@@ -58,15 +255,17 @@ class PostgreSQL(BaseAdapter):
     
     def _import_driver(self):
         """Import psycopg2 driver."""
-        try:
-            import psycopg2
-            import psycopg2.extras
-            return psycopg2
-        except ImportError:
-            raise DriverNotInstalledError(
-                "psycopg2",
-                self.install_command
-            )
+        if PostgreSQL._psycopg2 is None:
+            try:
+                import psycopg2
+                import psycopg2.extras
+            except ImportError:
+                raise DriverNotInstalledError(
+                    "psycopg2",
+                    self.install_command
+                )
+            PostgreSQL._psycopg2, PostgreSQL._extras = psycopg2, psycopg2.extras
+        return PostgreSQL._psycopg2
     
     def connect(self) -> None:
         """Establish connection to PostgreSQL."""
@@ -86,12 +285,17 @@ class PostgreSQL(BaseAdapter):
                 conn_params["sslmode"] = "require"
             
             # Add extra parameters
-            conn_params.update(self.config.extra)
+            use_pool = self._extra_flag("use_pool", True)
+            conn_params.update(self._driver_extra("use_pool"))
             
             # Remove None values
             conn_params = {k: v for k, v in conn_params.items() if v is not None}
             
-            self._connection = psycopg2.connect(**conn_params)
+            if use_pool:
+                self._pool = self._get_pool(psycopg2, conn_params)
+                self._connection = self._pool.acquire()
+            else:
+                self._connection = psycopg2.connect(**conn_params)
             self._connection.autocommit = True
             self._is_connected = True
             
@@ -103,29 +307,83 @@ class PostgreSQL(BaseAdapter):
                 database=self.config.database
             )
     
+    def _get_pool(self, psycopg2, conn_params: Dict[str, Any]) -> PostgreSQLPool:
+        """Return the shared pool for these connection parameters."""
+        key = tuple(sorted(conn_params.items()))
+        pool = PostgreSQL._pools.get(key)
+        if pool is None:
+            with PostgreSQL._pools_lock:
+                pool = PostgreSQL._pools.get(key)
+                if pool is None:
+                    pool = PostgreSQLPool(
+                        lambda: psycopg2.connect(**conn_params),
+                        max_idle=self.config.pool_size
+                    )
+                    PostgreSQL._pools[key] = pool
+        return pool
+    
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """Close every pooled idle connection, e.g. at application shutdown."""
+        with PostgreSQL._pools_lock:
+            pools = list(PostgreSQL._pools.values())
+            PostgreSQL._pools.clear()
+        for pool in pools:
+            pool.close()
+    
+    def _dict_cursor(self):
+        """RealDictCursor reused by execute(), created on first use."""
+        if self._cursor is None:
+            self._cursor = self._connection.cursor(
+                cursor_factory=self._extras.RealDictCursor
+            )
+        return self._cursor
+    
+    def _plain_cursor(self):
+        """Tuple cursor reused by execute_many()/insert_many()."""
+        if self._tuple_cursor is None:
+            self._tuple_cursor = self._connection.cursor()
+        return self._tuple_cursor
+    
+    def _close_cursors(self) -> None:
+        for cursor in (self._cursor, self._tuple_cursor):
+            if cursor is not None and not cursor.closed:
+                cursor.close()
+        self._cursor = None
+        self._tuple_cursor = None
+    
     def disconnect(self) -> None:
-        """Close connection."""
-        if self._cursor:
-            self._cursor.close()
-            self._cursor = None
+        """Close connection, or return it to the pool."""
+        if self._prepared and self._pool is not None and not self._connection.closed:
+            # Pooled sessions outlive this adapter and its statement names
+            try:
+                self._plain_cursor().execute("DEALLOCATE ALL")
+            except Exception:
+                pass
+        self._prepared.clear()
+        self._query_counts.clear()
+        self._close_cursors()
         if self._connection:
-            self._connection.close()
+            if self._pool is not None:
+                self._pool.release(self._connection)
+            else:
+                self._connection.close()
             self._connection = None
+        self._pool = None
+        self._in_transaction = False
         self._is_connected = False
     
+    def _shares_connections(self) -> bool:
+        return self._pool is not None
+    
     def is_connected(self) -> bool:
-        """Check connection status."""
-        if not self._connection:
-            return False
-        try:
-            # Check if connection is alive
-            cursor = self._connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            return True
-        except Exception:
-            self._is_connected = False
-            return False
+        """
+        Check connection status from psycopg2's local state, without I/O.
+        
+        A dropped server connection is only noticed by the next query; use
+        ``ping()`` for an explicit round-trip check.
+        """
+        return self._connection is not None and self._connection.closed == 0
     
     def execute(
         self,
@@ -133,20 +391,27 @@ class PostgreSQL(BaseAdapter):
         params: Optional[Union[tuple, dict]] = None
     ) -> QueryResult:
         """Execute query and return results."""
-        import psycopg2.extras
-        
         if not self._is_connected:
             raise ConnectionError("Not connected to database")
         
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # Use RealDictCursor for dict results
-            cursor = self._connection.cursor(
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
-            
-            cursor.execute(query, params)
+            cursor = self._dict_cursor()
+            name = self._prepared_name(query, params)
+            if name:
+                try:
+                    cursor.execute(f"EXECUTE {name}({', '.join(['%s'] * len(params))})", params)
+                except Exception:
+                    if self._in_transaction:
+                        raise
+                    # e.g. "cached plan must not change result type" after
+                    # DDL: drop the statement and run the query unprepared
+                    self._deallocate(self._prepared.pop(query))
+                    cursor.execute(query, params)
+            else:
+                cursor.execute(query, params)
             
             # Determine result type
             result = QueryResult()
@@ -155,40 +420,148 @@ class PostgreSQL(BaseAdapter):
             if cursor.description:
                 # SELECT query
                 result.columns = [desc[0] for desc in cursor.description]
-                result.data = [dict(row) for row in cursor.fetchall()]
-            
-            # Get last inserted ID for INSERT
-            if query.strip().upper().startswith("INSERT") and "RETURNING" in query.upper():
-                if result.data:
-                    result.last_id = result.data[0].get("id")
+                # RealDictRow is already a dict; no per-row copy needed
+                result.data = cursor.fetchall()
             
-            cursor.close()
+            # Get last inserted ID for INSERT ... RETURNING
+            if result.data and _is_insert_returning(query):
+                result.last_id = result.data[0].get("id")
             
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             return result
             
         except Exception as e:
+            stale = self._prepared.pop(query, None)
+            if stale:
+                # e.g. the plan went stale after DDL; re-prepare next time
+                self._deallocate(stale)
             raise QueryError(str(e), query=query, params=params)
     
+    def _prepared_name(self, query: str, params: Any) -> Optional[str]:
+        """
+        Name of the server-side prepared statement to run ``query`` with.
+        
+        Only tuple/list parameters are prepared, and only outside explicit
+        transactions so a failed PREPARE cannot abort one. The statement is
+        created on the call that takes the query over PREPARE_THRESHOLD;
+        the least recently used statement is deallocated beyond
+        PREPARED_CACHE_SIZE.
+        """
+        name = self._prepared.get(query)
+        if name:
+            self._prepared.move_to_end(query)
+            return name
+        if (
+            self.PREPARE_THRESHOLD is None
+            or self._in_transaction
+            or not params
+            or not isinstance(params, (tuple, list))
+        ):
+            return None
+        
+        seen = self._query_counts.get(query, 0) + 1
+        if seen <= self.PREPARE_THRESHOLD:
+            if len(self._query_counts) >= self.PREPARED_CACHE_SIZE * 4:
+                self._query_counts.clear()
+            self._query_counts[query] = seen
+            return None
+        
+        numbered = _numbered_placeholders(query)
+        if numbered is None or numbered[1] != len(params):
+            return None
+        
+        name = f"onedb_p{next(_cursor_ids)}"
+        try:
+            self._plain_cursor().execute(f"PREPARE {name} AS {numbered[0]}")
+        except Exception:
+            # Keep running it unprepared, without retrying the PREPARE
+            self._query_counts[query] = float("-inf")
+            return None
+        self._query_counts.pop(query, None)
+        self._prepared[query] = name
+        if len(self._prepared) > self.PREPARED_CACHE_SIZE:
+            _, evicted = self._prepared.popitem(last=False)
+            self._deallocate(evicted)
+        return name
+    
+    def _deallocate(self, name: str) -> None:
+        try:
+            self._plain_cursor().execute(f"DEALLOCATE {name}")
+        except Exception:
+            pass
+    
+    def execute_iter(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None,
+        chunk: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows of a SELECT through a server-side cursor.
+        
+        Rows are fetched ``chunk`` at a time, so memory stays bounded by
+        the chunk rather than the result size. Outside an explicit
+        transaction one is opened for the cursor's lifetime; other calls on
+        this adapter meanwhile run inside it (as in ``begin_transaction``).
+        It is committed when the iterator is exhausted or closed early, and
+        rolled back if the query fails.
+        
+        Example:
+            for row in db.execute_iter("SELECT * FROM events"):
+                process(row)
+        """
+        if not self._is_connected:
+            raise ConnectionError("Not connected to database")
+        
+        own_transaction = not self._in_transaction
+        if own_transaction:
+            # Named cursors only live inside a transaction
+            self._connection.autocommit = False
+            self._in_transaction = True
+        
+        try:
+            cursor = self._connection.cursor(
+                name=f"onedb_{next(_cursor_ids)}",
+                cursor_factory=self._extras.RealDictCursor
+            )
+            cursor.itersize = chunk
+            try:
+                cursor.execute(query, params)
+                yield from cursor
+            finally:
+                cursor.close()
+            if own_transaction:
+                self._connection.commit()
+        except GeneratorExit:
+            # Closed early: keep whatever ran on this adapter meanwhile
+            if own_transaction:
+                self._connection.commit()
+            raise
+        except Exception as e:
+            raise QueryError(str(e), query=query, params=params)
+        finally:
+            if own_transaction:
+                if self._connection.status != self._psycopg2.extensions.STATUS_READY:
+                    self._connection.rollback()
+                self._connection.autocommit = True
+                self._in_transaction = False
+    
     def execute_many(
         self,
         query: str,
         params_list: List[Union[tuple, dict]]
     ) -> QueryResult:
         """Execute query with multiple parameter sets."""
-        import psycopg2.extras
-        
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            cursor = self._connection.cursor()
-            psycopg2.extras.execute_batch(cursor, query, params_list)
+            cursor = self._plain_cursor()
+            self._extras.execute_batch(cursor, query, params_list)
             
             result = QueryResult()
             result.affected_rows = cursor.rowcount
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             
-            cursor.close()
             return result
             
         except Exception as e:
@@ -196,32 +569,97 @@ class PostgreSQL(BaseAdapter):
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Insert single record."""
-        columns = list(data.keys())
-        values = list(data.values())
-        placeholders = ", ".join(["%s"] * len(values))
-        columns_str = ", ".join(columns)
-        
-        query = f"""
-            INSERT INTO {table} ({columns_str})
-            VALUES ({placeholders})
-            RETURNING id
+        self._invalidate_tables(table)
+        return self.execute(_insert_sql(table, tuple(data)), tuple(data.values()))
+    
+    def insert_many(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> QueryResult:
+        """
+        Insert multiple records.
+        
+        Rows are folded into multi-row ``VALUES`` statements of
+        ``batch_size`` rows (optimal_batch_size by default) with
+        ``execute_values``, instead of one INSERT per row. Outside an
+        explicit transaction all statements are committed together.
+        
+        Batches of COPY_THRESHOLD rows or more holding only scalar values
+        are loaded with ``copy_from`` instead.
         """
+        self._invalidate_tables(table)
+        if not data:
+            return QueryResult()
+        
+        if len(data) >= self.COPY_THRESHOLD and not any(
+            isinstance(value, _NON_SCALAR) for row in data for value in row.values()
+        ):
+            return self.copy_from(table, data)
+        
+        columns = tuple(data[0])
+        query = _insert_values_sql(table, columns)
+        params_list = rows_to_tuples(data, columns)
         
-        return self.execute(query, tuple(values))
+        start_time = time.perf_counter_ns()
+        
+        own_transaction = not self._in_transaction
+        if own_transaction:
+            self._connection.autocommit = False
+        
+        try:
+            self._extras.execute_values(
+                self._plain_cursor(), query, params_list,
+                page_size=batch_size or self.optimal_batch_size
+            )
+            if own_transaction:
+                self._connection.commit()
+        except Exception as e:
+            if own_transaction:
+                self._connection.rollback()
+            raise QueryError(str(e), query=query)
+        finally:
+            if own_transaction:
+                self._connection.autocommit = True
+        
+        # rowcount only covers the last page, so count the rows sent
+        result = QueryResult(affected_rows=len(params_list))
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        """Insert multiple records."""
+    def copy_from(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
+        """
+        Bulk load records with ``COPY ... FROM STDIN``.
+        
+        Rows are streamed in PostgreSQL's text format, bypassing the SQL
+        parser; columns are taken from the first record. Values must be
+        scalars whose ``str()`` PostgreSQL accepts for the column type.
+        """
+        self._invalidate_tables(table)
         if not data:
             return QueryResult()
         
-        columns = list(data[0].keys())
-        placeholders = ", ".join(["%s"] * len(columns))
-        columns_str = ", ".join(columns)
+        columns = tuple(data[0])
+        query = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)"
+        
+        buffer = io.StringIO()
+        for row in data:
+            buffer.write("\t".join([_copy_text(row.get(col)) for col in columns]))
+            buffer.write("\n")
+        buffer.seek(0)
+        
+        start_time = time.perf_counter_ns()
         
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        params_list = [tuple(row.get(col) for col in columns) for row in data]
+        try:
+            cursor = self._plain_cursor()
+            cursor.copy_expert(query, buffer)
+        except Exception as e:
+            raise QueryError(str(e), query=query)
         
-        return self.execute_many(query, params_list)
+        result = QueryResult(affected_rows=cursor.rowcount if cursor.rowcount >= 0 else len(data))
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
     
     def update(
         self,
@@ -230,23 +668,13 @@ class PostgreSQL(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Update records."""
-        set_parts = []
-        values = []
-        
-        for key, value in data.items():
-            set_parts.append(f"{key} = %s")
-            values.append(value)
-        
-        query = f"UPDATE {table} SET {', '.join(set_parts)}"
-        
+        self._invalidate_tables(table)
+        query = _update_sql(table, tuple(data), tuple(where) if where else ())
+        values = tuple(data.values())
         if where:
-            where_parts = []
-            for key, value in where.items():
-                where_parts.append(f"{key} = %s")
-                values.append(value)
-            query += f" WHERE {' AND '.join(where_parts)}"
+            values += tuple(where.values())
         
-        return self.execute(query, tuple(values))
+        return self.execute(query, values)
     
     def delete(
         self,
@@ -254,17 +682,10 @@ class PostgreSQL(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Delete records."""
-        query = f"DELETE FROM {table}"
-        values = []
-        
+        self._invalidate_tables(table)
         if where:
-            where_parts = []
-            for key, value in where.items():
-                where_parts.append(f"{key} = %s")
-                values.append(value)
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        return self.execute(query, tuple(values) if values else None)
+            return self.execute(_delete_sql(table, tuple(where)), tuple(where.values()))
+        return self.execute(_delete_sql(table, ()))
     
     def find(
         self,
@@ -276,22 +697,18 @@ class PostgreSQL(BaseAdapter):
         offset: Optional[int] = None
     ) -> QueryResult:
         """Find records."""
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
         values = []
-        
         if where:
-            where_parts = []
-            for key, value in where.items():
-                if value is None:
-                    where_parts.append(f"{key} IS NULL")
-                else:
-                    where_parts.append(f"{key} = %s")
-                    values.append(value)
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
+            values = [value for value in where.values() if value is not None]
+            query = _find_sql(
+                table,
+                tuple(columns) if columns else None,
+                tuple(where),
+                tuple([value is None for value in where.values()]),
+                order_by
+            )
+        else:
+            query = _find_sql(table, tuple(columns) if columns else None, (), (), order_by)
         
         if limit:
             query += f" LIMIT {limit}"
@@ -299,7 +716,7 @@ class PostgreSQL(BaseAdapter):
         if offset:
             query += f" OFFSET {offset}"
         
-        return self.execute(query, tuple(values) if values else None)
+        return self._cached_execute(query, tuple(values) if values else None)
     
     def begin_transaction(self) -> None:
         """Start transaction."""
@@ -71,7 +71,7 @@ class Redis(BaseAdapter):
                 password=self.config.password,
                 socket_timeout=self.config.timeout,
                 decode_responses=True,
-                **self.config.extra
+                **self._driver_extra()
             )
             
             # Test connection
@@ -2,13 +2,50 @@
 Snowflake Adapter.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+from functools import lru_cache
 import time
 
 from ..core.base import BaseAdapter, ConnectionConfig, QueryResult, DatabaseType
+from ..core.row import row_class, rows_to_tuples
 from ..exceptions import ConnectionError, QueryError, DriverNotInstalledError
 
 
+# SQL for the CRUD helpers depends only on the table and column names of a
+# call, so each shape is rendered once.
+
+@lru_cache(maxsize=512)
+def _insert_sql(table: str, columns: tuple) -> str:
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table: str, set_keys: tuple, where_keys: tuple) -> str:
+    query = f"UPDATE {table} SET {', '.join([f'{k} = %s' for k in set_keys])}"
+    if where_keys:
+        query += f" WHERE {' AND '.join([f'{k} = %s' for k in where_keys])}"
+    return query
+
+
+@lru_cache(maxsize=512)
+def _delete_sql(table: str, where_keys: tuple) -> str:
+    if where_keys:
+        return f"DELETE FROM {table} WHERE {' AND '.join([f'{k} = %s' for k in where_keys])}"
+    return f"DELETE FROM {table}"
+
+
+@lru_cache(maxsize=512)
+def _find_sql(table: str, columns: Optional[tuple], where_keys: tuple, order_by: Optional[str]) -> str:
+    """SELECT without LIMIT/OFFSET."""
+    query = f"SELECT {', '.join(columns) if columns else '*'} FROM {table}"
+    if where_keys:
+        query += f" WHERE {' AND '.join([f'{k} = %s' for k in where_keys])}"
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query
+
+
 class Snowflake(BaseAdapter):
     """
     Snowflake data warehouse adapter.
@@ -21,11 +58,18 @@ class Snowflake(BaseAdapter):
     driver_name = "snowflake-connector-python"
     install_command = "pip install onedb[snowflake]"
     
+    # insert_many switches from executemany to a staged COPY INTO at this size
+    WRITE_PANDAS_THRESHOLD = 100
+    
+    # Rows per staged Parquet chunk in insert_many
+    optimal_batch_size = 16000
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         self._account = self.config.extra.get("account", self.config.host)
         self._warehouse = self.config.extra.get("warehouse")
         self._schema = self.config.extra.get("schema", "PUBLIC")
+        self._cursor = None
     
     def _import_driver(self):
         try:
@@ -56,7 +100,23 @@ class Snowflake(BaseAdapter):
                 database=self.config.database
             )
     
+    def _get_cursor(self):
+        """Cursor reused by execute/execute_many, created on first use."""
+        if self._cursor is None:
+            self._cursor = self._connection.cursor()
+        return self._cursor
+    
+    def _discard_cursor(self) -> None:
+        """Drop the shared cursor, e.g. after it raised."""
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+    
     def disconnect(self) -> None:
+        self._discard_cursor()
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -78,10 +138,10 @@ class Snowflake(BaseAdapter):
         query: str,
         params: Optional[Union[tuple, dict]] = None
     ) -> QueryResult:
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            cursor = self._connection.cursor()
+            cursor = self._get_cursor()
             
             if params:
                 cursor.execute(query, params)
@@ -91,72 +151,207 @@ class Snowflake(BaseAdapter):
             result = QueryResult()
             
             if cursor.description:
-                result.columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                result.data = [dict(zip(result.columns, row)) for row in rows]
+                columns = [desc[0] for desc in cursor.description]
+                arrays = self._fetch_columns(cursor, columns)
+                if arrays is None:
+                    result.data = list(map(row_class(tuple(columns)), cursor.fetchall()))
+                else:
+                    result = QueryResult.from_columns(columns, arrays)
+                result.columns = columns
             
             result.affected_rows = cursor.rowcount
-            cursor.close()
             
-            result.execution_time = (time.time() - start_time) * 1000
+            result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
             return result
             
+        except Exception as e:
+            self._discard_cursor()
+            raise QueryError(str(e), query=query, params=params)
+    
+    @staticmethod
+    def _fetch_columns(cursor, columns: List[str]) -> Optional[List[list]]:
+        """
+        Read all rows column by column, one Arrow batch at a time.
+        
+        Arrow batches skip the connector's per-cell row conversion and
+        map straight onto ``QueryResult.from_columns``, so no per-row dict
+        is built; each batch is released before the next is downloaded.
+        Returns None when the result is not delivered in Arrow format (or
+        pyarrow is missing) and the caller should use ``fetchall``.
+        """
+        try:
+            import pyarrow  # noqa: F401
+            from snowflake.connector.errors import NotSupportedError
+        except ImportError:
+            return None
+        
+        arrays: List[list] = [[] for _ in columns]
+        fetched = False
+        try:
+            for batch in cursor.fetch_arrow_batches():
+                fetched = True
+                for values, array in zip(arrays, batch.columns):
+                    values.extend(array.to_pylist())
+        except NotSupportedError:
+            if fetched:
+                raise
+            return None
+        return arrays
+    
+    def execute_arrow(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None
+    ):
+        """
+        Run a SELECT and return the result as a ``pyarrow.Table``.
+        
+        Use ``table.to_pandas()`` or ``table.to_pylist()`` to convert only
+        when needed.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise DriverNotInstalledError("pyarrow", "pip install pyarrow")
+        
+        try:
+            cursor = self._connection.cursor()
+            try:
+                cursor.execute(query, params)
+                table = cursor.fetch_arrow_all()
+                if table is None:
+                    # Empty result: keep the column names
+                    table = pyarrow.table({desc[0]: [] for desc in cursor.description or []})
+                return table
+            finally:
+                cursor.close()
+        except Exception as e:
+            raise QueryError(str(e), query=query, params=params)
+    
+    def execute_iter(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None,
+        chunk: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows of a SELECT one result batch at a time.
+        
+        Uses ``fetch_arrow_batches`` when pyarrow is installed; otherwise
+        the cursor is iterated with ``arraysize`` set to ``chunk``.
+        """
+        try:
+            cursor = self._connection.cursor()
+            cursor.arraysize = chunk
+            try:
+                cursor.execute(query, params)
+                try:
+                    import pyarrow  # noqa: F401
+                except ImportError:
+                    yield from map(row_class(tuple(desc[0] for desc in cursor.description)), cursor)
+                else:
+                    for batch in cursor.fetch_arrow_batches():
+                        yield from batch.to_pylist()
+            finally:
+                cursor.close()
+        except GeneratorExit:
+            raise
         except Exception as e:
             raise QueryError(str(e), query=query, params=params)
     
     def execute_many(self, query: str, params_list: List) -> QueryResult:
-        start_time = time.time()
-        cursor = self._connection.cursor()
-        cursor.executemany(query, params_list)
+        start_time = time.perf_counter_ns()
+        
+        try:
+            cursor = self._get_cursor()
+            cursor.executemany(query, params_list)
+        except Exception as e:
+            self._discard_cursor()
+            raise QueryError(str(e), query=query)
         
         result = QueryResult(affected_rows=cursor.rowcount)
-        result.execution_time = (time.time() - start_time) * 1000
-        cursor.close()
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
         return result
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
-        columns = list(data.keys())
-        placeholders = ", ".join(["%s" for _ in columns])
-        columns_str = ", ".join(columns)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        return self.execute(query, tuple(data.values()))
+        self._invalidate_tables(table)
+        return self.execute(_insert_sql(table, tuple(data)), tuple(data.values()))
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
+    def insert_many(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> QueryResult:
+        """
+        Insert multiple records.
+        
+        Batches of WRITE_PANDAS_THRESHOLD rows or more are loaded with
+        ``write_pandas`` (Parquet chunks of ``batch_size`` rows uploaded to
+        a stage, then one COPY INTO) when pandas is installed; smaller
+        batches use executemany. Inside a transaction executemany is always
+        used, because the stage DDL ``write_pandas`` runs would implicitly
+        commit the caller's pending work.
+        """
+        self._invalidate_tables(table)
         if not data:
             return QueryResult()
         
-        columns = list(data[0].keys())
-        placeholders = ", ".join(["%s" for _ in columns])
-        columns_str = ", ".join(columns)
+        if len(data) >= self.WRITE_PANDAS_THRESHOLD and not self._in_transaction:
+            result = self._write_pandas(table, data, batch_size or self.optimal_batch_size)
+            if result is not None:
+                return result
         
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        params_list = [tuple(row.values()) for row in data]
+        columns = tuple(data[0])
+        query = _insert_sql(table, columns)
+        params_list = rows_to_tuples(data, columns)
         return self.execute_many(query, params_list)
     
-    def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
-        set_parts = [f"{k} = %s" for k in data.keys()]
-        values = list(data.values())
+    def _write_pandas(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        chunk_size: int
+    ) -> Optional[QueryResult]:
+        """Bulk load via write_pandas; None if pandas support is unavailable."""
+        try:
+            import pandas as pd
+            from snowflake.connector.pandas_tools import write_pandas
+        except ImportError:
+            return None
         
-        query = f"UPDATE {table} SET {', '.join(set_parts)}"
+        start_time = time.perf_counter_ns()
+        
+        try:
+            _, _, nrows, _ = write_pandas(
+                self._connection,
+                pd.DataFrame(data),
+                table_name=table,
+                quote_identifiers=False,
+                chunk_size=chunk_size,
+                compression="snappy"
+            )
+        except Exception as e:
+            raise QueryError(str(e), query=f"COPY INTO {table}")
         
+        result = QueryResult(affected_rows=nrows)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    def update(self, table: str, data: Dict[str, Any], where: Optional[Dict[str, Any]] = None) -> QueryResult:
+        self._invalidate_tables(table)
+        query = _update_sql(table, tuple(data), tuple(where) if where else ())
+        values = tuple(data.values())
         if where:
-            where_parts = [f"{k} = %s" for k in where.keys()]
-            values.extend(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
+            values += tuple(where.values())
         
-        return self.execute(query, tuple(values))
+        return self.execute(query, values)
     
     def delete(self, table: str, where: Optional[Dict[str, Any]] = None) -> QueryResult:
-        query = f"DELETE FROM {table}"
-        values = []
-        
+        self._invalidate_tables(table)
         if where:
-            where_parts = [f"{k} = %s" for k in where.keys()]
-            values = list(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        return self.execute(query, tuple(values) if values else None)
+            return self.execute(_delete_sql(table, tuple(where)), tuple(where.values()))
+        return self.execute(_delete_sql(table, ()))
     
     def find(
         self,
@@ -167,17 +362,12 @@ class Snowflake(BaseAdapter):
         limit: Optional[int] = None,
         offset: Optional[int] = None
     ) -> QueryResult:
-        cols = ", ".join(columns) if columns else "*"
-        query = f"SELECT {cols} FROM {table}"
-        values = []
-        
-        if where:
-            where_parts = [f"{k} = %s" for k in where.keys()]
-            values = list(where.values())
-            query += f" WHERE {' AND '.join(where_parts)}"
-        
-        if order_by:
-            query += f" ORDER BY {order_by}"
+        query = _find_sql(
+            table,
+            tuple(columns) if columns else None,
+            tuple(where) if where else (),
+            order_by
+        )
         
         if limit:
             query += f" LIMIT {limit}"
@@ -185,18 +375,18 @@ class Snowflake(BaseAdapter):
         if offset:
             query += f" OFFSET {offset}"
         
-        return self.execute(query, tuple(values) if values else None)
+        return self._cached_execute(query, tuple(where.values()) if where else None)
     
     def begin_transaction(self) -> None:
-        self._connection.cursor().execute("BEGIN")
+        self._get_cursor().execute("BEGIN")
         self._in_transaction = True
     
     def commit(self) -> None:
-        self._connection.cursor().execute("COMMIT")
+        self._get_cursor().execute("COMMIT")
         self._in_transaction = False
     
     def rollback(self) -> None:
-        self._connection.cursor().execute("ROLLBACK")
+        self._get_cursor().execute("ROLLBACK")
         self._in_transaction = False
     
     def get_tables(self) -> List[str]:
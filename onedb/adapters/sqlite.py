@@ -34,6 +34,10 @@ class SQLite(BaseAdapter):
     driver_name = "sqlite3"
     install_command = "Built-in, no installation needed"
     
+    # Multi-row inserts (BaseAdapter.insert_many) within SQLITE_MAX_VARIABLE_NUMBER
+    placeholder = "?"
+    max_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         super().__init__(config, **kwargs)
         
@@ -137,6 +141,7 @@ class SQLite(BaseAdapter):
     
     def insert(self, table: str, data: Dict[str, Any]) -> QueryResult:
         """Insert record."""
+        self._invalidate_tables(table)
         columns = list(data.keys())
         placeholders = ", ".join(["?"] * len(columns))
         columns_str = ", ".join(columns)
@@ -145,20 +150,6 @@ class SQLite(BaseAdapter):
         query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
         return self.execute(query, values)
     
-    def insert_many(self, table: str, data: List[Dict[str, Any]]) -> QueryResult:
-        """Insert multiple records."""
-        if not data:
-            return QueryResult()
-        
-        columns = list(data[0].keys())
-        placeholders = ", ".join(["?"] * len(columns))
-        columns_str = ", ".join(columns)
-        
-        query = f"INSERT INTO {table} ({columns_str}) VALUES ({placeholders})"
-        params_list = [tuple(row.get(col) for col in columns) for row in data]
-        
-        return self.execute_many(query, params_list)
-    
     def update(
         self,
         table: str,
@@ -166,6 +157,7 @@ class SQLite(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Update records."""
+        self._invalidate_tables(table)
         set_parts = [f"{k} = ?" for k in data.keys()]
         values = list(data.values())
         
@@ -184,6 +176,7 @@ class SQLite(BaseAdapter):
         where: Optional[Dict[str, Any]] = None
     ) -> QueryResult:
         """Delete records."""
+        self._invalidate_tables(table)
         query = f"DELETE FROM {table}"
         values = []
         
@@ -220,7 +213,7 @@ class SQLite(BaseAdapter):
         if offset:
             query += f" OFFSET {offset}"
         
-        return self.execute(query, tuple(values) if values else None)
+        return self._cached_execute(query, tuple(values) if values else None)
     
     def begin_transaction(self) -> None:
         """Start transaction."""
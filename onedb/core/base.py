@@ -4,19 +4,74 @@ All database adapters inherit from BaseAdapter.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import (
-    Any, Dict, List, Optional, Union, 
+    Any, Callable, Dict, List, Optional, Union, 
     AsyncIterator, Iterator, TypeVar, Generic
 )
 from contextlib import contextmanager, asynccontextmanager
 from enum import Enum
-import logging
+from functools import lru_cache
+from itertools import chain, groupby
+import re
+import sys
+import threading
+import time
+
+from .row import row_class, tuple_getter
+from ..exceptions import DriverNotInstalledError, ValidationError
+
+
+def __getattr__(name: str) -> Any:
+    # ``logger`` is built on first use so importing onedb does not import logging
+    if name == "logger":
+        import logging
+        return logging.getLogger("onedb")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logger = logging.getLogger("onedb")
 
 T = TypeVar("T")
 
+# Instances without a __dict__ where dataclasses support it (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Rows per multi-row INSERT when neither the caller nor the adapter says
+DEFAULT_INSERT_BATCH = 500
+
+
+_TABLE_REF_RE = re.compile(r"\b(?:FROM|JOIN)\s+([\w.\"`\[\]]+)", re.IGNORECASE)
+
+
+def _table_key(name: str) -> str:
+    """Unquoted, lower-case table name without its schema."""
+    return name.strip('"`[]').rsplit(".", 1)[-1].strip('"`[]').lower()
+
+
+@lru_cache(maxsize=512)
+def _read_tables(query: str) -> Optional[tuple]:
+    """Tables a SELECT reads, or None for anything the query cache must skip."""
+    words = query.split(None, 1)
+    if not words or words[0].upper() not in ("SELECT", "WITH"):
+        return None
+    tables = tuple(sorted({_table_key(name) for name in _TABLE_REF_RE.findall(query)}))
+    return tables or None
+
+
+def _freeze_params(params: Any) -> Any:
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    if isinstance(params, list):
+        return tuple(params)
+    return params
+
+
+@lru_cache(maxsize=128)
+def _multi_insert_sql(table: str, columns: tuple, rows: int, placeholder: str) -> str:
+    """``INSERT ... VALUES (...), (...)`` with ``rows`` placeholder groups."""
+    group = "(" + ", ".join([placeholder] * len(columns)) + ")"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([group] * rows)
+
 
 class DatabaseType(Enum):
     """Supported database types."""
@@ -37,7 +92,7 @@ class DatabaseType(Enum):
     NEO4J = "neo4j"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConnectionConfig:
     """
     Universal connection configuration.
@@ -65,59 +120,169 @@ class ConnectionConfig:
     
     def to_uri(self, scheme: str) -> str:
         """Convert config to connection URI."""
-        auth = ""
         if self.user:
-            auth = f"{self.user}"
-            if self.password:
-                auth += f":{self.password}"
-            auth += "@"
-        
-        host_port = self.host
-        if self.port:
-            host_port += f":{self.port}"
-        
+            auth = f"{self.user}:{self.password}@" if self.password else f"{self.user}@"
+        else:
+            auth = ""
+        port = f":{self.port}" if self.port else ""
         db = f"/{self.database}" if self.database else ""
-        
-        return f"{scheme}://{auth}{host_port}{db}"
+        return f"{scheme}://{auth}{self.host}{port}{db}"
 
 
-@dataclass
 class QueryResult:
     """
     Universal query result container.
     
+    Rows are stored either as a list of mappings or, for results built with
+    ``from_columns``, as one list per column. Columnar results materialize
+    rows only when ``data`` is read; iteration, indexing and ``column()``
+    work straight from the column lists.
+    
     Attributes:
         data: Query result data
         affected_rows: Number of affected rows
         last_id: Last inserted ID
         columns: Column names
         execution_time: Query execution time in ms
+        aggregations: Aggregation results, for databases that return them
     """
-    data: List[Dict[str, Any]] = field(default_factory=list)
-    affected_rows: int = 0
-    last_id: Optional[Any] = None
-    columns: List[str] = field(default_factory=list)
-    execution_time: float = 0.0
+    
+    __slots__ = (
+        "_data", "_columnar", "affected_rows", "last_id",
+        "columns", "execution_time", "aggregations",
+    )
+    
+    def __init__(
+        self,
+        data: Optional[List[Dict[str, Any]]] = None,
+        affected_rows: int = 0,
+        last_id: Optional[Any] = None,
+        columns: Optional[List[str]] = None,
+        execution_time: float = 0.0,
+        aggregations: Optional[Dict[str, Any]] = None
+    ):
+        self._data = [] if data is None else data
+        self._columnar: Optional[Dict[str, list]] = None
+        self.affected_rows = affected_rows
+        self.last_id = last_id
+        self.columns = [] if columns is None else columns
+        self.execution_time = execution_time
+        self.aggregations = aggregations
+    
+    @classmethod
+    def from_columns(
+        cls,
+        columns: List[str],
+        arrays: List[list],
+        **kwargs
+    ) -> "QueryResult":
+        """
+        Build a result from per-column value lists.
+        
+        Args:
+            columns: Column names
+            arrays: One sequence of values per column, all the same length
+            **kwargs: Other QueryResult attributes (affected_rows, ...)
+        """
+        result = cls(columns=list(columns), **kwargs)
+        result._data = None
+        result._columnar = dict(zip(result.columns, arrays))
+        return result
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """Result rows; built on first access for columnar results."""
+        if self._data is None:
+            self._data = list(self._iter_columnar())
+        return self._data
+    
+    @data.setter
+    def data(self, value: List[Dict[str, Any]]) -> None:
+        self._data = value
+        self._columnar = None
+    
+    def _iter_columnar(self) -> Iterator[Dict[str, Any]]:
+        make = row_class(tuple(self.columns))
+        return map(make, zip(*[self._columnar[c] for c in self.columns]))
+    
+    def column(self, name: str) -> list:
+        """Values of one column (the stored list for columnar results)."""
+        if self._columnar is not None:
+            return self._columnar[name]
+        return [row.get(name) for row in self._data]
+    
+    def to_numpy(self, name: Optional[str] = None):
+        """
+        Column(s) as NumPy arrays.
+        
+        Returns one array for ``name``, otherwise ``{column: array}``.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise DriverNotInstalledError("numpy", "pip install numpy")
+        
+        if name is not None:
+            return numpy.asarray(self.column(name))
+        return {c: numpy.asarray(self.column(c)) for c in self.columns}
+    
+    def to_arrow(self):
+        """Result as a ``pyarrow.Table``."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise DriverNotInstalledError("pyarrow", "pip install pyarrow")
+        
+        return pyarrow.table({c: self.column(c) for c in self.columns})
     
     def __len__(self) -> int:
-        return len(self.data)
+        if self._data is None:
+            return len(self._columnar[self.columns[0]]) if self.columns else 0
+        return len(self._data)
     
     def __iter__(self) -> Iterator[Dict[str, Any]]:
-        return iter(self.data)
+        if self._data is None:
+            return self._iter_columnar()
+        return iter(self._data)
     
     def __getitem__(self, index: int) -> Dict[str, Any]:
+        if self._data is None and isinstance(index, int):
+            values = tuple([self._columnar[c][index] for c in self.columns])
+            return row_class(tuple(self.columns))(values)
         return self.data[index]
     
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+    
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return (
+            f"QueryResult(data={self.data!r}, affected_rows={self.affected_rows!r}, "
+            f"last_id={self.last_id!r}, columns={self.columns!r}, "
+            f"execution_time={self.execution_time!r}, aggregations={self.aggregations!r})"
+        )
+    
+    def _astuple(self) -> tuple:
+        return (
+            self.data, self.affected_rows, self.last_id,
+            self.columns, self.execution_time, self.aggregations,
+        )
+    
     @property
     def first(self) -> Optional[Dict[str, Any]]:
         """Get first row."""
-        return self.data[0] if self.data else None
+        return self[0] if len(self) else None
     
     @property
     def scalar(self) -> Optional[Any]:
         """Get first value of first row."""
-        if self.data and self.columns:
-            return self.data[0].get(self.columns[0])
+        if self._data is None:
+            return self._columnar[self.columns[0]][0] if len(self) else None
+        if self._data and self.columns:
+            return self._data[0].get(self.columns[0])
         return None
 
 
@@ -139,6 +304,18 @@ class BaseAdapter(ABC):
     driver_name: str
     install_command: str
     
+    # Rows sent per statement/round trip by insert_many; None sends all at once
+    optimal_batch_size: Optional[int] = None
+    
+    # Bind placeholder and per-statement bind limit used by the default insert_many
+    placeholder: str = "%s"
+    max_params: Optional[int] = None
+    
+    # config.extra options read by BaseAdapter itself; never passed to drivers
+    _BASE_EXTRA_KEYS = frozenset({
+        "batch_size", "stmt_cache_size", "query_cache_size", "query_cache_ttl",
+    })
+    
     def __init__(self, config: Optional[ConnectionConfig] = None, **kwargs):
         """
         Initialize adapter.
@@ -156,7 +333,27 @@ class BaseAdapter(ABC):
         self._is_connected = False
         self._in_transaction = False
         
-        logger.debug(f"Initialized {self.__class__.__name__} adapter")
+        # query -> driver prepared statement, most recently used last
+        self._stmt_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._stmt_cache_size = int(self.config.extra.get("stmt_cache_size", 256))
+        self._stmt_cache_lock = threading.Lock()
+        
+        # Opt-in LRU of fetch_*/find results (extra["query_cache_size"]).
+        # Keys carry the version of every table a query reads; writes through
+        # the CRUD methods bump the version so stale entries are never hit
+        extra = self.config.extra
+        self._query_cache_size = int(extra.get("query_cache_size", 0))
+        self._query_cache_ttl = (
+            float(extra["query_cache_ttl"]) if extra.get("query_cache_ttl") else None
+        )
+        self._query_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._table_versions: Dict[str, int] = {}
+        self._query_cache_lock = threading.Lock()
+        
+        # Nothing can be listening unless the application imported logging
+        logging = sys.modules.get("logging")
+        if logging is not None:
+            logging.getLogger("onedb").debug("Initialized %s adapter", self.__class__.__name__)
     
     # ==================== Connection Methods ====================
     
@@ -188,6 +385,62 @@ class BaseAdapter(ABC):
         self.disconnect()
         self.connect()
     
+    def _driver_extra(self, *consumed: str) -> Dict[str, Any]:
+        """
+        ``config.extra`` minus the options BaseAdapter reads and the
+        adapter's own ``consumed`` keys, for spreading into a driver call.
+        """
+        skip = self._BASE_EXTRA_KEYS.union(consumed)
+        return {k: v for k, v in self.config.extra.items() if k not in skip}
+    
+    def _extra_flag(self, name: str, default: bool) -> bool:
+        """Read a boolean option from ``config.extra`` (URI values are strings)."""
+        value = self.config.extra.get(name, default)
+        if isinstance(value, str):
+            return value.lower() in ("true", "1", "yes")
+        return bool(value)
+    
+    def _shares_connections(self) -> bool:
+        """
+        Whether adapters built from this config draw on the same shared
+        pool or client as this one, so they reach the same database and
+        hand their connections back for reuse.
+        """
+        return False
+    
+    def _clone(self) -> "BaseAdapter":
+        """
+        New, unconnected adapter configured like this one.
+        
+        Adapters whose constructors take options beyond ``config`` override
+        this to pass them on.
+        """
+        return type(self)(config=self.config)
+    
+    def _cached_prepare(self, query: str, prepare: Callable[[str], Any]) -> Any:
+        """
+        Driver prepared statement for ``query``, prepared once per connection.
+        
+        ``prepare`` is the driver call that builds the statement (e.g.
+        ``session.prepare``). Statements are kept in an LRU of
+        ``extra["stmt_cache_size"]`` entries (256 by default, 0 disables it);
+        adapters clear ``_stmt_cache`` when the connection they belong to
+        is closed.
+        """
+        with self._stmt_cache_lock:
+            statement = self._stmt_cache.get(query)
+            if statement is not None:
+                self._stmt_cache.move_to_end(query)
+                return statement
+        
+        statement = prepare(query)
+        if self._stmt_cache_size > 0:
+            with self._stmt_cache_lock:
+                self._stmt_cache[query] = statement
+                if len(self._stmt_cache) > self._stmt_cache_size:
+                    self._stmt_cache.popitem(last=False)
+        return statement
+    
     # ==================== Query Methods ====================
     
     @abstractmethod
@@ -199,6 +452,9 @@ class BaseAdapter(ABC):
         """
         Execute a query.
         
+        Adapters whose driver can prepare statements client-side should
+        run repeated parameterized queries through ``_cached_prepare``.
+        
         Args:
             query: SQL query or command
             params: Query parameters
@@ -223,7 +479,7 @@ class BaseAdapter(ABC):
         params: Optional[Union[tuple, dict]] = None
     ) -> Optional[Dict[str, Any]]:
         """Fetch single row."""
-        result = self.execute(query, params)
+        result = self._cached_execute(query, params)
         return result.first
     
     def fetch_all(
@@ -232,7 +488,7 @@ class BaseAdapter(ABC):
         params: Optional[Union[tuple, dict]] = None
     ) -> List[Dict[str, Any]]:
         """Fetch all rows."""
-        result = self.execute(query, params)
+        result = self._cached_execute(query, params)
         return result.data
     
     def fetch_scalar(
@@ -241,9 +497,87 @@ class BaseAdapter(ABC):
         params: Optional[Union[tuple, dict]] = None
     ) -> Optional[Any]:
         """Fetch single value."""
-        result = self.execute(query, params)
+        result = self._cached_execute(query, params)
         return result.scalar
     
+    def _cached_execute(
+        self,
+        query: str,
+        params: Optional[Union[tuple, dict]] = None
+    ) -> QueryResult:
+        """
+        ``execute`` answered from the query cache when it is enabled.
+        
+        Only SELECT/WITH statements that name their tables are cached, and
+        nothing is cached inside a transaction. Entries expire after
+        ``extra["query_cache_ttl"]`` seconds when set; the cache cannot see
+        writes made through raw ``execute`` or by other clients, so use
+        ``clear_query_cache`` (or a TTL) for those.
+        """
+        if not self._query_cache_size or self._in_transaction:
+            return self.execute(query, params)
+        tables = _read_tables(query)
+        if tables is None:
+            return self.execute(query, params)
+        
+        frozen = _freeze_params(params)
+        try:
+            hash(frozen)
+        except TypeError:
+            return self.execute(query, params)
+        
+        now = time.monotonic()
+        with self._query_cache_lock:
+            versions = self._table_versions
+            key = (query, frozen, tuple([versions.get(t, 0) for t in tables]))
+            entry = self._query_cache.get(key)
+            if entry is not None:
+                if self._query_cache_ttl is None or now - entry[0] < self._query_cache_ttl:
+                    self._query_cache.move_to_end(key)
+                    return self._copy_result(entry[1])
+                del self._query_cache[key]
+        
+        result = self.execute(query, params)
+        with self._query_cache_lock:
+            self._query_cache[key] = (now, self._copy_result(result))
+            if len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _copy_result(result: QueryResult) -> QueryResult:
+        """Copy of ``result`` down to the rows, so callers cannot alter the cache."""
+        fields = {
+            "affected_rows": result.affected_rows,
+            "last_id": result.last_id,
+            "execution_time": result.execution_time,
+            "aggregations": result.aggregations,
+        }
+        if result._data is None:
+            return QueryResult.from_columns(
+                result.columns, [list(result.column(c)) for c in result.columns], **fields
+            )
+        return QueryResult(
+            data=[dict(row) for row in result.data],
+            columns=list(result.columns),
+            **fields
+        )
+    
+    def _invalidate_tables(self, *tables: str) -> None:
+        """Make cached reads of ``tables`` stale."""
+        if not self._query_cache_size:
+            return
+        names = [_table_key(table) for table in tables]
+        with self._query_cache_lock:
+            versions = self._table_versions
+            for name in names:
+                versions[name] = versions.get(name, 0) + 1
+    
+    def clear_query_cache(self) -> None:
+        """Drop every cached query result."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
     # ==================== CRUD Methods ====================
     
     @abstractmethod
@@ -255,14 +589,109 @@ class BaseAdapter(ABC):
         """Insert single record."""
         pass
     
-    @abstractmethod
     def insert_many(
         self, 
         table: str, 
-        data: List[Dict[str, Any]]
+        data: List[Dict[str, Any]],
+        batch_size: Optional[int] = None
     ) -> QueryResult:
-        """Insert multiple records."""
-        pass
+        """
+        Insert multiple records.
+        
+        The default sends one multi-row ``INSERT ... VALUES (...), (...)``
+        per ``batch_size`` rows (``extra["batch_size"]``, then
+        optimal_batch_size, then DEFAULT_INSERT_BATCH), capped so a statement
+        stays under ``max_params`` binds. Consecutive rows with the same keys
+        share a statement; all chunks run in one transaction. Adapters whose
+        dialect or driver has a better bulk path override this.
+        """
+        if not data:
+            return QueryResult()
+        
+        self._invalidate_tables(table)
+        start_time = time.perf_counter_ns()
+        batch_size = int(
+            batch_size
+            or self.config.extra.get("batch_size")
+            or self.optimal_batch_size
+            or DEFAULT_INSERT_BATCH
+        )
+        
+        def run() -> int:
+            count = 0
+            for columns, rows in groupby(data, key=tuple):
+                rows = list(rows)
+                size = batch_size
+                if self.max_params:
+                    size = max(1, min(size, self.max_params // len(columns)))
+                get = tuple_getter(columns)
+                for start in range(0, len(rows), size):
+                    chunk = rows[start:start + size]
+                    query = _multi_insert_sql(table, columns, len(chunk), self.placeholder)
+                    params = tuple(chain.from_iterable(map(get, chunk)))
+                    count += self.execute(query, params).affected_rows
+            return count
+        
+        if self._in_transaction:
+            affected = run()
+        else:
+            with self.transaction():
+                affected = run()
+        
+        result = QueryResult(affected_rows=affected)
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
+    
+    def insert_many_parallel(
+        self,
+        table: str,
+        data: List[Dict[str, Any]],
+        workers: int = 4
+    ) -> QueryResult:
+        """
+        Insert records over ``workers`` connections concurrently.
+        
+        ``data`` is split into one slice per worker; each slice is loaded
+        with ``insert_many`` by a separate adapter built from this config,
+        which takes its connection from the pool (or client) this adapter
+        shares. The load is not atomic: slices commit independently, so a
+        failure can leave others applied.
+        
+        Raises:
+            ValidationError: inside a transaction, or when the adapter is
+                not connected through a shared pool (e.g. SQLite, where each
+                worker would open its own connection or database)
+        """
+        if workers <= 1 or len(data) < 2:
+            return self.insert_many(table, data)
+        if self._in_transaction:
+            raise ValidationError("insert_many_parallel() cannot run inside a transaction")
+        if not self._shares_connections():
+            raise ValidationError(
+                f"insert_many_parallel() needs a connected {self.__class__.__name__} "
+                f"adapter using a shared connection pool"
+            )
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        start_time = time.perf_counter_ns()
+        size = -(-len(data) // workers)
+        chunks = [data[start:start + size] for start in range(0, len(data), size)]
+        
+        def load(chunk: List[Dict[str, Any]]) -> QueryResult:
+            adapter = self._clone()
+            adapter.connect()
+            try:
+                return adapter.insert_many(table, chunk)
+            finally:
+                adapter.disconnect()
+        
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = list(executor.map(load, chunks))
+        
+        result = QueryResult(affected_rows=sum(r.affected_rows for r in results))
+        result.execution_time = (time.perf_counter_ns() - start_time) / 1_000_000
+        return result
     
     @abstractmethod
     def update(
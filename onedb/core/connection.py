@@ -4,8 +4,8 @@ Manages database connection pooling.
 """
 
 from typing import Any, Dict, Optional, List
-from threading import Lock
-from queue import Queue, Empty
+from collections import deque
+from threading import Condition
 import time
 
 
@@ -53,9 +53,10 @@ class ConnectionPool:
         self._validate_func = validate_func or (lambda c: True)
         self._close_func = close_func or (lambda c: c.close())
         
-        self._pool: Queue = Queue(maxsize=max_size)
+        # Idle connections and the count of open ones, both under _cond
+        self._idle: deque = deque()
         self._size = 0
-        self._lock = Lock()
+        self._cond = Condition()
         self._closed = False
         
         # Pre-create minimum connections
@@ -66,10 +67,10 @@ class ConnectionPool:
         for _ in range(self._min_size):
             try:
                 conn = self._create_func()
-                self._pool.put(conn)
-                self._size += 1
             except Exception:
                 break
+            self._idle.append(conn)
+            self._size += 1
     
     def acquire(self, timeout: Optional[float] = None) -> Any:
         """
@@ -85,48 +86,42 @@ class ConnectionPool:
             TimeoutError: If no connection available
             RuntimeError: If pool is closed
         """
-        if self._closed:
-            raise RuntimeError("Connection pool is closed")
-        
         timeout = timeout or self._timeout
+        deadline = time.monotonic() + timeout
         
-        # Try to get from pool
-        try:
-            conn = self._pool.get(timeout=0.1)
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._size < self._max_size:
+                        # Reserve the slot; connect outside the lock
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Could not acquire connection within {timeout} seconds"
+                        )
+                    self._cond.wait(remaining)
+            
+            if conn is None:
+                try:
+                    return self._create_func()
+                except Exception:
+                    self._discard()
+                    raise
+            
             if self._validate_func(conn):
                 return conn
-            else:
-                # Connection invalid, close and create new
-                self._safe_close(conn)
-                with self._lock:
-                    self._size -= 1
-        except Empty:
-            pass
-        
-        # Create new if under max
-        with self._lock:
-            if self._size < self._max_size:
-                conn = self._create_func()
-                self._size += 1
-                return conn
-        
-        # Wait for available connection
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                conn = self._pool.get(timeout=0.5)
-                if self._validate_func(conn):
-                    return conn
-                else:
-                    self._safe_close(conn)
-                    with self._lock:
-                        self._size -= 1
-            except Empty:
-                continue
-        
-        raise TimeoutError(
-            f"Could not acquire connection within {timeout} seconds"
-        )
+            
+            # Connection invalid, close it and try again
+            self._safe_close(conn)
+            self._discard()
     
     def release(self, conn: Any) -> None:
         """
@@ -135,21 +130,22 @@ class ConnectionPool:
         Args:
             conn: Connection to release
         """
-        if self._closed:
-            self._safe_close(conn)
-            return
+        if not self._closed and self._validate_func(conn):
+            with self._cond:
+                if not self._closed and len(self._idle) < self._max_size:
+                    self._idle.append(conn)
+                    self._cond.notify()
+                    return
         
-        if self._validate_func(conn):
-            try:
-                self._pool.put_nowait(conn)
-            except:
-                self._safe_close(conn)
-                with self._lock:
-                    self._size -= 1
-        else:
-            self._safe_close(conn)
-            with self._lock:
+        self._safe_close(conn)
+        self._discard()
+    
+    def _discard(self) -> None:
+        """Give up one connection slot and wake a waiter."""
+        with self._cond:
+            if self._size > 0:
                 self._size -= 1
+            self._cond.notify()
     
     def _safe_close(self, conn: Any) -> None:
         """Safely close connection."""
@@ -160,16 +156,15 @@ class ConnectionPool:
     
     def close(self) -> None:
         """Close all connections in pool."""
-        self._closed = True
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size = 0
+            self._cond.notify_all()
         
-        while True:
-            try:
-                conn = self._pool.get_nowait()
-                self._safe_close(conn)
-            except Empty:
-                break
-        
-        self._size = 0
+        for conn in idle:
+            self._safe_close(conn)
     
     @property
     def size(self) -> int:
@@ -179,7 +174,7 @@ class ConnectionPool:
     @property
     def available(self) -> int:
         """Available connections in pool."""
-        return self._pool.qsize()
+        return len(self._idle)
     
     def __enter__(self):
         return self
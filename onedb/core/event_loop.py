@@ -0,0 +1,31 @@
+"""
+Event loop selection for the async adapters.
+"""
+
+import asyncio
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Make new asyncio event loops use uvloop when it is installed.
+    
+    The async adapters run on whatever loop the application provides, so
+    this must be called before the loop starts (e.g. before
+    ``asyncio.run``); a loop that is already running is not replaced.
+    
+    Usage:
+        from onedb.core.event_loop import install_fast_event_loop
+        
+        install_fast_event_loop()
+        asyncio.run(main())
+    
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
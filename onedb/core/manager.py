@@ -4,6 +4,8 @@ Auto-detects database type and creates appropriate adapter.
 """
 
 from typing import Any, Dict, Optional, Type, Union
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlparse, parse_qs
 import re
 
@@ -14,6 +16,122 @@ from ..exceptions import AdapterNotFoundError, DriverNotInstalledError
 # Adapter registry
 _ADAPTERS: Dict[str, Type[BaseAdapter]] = {}
 
+# URI scheme to adapter name
+_SCHEME_MAP = MappingProxyType({
+    # PostgreSQL
+    "postgresql": "postgresql",
+    "postgres": "postgresql",
+    "pg": "postgresql",
+    
+    # MySQL
+    "mysql": "mysql",
+    "mysql+pymysql": "mysql",
+    
+    # MariaDB  
+    "mariadb": "mariadb",
+    
+    # SQLite
+    "sqlite": "sqlite",
+    "sqlite3": "sqlite",
+    
+    # MongoDB
+    "mongodb": "mongodb",
+    "mongodb+srv": "mongodb",
+    
+    # Redis
+    "redis": "redis",
+    "rediss": "redis",
+    
+    # Microsoft SQL Server
+    "mssql": "mssql",
+    "mssql+pyodbc": "mssql",
+    "mssql+pymssql": "mssql",
+    
+    # Oracle
+    "oracle": "oracle",
+    "oracle+cx_oracle": "oracle",
+    
+    # Others
+    "elasticsearch": "elasticsearch",
+    "cassandra": "cassandra",
+    "dynamodb": "dynamodb",
+    "snowflake": "snowflake",
+    "bigquery": "bigquery",
+    "neo4j": "neo4j",
+    "bolt": "neo4j",  # Neo4j protocol
+    "db2": "db2",
+    "ibm_db": "db2",
+})
+
+_SUPPORTED_DBS = tuple(sorted(set(_SCHEME_MAP.values())))
+
+# Adapter name to (module, class)
+_ADAPTER_IMPORTS = MappingProxyType({
+    "postgresql": ("onedb.adapters.postgresql", "PostgreSQL"),
+    "mysql": ("onedb.adapters.mysql", "MySQL"),
+    "mariadb": ("onedb.adapters.mariadb", "MariaDB"),
+    "sqlite": ("onedb.adapters.sqlite", "SQLite"),
+    "mongodb": ("onedb.adapters.mongodb", "MongoDB"),
+    "redis": ("onedb.adapters.redis_db", "Redis"),
+    "mssql": ("onedb.adapters.mssql", "MSSQL"),
+    "oracle": ("onedb.adapters.oracle", "Oracle"),
+    "elasticsearch": ("onedb.adapters.elasticsearch_db", "Elasticsearch"),
+    "cassandra": ("onedb.adapters.cassandra_db", "Cassandra"),
+    "dynamodb": ("onedb.adapters.dynamodb", "DynamoDB"),
+    "snowflake": ("onedb.adapters.snowflake_db", "Snowflake"),
+    "bigquery": ("onedb.adapters.bigquery", "BigQuery"),
+    "neo4j": ("onedb.adapters.neo4j_db", "Neo4j"),
+    "db2": ("onedb.adapters.db2", "DB2"),
+})
+
+_INSTALL_COMMANDS = MappingProxyType({
+    "postgresql": "pip install onedb[postgresql]",
+    "mysql": "pip install onedb[mysql]",
+    "mongodb": "pip install onedb[mongodb]",
+    "redis": "pip install onedb[redis]",
+    "oracle": "pip install onedb[oracle]",
+    "mssql": "pip install onedb[mssql]",
+    "elasticsearch": "pip install onedb[elasticsearch]",
+    "cassandra": "pip install onedb[cassandra]",
+    "dynamodb": "pip install onedb[dynamodb]",
+    "snowflake": "pip install onedb[snowflake]",
+    "bigquery": "pip install onedb[bigquery]",
+    "neo4j": "pip install onedb[neo4j]",
+    "db2": "pip install onedb[db2]",
+})
+
+# scheme://host[:port][/path][?query] without userinfo, brackets or fragment;
+# anything else goes through urlparse
+_FAST_URI_RE = re.compile(r"([A-Za-z][A-Za-z0-9+._-]*)://([^/?#@\[\]]*)(/[^?#]*)?(?:\?([^#]*))?")
+
+
+def _split_uri(uri: str) -> tuple:
+    """Split a connection URI into (scheme, host, port, path, user, password, query)."""
+    match = _FAST_URI_RE.fullmatch(uri)
+    if match:
+        scheme, netloc, path, query = match.groups()
+        host, _, port = netloc.partition(":")
+        return (
+            scheme.lower(),
+            host.lower() or None,
+            int(port) if port else None,
+            path,
+            None,
+            None,
+            query,
+        )
+    
+    parsed = urlparse(uri)
+    return (
+        parsed.scheme.lower(),
+        parsed.hostname,
+        parsed.port,
+        parsed.path,
+        parsed.username,
+        parsed.password,
+        parsed.query,
+    )
+
 
 def register_adapter(name: str):
     """Decorator to register adapter class."""
@@ -125,52 +243,8 @@ class Database:
         db = PostgreSQL(host="localhost", database="mydb")
     """
     
-    # URI scheme to adapter mapping
-    SCHEME_MAP = {
-        # PostgreSQL
-        "postgresql": "postgresql",
-        "postgres": "postgresql",
-        "pg": "postgresql",
-        
-        # MySQL
-        "mysql": "mysql",
-        "mysql+pymysql": "mysql",
-        
-        # MariaDB  
-        "mariadb": "mariadb",
-        
-        # SQLite
-        "sqlite": "sqlite",
-        "sqlite3": "sqlite",
-        
-        # MongoDB
-        "mongodb": "mongodb",
-        "mongodb+srv": "mongodb",
-        
-        # Redis
-        "redis": "redis",
-        "rediss": "redis",
-        
-        # Microsoft SQL Server
-        "mssql": "mssql",
-        "mssql+pyodbc": "mssql",
-        "mssql+pymssql": "mssql",
-        
-        # Oracle
-        "oracle": "oracle",
-        "oracle+cx_oracle": "oracle",
-        
-        # Others
-        "elasticsearch": "elasticsearch",
-        "cassandra": "cassandra",
-        "dynamodb": "dynamodb",
-        "snowflake": "snowflake",
-        "bigquery": "bigquery",
-        "neo4j": "neo4j",
-        "bolt": "neo4j",  # Neo4j protocol
-        "db2": "db2",
-        "ibm_db": "db2",
-    }
+    # URI scheme to adapter mapping (read-only)
+    SCHEME_MAP = _SCHEME_MAP
     
     @classmethod
     def connect(
@@ -223,26 +297,25 @@ class Database:
         if uri.startswith("sqlite"):
             return cls._connect_sqlite(uri)
         
-        parsed = urlparse(uri)
-        scheme = parsed.scheme.lower()
+        scheme, host, port, path, user, password, query = _split_uri(uri)
         
         # Get adapter name
-        adapter_name = cls.SCHEME_MAP.get(scheme)
+        adapter_name = _SCHEME_MAP.get(scheme)
         if not adapter_name:
             raise AdapterNotFoundError(scheme)
         
         # Parse connection parameters
         config = ConnectionConfig(
-            host=parsed.hostname or "localhost",
-            port=parsed.port,
-            database=parsed.path.lstrip("/") if parsed.path else None,
-            user=parsed.username,
-            password=parsed.password,
+            host=host or "localhost",
+            port=port,
+            database=path.lstrip("/") if path else None,
+            user=user,
+            password=password,
         )
         
         # Parse query parameters
-        if parsed.query:
-            query_params = parse_qs(parsed.query)
+        if query:
+            query_params = parse_qs(query)
             for key, values in query_params.items():
                 value = values[0] if len(values) == 1 else values
                 if key == "ssl":
@@ -278,60 +351,31 @@ class Database:
         
         return adapter
     
-    @classmethod
-    def _load_adapter(cls, name: str) -> Type[BaseAdapter]:
-        """Load adapter class."""
-        # Import mapping
-        import_map = {
-            "postgresql": ("onedb.adapters.postgresql", "PostgreSQL"),
-            "mysql": ("onedb.adapters.mysql", "MySQL"),
-            "mariadb": ("onedb.adapters.mariadb", "MariaDB"),
-            "sqlite": ("onedb.adapters.sqlite", "SQLite"),
-            "mongodb": ("onedb.adapters.mongodb", "MongoDB"),
-            "redis": ("onedb.adapters.redis_db", "Redis"),
-            "mssql": ("onedb.adapters.mssql", "MSSQL"),
-            "oracle": ("onedb.adapters.oracle", "Oracle"),
-            "elasticsearch": ("onedb.adapters.elasticsearch_db", "Elasticsearch"),
-            "cassandra": ("onedb.adapters.cassandra_db", "Cassandra"),
-            "dynamodb": ("onedb.adapters.dynamodb", "DynamoDB"),
-            "snowflake": ("onedb.adapters.snowflake_db", "Snowflake"),
-            "bigquery": ("onedb.adapters.bigquery", "BigQuery"),
-            "neo4j": ("onedb.adapters.neo4j_db", "Neo4j"),
-            "db2": ("onedb.adapters.db2", "DB2"),
-        }
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _load_adapter(name: str) -> Type[BaseAdapter]:
+        """
+        Load adapter class.
         
-        if name not in import_map:
+        Successful loads are cached; failures are not, so a driver
+        installed later in the process is picked up on the next call.
+        """
+        if name not in _ADAPTER_IMPORTS:
             raise AdapterNotFoundError(name)
         
-        module_path, class_name = import_map[name]
+        module_path, class_name = _ADAPTER_IMPORTS[name]
         
         try:
             import importlib
             module = importlib.import_module(module_path)
             return getattr(module, class_name)
         except ImportError as e:
-            # Determine install command
-            install_cmds = {
-                "postgresql": "pip install onedb[postgresql]",
-                "mysql": "pip install onedb[mysql]",
-                "mongodb": "pip install onedb[mongodb]",
-                "redis": "pip install onedb[redis]",
-                "oracle": "pip install onedb[oracle]",
-                "mssql": "pip install onedb[mssql]",
-                "elasticsearch": "pip install onedb[elasticsearch]",
-                "cassandra": "pip install onedb[cassandra]",
-                "dynamodb": "pip install onedb[dynamodb]",
-                "snowflake": "pip install onedb[snowflake]",
-                "bigquery": "pip install onedb[bigquery]",
-                "neo4j": "pip install onedb[neo4j]",
-                "db2": "pip install onedb[db2]",
-            }
             raise DriverNotInstalledError(
                 name, 
-                install_cmds.get(name, f"pip install onedb[{name}]")
+                _INSTALL_COMMANDS.get(name, f"pip install onedb[{name}]")
             ) from e
     
     @classmethod
     def supported_databases(cls) -> list:
         """Get list of supported databases."""
-        return list(set(cls.SCHEME_MAP.values()))
+        return list(_SUPPORTED_DBS)
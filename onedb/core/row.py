@@ -0,0 +1,94 @@
+"""
+Lightweight result rows.
+Tuple-backed, read-only mappings sharing one column index per result set.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Type
+from collections.abc import Mapping
+from functools import lru_cache
+from operator import itemgetter
+
+
+class Row(Mapping):
+    """
+    Read-only mapping over a row tuple.
+    
+    Subclasses made by ``row_class`` carry the ``{column: index}`` map, so
+    each row holds only a reference to the driver's tuple instead of its
+    own dict. Rows compare equal to dicts with the same items and pickle
+    (and copy) by column names and values.
+    
+    Rows are read-only and are not ``dict`` instances, so ``json.dumps``
+    and code that mutates rows need ``to_dict()`` (or ``dict(row)``).
+    
+    Usage:
+        Row_ = row_class(("id", "name"))
+        row = Row_((1, "John"))
+        row["name"]   # "John"
+        dict(row)     # {"id": 1, "name": "John"}
+    """
+    
+    __slots__ = ("_v",)
+    
+    _cols: Dict[str, int] = {}
+    
+    def __init__(self, values: Sequence[Any]):
+        self._v = values
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._v[self._cols[key]]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cols)
+    
+    def __len__(self) -> int:
+        return len(self._cols)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._cols
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._cols.get(key)
+        return default if index is None else self._v[index]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy into a plain dict."""
+        return dict(zip(self._cols, self._v))
+    
+    def __reduce__(self):
+        # The row classes are built at runtime, so rebuild through row_class
+        return _rebuild_row, (tuple(self._cols), tuple(self._v))
+    
+    def __repr__(self) -> str:
+        return f"Row({self.to_dict()!r})"
+
+
+@lru_cache(maxsize=256)
+def row_class(columns: tuple) -> Type[Row]:
+    """Row subclass bound to ``columns``; cached per column tuple."""
+    return type("Row", (Row,), {
+        "__slots__": (),
+        "_cols": {column: index for index, column in enumerate(columns)},
+    })
+
+
+def _rebuild_row(columns: tuple, values: tuple) -> Row:
+    return row_class(columns)(values)
+
+
+@lru_cache(maxsize=256)
+def tuple_getter(columns: tuple) -> Callable[[Mapping], tuple]:
+    """``itemgetter`` returning a tuple of ``columns`` even for one column."""
+    if len(columns) == 1:
+        column = columns[0]
+        return lambda row: (row[column],)
+    return itemgetter(*columns)
+
+
+def rows_to_tuples(data: Sequence[Mapping], columns: tuple) -> List[tuple]:
+    """Parameter tuples for ``columns``; keys missing from a row become None."""
+    get = tuple_getter(columns)
+    try:
+        return [get(row) for row in data]
+    except KeyError:
+        return [tuple([row.get(col) for col in columns]) for row in data]
@@ -0,0 +1,112 @@
+"""
+Tests for the opt-in query result cache on BaseAdapter, using SQLite.
+"""
+
+import pytest
+
+from onedb.core import base
+from onedb.core.base import QueryResult
+from onedb.adapters.sqlite import SQLite
+
+
+QUERY = "SELECT a, b FROM t WHERE a = ?"
+
+
+@pytest.fixture
+def db():
+    adapter = SQLite(extra={"query_cache_size": "8"})
+    adapter.connect()
+    adapter.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    adapter.insert("t", {"a": 1, "b": "x"})
+    yield adapter
+    adapter.disconnect()
+
+
+def test_repeated_read_is_served_from_cache(db):
+    assert db.fetch_all(QUERY, (1,)) == [{"a": 1, "b": "x"}]
+    # A raw write bypasses invalidation, so a cache hit still sees the old row
+    db.execute("UPDATE t SET b = 'y'")
+    assert db.fetch_one(QUERY, (1,)) == {"a": 1, "b": "x"}
+    db.clear_query_cache()
+    assert db.fetch_one(QUERY, (1,)) == {"a": 1, "b": "y"}
+
+
+def test_params_are_part_of_the_key(db):
+    db.insert("t", {"a": 2, "b": "z"})
+    assert db.fetch_scalar("SELECT b FROM t WHERE a = ?", (1,)) == "x"
+    assert db.fetch_scalar("SELECT b FROM t WHERE a = ?", (2,)) == "z"
+
+
+def test_crud_writes_invalidate(db):
+    db.fetch_all(QUERY, (1,))
+    db.update("t", {"b": "y"}, {"a": 1})
+    assert db.fetch_one(QUERY, (1,)) == {"a": 1, "b": "y"}
+    
+    db.find("t", {"a": 1})
+    db.insert_many("t", [{"a": 1, "b": "w"}])
+    assert len(db.find("t", {"a": 1})) == 2
+    
+    db.delete("t", {"a": 1})
+    assert db.fetch_all(QUERY, (1,)) == []
+
+
+def test_ttl_expires_entries(monkeypatch):
+    adapter = SQLite(extra={"query_cache_size": 8, "query_cache_ttl": "10"})
+    adapter.connect()
+    adapter.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    adapter.insert("t", {"a": 1, "b": "x"})
+    
+    now = [1000.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: now[0])
+    adapter.fetch_all(QUERY, (1,))
+    adapter.execute("UPDATE t SET b = 'y'")
+    
+    now[0] += 5
+    assert adapter.fetch_one(QUERY, (1,))["b"] == "x"
+    now[0] += 10
+    assert adapter.fetch_one(QUERY, (1,))["b"] == "y"
+
+
+def test_returned_rows_do_not_alias_the_cache(db):
+    db.fetch_all(QUERY, (1,))
+    row = db.fetch_one(QUERY, (1,))
+    row["b"] = "mutated"
+    db.fetch_all(QUERY, (1,)).append({"a": 9})
+    assert db.fetch_all(QUERY, (1,)) == [{"a": 1, "b": "x"}]
+
+
+def test_lru_evicts_oldest():
+    adapter = SQLite(extra={"query_cache_size": 2})
+    adapter.connect()
+    adapter.execute("CREATE TABLE t (a INTEGER, b TEXT)")
+    for a in (1, 2, 3):
+        adapter.fetch_all(QUERY, (a,))
+    assert len(adapter._query_cache) == 2
+    assert [key[1] for key in adapter._query_cache] == [(2,), (3,)]
+
+
+def test_not_cached_in_transaction_or_for_writes(db):
+    with db.transaction():
+        db.fetch_all(QUERY, (1,))
+    db.fetch_scalar("SELECT 1")
+    assert len(db._query_cache) == 0
+
+
+def test_copy_result_keeps_every_field():
+    result = QueryResult(
+        data=[{"id": 1}], affected_rows=1, last_id=7,
+        columns=["id"], execution_time=1.5, aggregations={"n": 1},
+    )
+    copy = SQLite._copy_result(result)
+    assert copy == result
+    assert copy.data[0] is not result.data[0]
+    
+    columnar = QueryResult.from_columns(["id"], [[1, 2]], last_id=3)
+    copy = SQLite._copy_result(columnar)
+    assert list(copy) == list(columnar) and copy.last_id == 3
+    assert copy.column("id") is not columnar.column("id")
+
+
+def test_cache_options_are_not_passed_to_drivers():
+    adapter = SQLite(extra={"query_cache_size": 8, "stmt_cache_size": 4, "sslrootcert": "ca"})
+    assert adapter._driver_extra() == {"sslrootcert": "ca"}